@@ -0,0 +1,11 @@
+"""
+Benchmark scripts; run from the repository root, e.g.:
+
+    python -m benchmarks.bench_parallel --fake 10000
+
+Suite with percentiles, allocations and baselines (see run.py):
+
+    python -m benchmarks.run --quick
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json
+"""
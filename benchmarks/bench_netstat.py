@@ -0,0 +1,69 @@
+"""
+Connection-table cost: psutil.net_connections versus the streaming reader.
+
+    python -m benchmarks.bench_netstat                  # live system
+    python -m benchmarks.bench_netstat --fake 200000    # synthetic /proc/net tables
+"""
+import argparse
+import shutil
+import statistics
+import time
+import tracemalloc
+
+import psutil
+
+from engine.netstat import NetstatReader
+
+from .fixtures import make_fake_net
+
+
+def _measure(fn, repeat: int):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), peak
+
+
+def run(root: str, repeat: int, limit: int, live: bool):
+    reader = NetstatReader(root=root)
+    cases = [
+        (f"stream limit={limit}", lambda: reader.connections("inet", limit=limit)),
+        ("stream all", lambda: reader.connections("inet")),
+        ("count by status", lambda: reader.count("inet", "status")),
+        ("count by lport", lambda: reader.count("inet", "lport")),
+        ("count by raddr", lambda: reader.count("inet", "raddr")),
+    ]
+    if live:
+        cases.insert(0, ("psutil.net_connections", lambda: psutil.net_connections("inet")[:limit]))
+    print(f"root={root} repeat={repeat}")
+    print(f"{'case':<26} {'p50 ms':>10} {'peak KiB':>10}")
+    for name, fn in cases:
+        p50, peak = _measure(fn, repeat)
+        print(f"{name:<26} {p50 * 1e3:>10.2f} {peak / 1024:>10.1f}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--limit", type=int, default=100)
+    ap.add_argument("--fake", type=int, metavar="N", help="use a synthetic table with N sockets")
+    args = ap.parse_args(argv)
+
+    if args.fake:
+        root = make_fake_net(args.fake)
+        try:
+            run(root, args.repeat, args.limit, live=False)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+    else:
+        run("/proc", args.repeat, args.limit, live=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Recording cost at 1 Hz: bytes and milliseconds per tick for a process table
+plus the engine collectors, and the cost of replaying a tick.
+
+    python -m benchmarks.bench_record                      # 2000 processes, 10% change per tick
+    python -m benchmarks.bench_record --procs 10000 --churn 0.3
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+import psutil
+
+from engine.procfs import ProcfsReader
+from engine.record import Recorder, RecordingLog, call_key
+
+from .fixtures import make_fake_proc
+
+ATTRS = ["pid", "name", "username", "cpu_percent", "memory_percent", "ppid", "status",
+         "nice", "num_threads", "create_time", "cmdline"]
+
+
+def _collectors():
+    return [
+        ("cpu", "get_percent", (), {"percpu": True}, lambda: psutil.cpu_percent(percpu=True)),
+        ("memory", "get_virtual", (), {}, psutil.virtual_memory),
+        ("memory", "get_swap", (), {}, psutil.swap_memory),
+        ("disk", "get_io_counters", (), {"perdisk": True, "nowrap": False}, lambda: psutil.disk_io_counters(perdisk=True)),
+        ("network", "get_io_counters", (), {"pernic": True, "nowrap": True}, lambda: psutil.net_io_counters(pernic=True)),
+    ]
+
+
+def run(procs: int, ticks: int, churn: float, seed: int = 0):
+    rnd = random.Random(seed)
+    root = make_fake_proc(procs, seed=seed)
+    tmp = tempfile.mkdtemp(prefix="bench-record-")
+    try:
+        rows = ProcfsReader(root=root).read(ATTRS)
+        collectors = _collectors()
+        values = [(src, m, a, kw, fn()) for src, m, a, kw, fn in collectors]
+        path = os.path.join(tmp, "bench.rec")
+        rec = Recorder(path, clock=iter(range(10**9)).__next__)
+        times = []
+        for _ in range(ticks):
+            # satırların bir kısmı değişir (cpu_percent / num_threads)
+            rows = [dict(r, cpu_percent=round(rnd.random() * 100, 1), num_threads=rnd.randint(1, 64))
+                    if rnd.random() < churn else r for r in rows]
+            t0 = time.perf_counter()
+            rec.record("processes", "read", (ATTRS,), {}, rows)
+            for src, m, a, kw, v in values:
+                rec.record(src, m, a, kw, v)
+            times.append(time.perf_counter() - t0)
+        rec.close()
+        size = os.path.getsize(path) + os.path.getsize(path + ".idx")
+
+        log = RecordingLog(path)
+        key = call_key("processes", "read", (ATTRS,), {})
+        series = log.series(key)
+        t0 = time.perf_counter()
+        for ts in series:
+            log.at(key, ts)
+        seq = (time.perf_counter() - t0) / len(series)
+        picks = [rnd.choice(series) for _ in range(20)]
+        t0 = time.perf_counter()
+        for ts in picks:
+            log._last.clear()
+            log.at(key, ts)
+        seek = (time.perf_counter() - t0) / len(picks)
+        log.close()
+
+        plain = sum(len(repr(r)) for r in rows)
+        print(f"procs={procs} ticks={ticks} churn={churn:.0%}")
+        print(f"record p50 {statistics.median(times) * 1e3:.2f} ms/tick, "
+              f"max {max(times) * 1e3:.2f} ms")
+        print(f"log {size / ticks / 1024:.1f} KiB/tick ({size / 1024**2:.1f} MiB total, "
+              f"repr of one table {plain / 1024:.0f} KiB) -> {size / ticks * 86400 / 1024**3:.2f} GiB/day at 1 Hz")
+        print(f"replay sequential {seq * 1e3:.2f} ms/tick, random seek {seek * 1e3:.2f} ms")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--procs", type=int, default=2000)
+    ap.add_argument("--ticks", type=int, default=120)
+    ap.add_argument("--churn", type=float, default=0.1, help="fraction of rows that change per tick")
+    args = ap.parse_args(argv)
+    run(args.procs, args.ticks, args.churn)
+
+
+if __name__ == "__main__":
+    main()
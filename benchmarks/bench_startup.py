@@ -0,0 +1,85 @@
+"""
+Import-time and first-sample latency, each measured in a fresh interpreter.
+
+    python -m benchmarks.bench_startup --repeat 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# her senaryo alt süreçte çalışır ve ölçümleri JSON olarak basar
+SCENARIOS = {
+    "import bridge": """
+t0 = time.perf_counter()
+import bridge
+out["import"] = time.perf_counter() - t0
+""",
+    "bridge.getvirt (first call)": """
+t0 = time.perf_counter()
+import bridge
+t1 = time.perf_counter()
+bridge.getvirt()
+out["import"] = t1 - t0
+out["first_sample"] = time.perf_counter() - t1
+""",
+    "bridge.cpu_percent (first call)": """
+t0 = time.perf_counter()
+import bridge
+t1 = time.perf_counter()
+bridge.cpu_percent()
+out["import"] = t1 - t0
+out["first_sample"] = time.perf_counter() - t1
+""",
+    "ProcessManager.start(warmup=0)": """
+t0 = time.perf_counter()
+from engine import ProcessManager
+t1 = time.perf_counter()
+pm = ProcessManager(interval=1.0)
+pm.start(wait=False, warmup=0)
+pm.wait_for_newer(0, timeout=10)
+out["import"] = t1 - t0
+out["first_snapshot"] = time.perf_counter() - t1
+pm.stop()
+""",
+    "ProcessManager.start(wait=False)": """
+t0 = time.perf_counter()
+from engine import ProcessManager
+t1 = time.perf_counter()
+pm = ProcessManager(interval=1.0)
+pm.start(wait=False)
+t2 = time.perf_counter()
+pm.wait_for_newer(0, timeout=10)
+out["import"] = t1 - t0
+out["start_returns"] = t2 - t1
+out["first_snapshot"] = time.perf_counter() - t1
+pm.stop()
+""",
+}
+
+
+def _run_once(body: str) -> dict:
+    code = "import json, time\nout = {}\n" + body + "\nprint(json.dumps(out))\n"
+    res = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(res.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    print(f"{'scenario':<36} {'metric':<16} {'p50 ms':>9} {'max ms':>9}")
+    for name, body in SCENARIOS.items():
+        runs = [_run_once(body) for _ in range(args.repeat)]
+        for metric in runs[0]:
+            vals = [r[metric] for r in runs]
+            print(f"{name:<36} {metric:<16} {statistics.median(vals) * 1e3:>9.1f} {max(vals) * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
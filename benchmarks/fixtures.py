@@ -0,0 +1,89 @@
+# fixtures.py
+import os
+import random
+import tempfile
+from typing import Optional
+
+_USERS = (0, 1000, 1001, 33, 65534)
+_STATES = "RSSSSSDIZ"
+
+
+def make_fake_proc(n: int, root: Optional[str] = None, seed: int = 0) -> str:
+    """
+    Write a /proc-like tree with n pids (stat, statm, status, cmdline) that
+    ProcfsReader(root=...) can read. Returns the root directory.
+    """
+    rnd = random.Random(seed)
+    root = root or tempfile.mkdtemp(prefix="fakeproc-")
+    with open(os.path.join(root, "stat"), "w") as f:
+        f.write("cpu  1 2 3 4 5 6 7 8 9 10\nbtime 1700000000\n")
+    with open(os.path.join(root, "meminfo"), "w") as f:
+        f.write("MemTotal:       32768000 kB\nMemFree:        16384000 kB\n")
+    os.makedirs(os.path.join(root, "self"), exist_ok=True)
+    open(os.path.join(root, "self", "stat"), "w").close()
+
+    for pid in range(1, n + 1):
+        d = os.path.join(root, str(pid))
+        os.makedirs(d, exist_ok=True)
+        name = f"worker-{pid % 97}"
+        ppid = 0 if pid == 1 else rnd.randint(1, max(1, pid - 1))
+        utime, stime = rnd.randint(0, 10**6), rnd.randint(0, 10**5)
+        nice = rnd.choice((0, 0, 0, 5, -5, 19))
+        threads = rnd.randint(1, 64)
+        start = rnd.randint(100, 10**7)
+        rss = rnd.randint(100, 500000)
+        stat = (
+            f"{pid} ({name}) {rnd.choice(_STATES)} {ppid} {pid} {pid} 0 -1 4194304 "
+            f"100 0 0 0 {utime} {stime} 0 0 20 {nice} {threads} 0 {start} "
+            f"{rss * 8192} {rss} 18446744073709551615 0 0 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n"
+        )
+        with open(os.path.join(d, "stat"), "w") as f:
+            f.write(stat)
+        with open(os.path.join(d, "statm"), "w") as f:
+            f.write(f"{rss * 2} {rss} {rss // 4} 10 0 {rss} 0\n")
+        uid = rnd.choice(_USERS)
+        with open(os.path.join(d, "status"), "w") as f:
+            f.write(
+                f"Name:\t{name}\nState:\tS (sleeping)\nTgid:\t{pid}\nPid:\t{pid}\nPPid:\t{ppid}\n"
+                f"Uid:\t{uid}\t{uid}\t{uid}\t{uid}\nGid:\t{uid}\t{uid}\t{uid}\t{uid}\n"
+                f"Threads:\t{threads}\n"
+            )
+        with open(os.path.join(d, "cmdline"), "wb") as f:
+            f.write(f"/usr/bin/{name}\x00--id\x00{pid}\x00".encode())
+    return root
+
+
+def _hex_v4(rnd: random.Random) -> str:
+    return "%08X" % rnd.randint(1, 0xFFFFFFFF)
+
+
+def make_fake_net(n: int, root: Optional[str] = None, seed: int = 0) -> str:
+    """
+    Write /proc/net/{tcp,tcp6,udp,udp6} with n sockets in total (mostly tcp)
+    for NetstatReader(root=...). Returns the root directory.
+    """
+    rnd = random.Random(seed)
+    root = root or tempfile.mkdtemp(prefix="fakenet-")
+    os.makedirs(os.path.join(root, "net"), exist_ok=True)
+    header = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n"
+    share = {"tcp": 0.7, "tcp6": 0.2, "udp": 0.07, "udp6": 0.03}
+    inode = 10000
+    for proto, frac in share.items():
+        v6 = proto.endswith("6")
+        with open(os.path.join(root, "net", proto), "w") as f:
+            f.write(header)
+            for i in range(int(n * frac)):
+                lip = ("0000000000000000FFFF0000" + _hex_v4(rnd)) if v6 else _hex_v4(rnd)
+                rip = ("0000000000000000FFFF0000" + _hex_v4(rnd)) if v6 else _hex_v4(rnd)
+                lport = rnd.choice((80, 443, 8080)) if i % 3 else rnd.randint(1024, 65535)
+                if proto.startswith("tcp"):
+                    st = rnd.choice(("01", "01", "01", "06", "08", "0A"))
+                    rport = 0 if st == "0A" else rnd.randint(1024, 65535)
+                else:
+                    st, rport = "07", 0
+                inode += 1
+                f.write(
+                    f"{i:>4}: {lip}:{lport:04X} {rip}:{rport:04X} {st} 00000000:00000000 "
+                    f"00:00000000 00000000  {rnd.choice(_USERS):>5}        0 {inode} 1 0000000000000000 100 0 0 10 0\n"
+                )
+    return root
@@ -0,0 +1,186 @@
+# harness.py
+"""
+Small timing harness for the benchmark suite: latency percentiles, one
+tracemalloc pass per case for allocations, JSON baselines and regression checks.
+"""
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+class Case(NamedTuple):
+    name: str                                   # "group/case", ör. "clean/getvirt"
+    fn: Callable[[], Any]
+    setup: Optional[Callable[[], Any]] = None   # her ölçümden önce, süreye katılmaz
+    repeat: Optional[int] = None                # None -> Runner.repeat
+    number: int = 1                             # ölçüm başına çağrı (çok hızlı işler için)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Linear-interpolated percentile of an already sorted list (q in 0..100)."""
+    if not sorted_values:
+        return math.nan
+    k = (len(sorted_values) - 1) * q / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def measure(case: Case, repeat: int, warmup: int = 1, max_time: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Time case.fn `repeat` times (seconds per call), then run it once more
+    under tracemalloc. Stops early once max_time seconds were spent timing.
+    """
+    for _ in range(warmup):
+        if case.setup:
+            case.setup()
+        case.fn()
+    times: List[float] = []
+    spent = 0.0
+    number = case.number
+    gc_was = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(case.repeat or repeat):
+            if case.setup:
+                case.setup()
+            t0 = time.perf_counter()
+            for _ in range(number):
+                case.fn()
+            dt = time.perf_counter() - t0
+            times.append(dt / number)
+            spent += dt
+            if max_time is not None and spent >= max_time and len(times) >= 3:
+                break
+    finally:
+        if gc_was:
+            gc.enable()
+
+    if case.setup:
+        case.setup()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        case.fn()
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    allocated = sum(s.size_diff for s in stats if s.size_diff > 0)
+    blocks = sum(s.count_diff for s in stats if s.count_diff > 0)
+
+    times.sort()
+    return {
+        "n": len(times),
+        "min": times[0],
+        "p50": percentile(times, 50),
+        "p90": percentile(times, 90),
+        "p99": percentile(times, 99),
+        "max": times[-1],
+        "mean": sum(times) / len(times),
+        "alloc_peak": peak,
+        "alloc_kept": allocated,
+        "alloc_blocks": blocks,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    import psutil
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": psutil.cpu_count(logical=True),
+        "psutil": psutil.__version__,
+        "ts": time.time(),
+    }
+
+
+# ---- baseline ----
+def save_baseline(path: str, results: Dict[str, Dict[str, Any]]) -> None:
+    with open(path, "w") as f:
+        json.dump({"env": environment(), "results": results}, f, indent=1, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float = 0.25, floor: float = 50e-6,
+            alloc_threshold: float = 0.5, alloc_floor: int = 64 * 1024) -> List[Dict[str, Any]]:
+    """
+    Cases whose p50 grew by more than `threshold` (relative) and `floor`
+    seconds, or whose allocation peak grew by more than `alloc_threshold`
+    and `alloc_floor` bytes. Improvements are reported with status "faster".
+    """
+    out = []
+    for name, r in results.items():
+        b = baseline.get(name)
+        if b is None:
+            continue
+        ratio = r["p50"] / b["p50"] if b["p50"] else math.inf
+        diff = r["p50"] - b["p50"]
+        status = "ok"
+        if ratio > 1 + threshold and diff > floor:
+            status = "slower"
+        elif ratio < 1 / (1 + threshold) and -diff > floor:
+            status = "faster"
+        peak, bpeak = r.get("alloc_peak", 0), b.get("alloc_peak", 0)
+        if status == "ok" and peak > bpeak * (1 + alloc_threshold) and peak - bpeak > alloc_floor:
+            status = "more memory"
+        out.append({"name": name, "status": status, "ratio": ratio, "p50": r["p50"], "base_p50": b["p50"],
+                    "alloc_peak": peak, "base_alloc_peak": bpeak})
+    return out
+
+
+# ---- çıktı ----
+def _ms(s: float) -> str:
+    if s < 1e-5:
+        return f"{s * 1e3:.5f}"
+    return f"{s * 1e3:.3f}" if s < 0.01 else f"{s * 1e3:.1f}"
+
+
+def header() -> str:
+    return f"{'case':<52} {'n':>4} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'peak KiB':>9} {'blocks':>7}"
+
+
+def row(name: str, r: Dict[str, Any]) -> str:
+    return (f"{name:<52} {r['n']:>4} {_ms(r['p50']):>9} {_ms(r['p90']):>9} {_ms(r['p99']):>9} "
+            f"{r['alloc_peak'] / 1024:>9.1f} {r['alloc_blocks']:>7}")
+
+
+class Runner:
+    """Runs cases in order, printing one line each; failures are reported, not raised."""
+
+    def __init__(self, repeat: int = 20, warmup: int = 1, max_time: Optional[float] = 2.0,
+                 match: Optional[Iterable[str]] = None, out=sys.stdout):
+        self.repeat = repeat
+        self.warmup = warmup
+        self.max_time = max_time
+        self.match = list(match or ())
+        self.out = out
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.errors: Dict[str, str] = {}
+
+    def wants(self, name: str) -> bool:
+        return not self.match or any(m in name for m in self.match)
+
+    def run(self, cases: Iterable[Case]) -> None:
+        for case in cases:
+            if not self.wants(case.name):
+                continue
+            try:
+                r = measure(case, self.repeat, self.warmup, self.max_time)
+            except Exception as e:
+                self.errors[case.name] = f"{type(e).__name__}: {e}"
+                print(f"{case.name:<52} ERROR {self.errors[case.name]}", file=self.out)
+                continue
+            self.results[case.name] = r
+            print(row(case.name, r), file=self.out, flush=True)
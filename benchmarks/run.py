@@ -0,0 +1,101 @@
+"""
+Benchmark suite for the collection and formatting hot paths.
+
+    python -m benchmarks.run                                # every suite, 1k/10k/50k processes
+    python -m benchmarks.run --suite parser clean --quick
+    python -m benchmarks.run --match take_snapshot --sizes 1000 10000
+    python -m benchmarks.run --save benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json   # exit 1 on regressions
+    python -m benchmarks.run --suite clean --replay incident.rec  # bridge calls over a recording
+
+Timings are seconds per call (p50/p90/p99 over --repeat runs); allocations
+come from one extra tracemalloc run per case.
+"""
+import argparse
+import json
+import sys
+
+from . import harness
+from .suites import PROCESS_SIZES, SUITES, clean_suite, parser_suite, process_suite
+
+
+def _cases(args):
+    for name in args.suite:
+        if name == "process":
+            yield from process_suite(args.sizes)
+        elif name == "clean":
+            yield from clean_suite(cold=not args.quick)
+        elif name == "parser":
+            yield from parser_suite(1000 if args.quick else 10000)
+
+
+def _report(rows, out=sys.stdout) -> int:
+    bad = [r for r in rows if r["status"] in ("slower", "more memory")]
+    good = [r for r in rows if r["status"] == "faster"]
+    for title, group in (("regressions", bad), ("improvements", good)):
+        if not group:
+            continue
+        print(f"\n{title}:", file=out)
+        for r in group:
+            print(f"  {r['name']:<52} {r['status']:<12} p50 {r['base_p50'] * 1e3:.3f} -> {r['p50'] * 1e3:.3f} ms "
+                  f"({r['ratio']:.2f}x), peak {r['base_alloc_peak'] / 1024:.0f} -> {r['alloc_peak'] / 1024:.0f} KiB",
+                  file=out)
+    print(f"\ncompared {len(rows)} cases: {len(bad)} regressions, {len(good)} improvements", file=out)
+    return len(bad)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--suite", nargs="+", choices=sorted(SUITES), default=["process", "clean", "parser"])
+    ap.add_argument("--match", nargs="+", help="only cases whose name contains one of these")
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(PROCESS_SIZES), help="process counts")
+    ap.add_argument("--quick", action="store_true", help="1k processes, fewer repeats, no cold variants")
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--max-time", type=float, default=2.0, help="timing budget per case in seconds")
+    ap.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    ap.add_argument("--compare", metavar="PATH", help="compare with a baseline; exit 1 on regressions")
+    ap.add_argument("--threshold", type=float, default=0.25, help="relative p50 growth that counts as a regression")
+    ap.add_argument("--json", metavar="PATH", help="write raw results")
+    ap.add_argument("--replay", metavar="PATH", help="serve bridge.clean from an engine recording")
+    args = ap.parse_args(argv)
+    if args.quick:
+        args.sizes = [s for s in args.sizes if s <= 1000] or [1000]
+        args.repeat = min(args.repeat, 5)
+        args.max_time = min(args.max_time, 0.5)
+
+    restore = None
+    if args.replay:
+        from bridge import clean
+        from engine.record import Player
+        player = Player.open(args.replay, speed=0)
+        player.step()
+        restore = clean.use_engine(**player.engine())
+
+    env = harness.environment()
+    print(f"python {env['python']} / psutil {env['psutil']} / {env['cpus']} cpus / {env['platform']}")
+    print(harness.header())
+    runner = harness.Runner(args.repeat, max_time=args.max_time, match=args.match)
+    try:
+        runner.run(_cases(args))
+    finally:
+        if restore is not None:
+            from bridge import clean
+            clean.use_engine(**restore)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"env": env, "results": runner.results, "errors": runner.errors}, f, indent=1)
+    if args.save:
+        harness.save_baseline(args.save, runner.results)
+        print(f"\nbaseline written to {args.save} ({len(runner.results)} cases)")
+    status = 1 if runner.errors else 0
+    if runner.errors:
+        print(f"\n{len(runner.errors)} case(s) failed: {', '.join(runner.errors)}")
+    if args.compare:
+        if _report(harness.compare(runner.results, harness.load_baseline(args.compare), args.threshold)):
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
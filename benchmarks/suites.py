@@ -0,0 +1,183 @@
+# suites.py
+"""
+Benchmark cases, grouped by hot path. Every suite is a generator of Cases so
+expensive fixtures (synthetic /proc trees) are built only when the suite runs
+and removed afterwards.
+"""
+import os
+import random
+import shutil
+from typing import Iterator, Sequence
+
+import psutil
+
+from engine import ProcessManager, ProcfsReader
+
+from .fixtures import make_fake_proc
+from .harness import Case
+
+PROCESS_SIZES = (1000, 10000, 50000)
+
+
+# ---- ProcessManager ----
+def _drop_views(pm: ProcessManager) -> None:
+    """Forget the snapshot's columnar view and tree so they are rebuilt (cold query)."""
+    snap = pm.snapshot()
+    snap._columns = None
+    snap._tree = None
+
+
+def process_suite(sizes: Sequence[int] = PROCESS_SIZES, seed: int = 0) -> Iterator[Case]:
+    from bridge.parser import SimpleParse
+
+    formatters = ProcessManager.default_formatters(SimpleParse())
+    for n in sizes:
+        root = make_fake_proc(n, seed=seed)
+        try:
+            pm = ProcessManager(reader=ProcfsReader(ad_value="-", root=root))
+            pm._take_snapshot()  # cmdline/username gibi static alanlar ilk tikte okunur
+            tag = f"[{n}]"
+            yield Case(f"process/take_snapshot{tag}", pm._take_snapshot, repeat=10 if n >= 10000 else None)
+
+            cold = lambda pm=pm: _drop_views(pm)
+            yield Case(f"process/columns_build{tag}", lambda pm=pm: pm.get_columns(), setup=cold)
+            yield Case(f"process/tree_build{tag}", lambda pm=pm: pm.get_tree(), setup=cold)
+            yield Case(f"process/sort_processes(cpu_percent){tag}", lambda pm=pm: pm.sort_processes("cpu_percent"), setup=cold)
+            yield Case(f"process/sort_processes(name, asc){tag}", lambda pm=pm: pm.sort_processes("name", reverse=False), setup=cold)
+            yield Case(f"process/sort_processes(cpu_percent) warm{tag}", lambda pm=pm: pm.sort_processes("cpu_percent"))
+            yield Case(f"process/filter_by_user{tag}", lambda pm=pm: pm.filter_by_user("root"))
+            for limit in (10, 100, None):
+                yield Case(f"process/call(limit={limit}){tag}", lambda pm=pm, limit=limit: pm(limit=limit))
+            yield Case(f"process/call(fields=3, limit=50){tag}",
+                       lambda pm=pm: pm(limit=50, fields=["pid", "name", "cpu_percent"]))
+            yield Case(f"process/call(sort_by=memory_percent, user){tag}",
+                       lambda pm=pm: pm(sort_by="memory_percent", user="root", limit=100))
+            yield Case(f"process/call(formatters, limit=100){tag}",
+                       lambda pm=pm: pm(limit=100, formatters=formatters))
+            yield Case(f"process/call(formatters, all){tag}",
+                       lambda pm=pm: pm(formatters=formatters), repeat=10 if n >= 10000 else None)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+# ---- bridge.clean ----
+def clean_suite(cold: bool = True) -> Iterator[Case]:
+    """
+    Every public bridge.clean call against whatever engine objects are
+    installed (live by default, a recording after use_engine()). Sampler-backed
+    calls are also measured cold (cache dropped before each call). History
+    calls write to a scratch History that is swapped out again afterwards.
+    """
+    from bridge import clean
+    from bridge.exporter import Exporter
+    from engine.history import History
+
+    me = os.getpid()
+    pids = sorted(psutil.pids())[:8]
+    reset = clean.sampler.reset
+    saved = clean.history
+    clean.history = clean._recorder.history = History()
+    clean.history.append("bench.series", 0.0, 1.0)
+    exp = Exporter(top_n=0)
+
+    def case(name, fn, sampled=False, **kw):
+        yield Case(f"clean/{name}", fn, **kw)
+        if cold and sampled:
+            yield Case(f"clean/{name} cold", fn, setup=reset, **kw)
+
+    try:
+        yield from case("cpu_times(cpu_times)", lambda: clean.cpu_times(psutil.cpu_times))
+        yield from case("cpu_times(cpu_times_percent, percpu)", lambda: clean.cpu_times(psutil.cpu_times_percent, percpu=True))
+        yield from case("cpu_percent", lambda: clean.cpu_percent(), sampled=True)
+        yield from case("cpu_percent(percpu)", lambda: clean.cpu_percent(percpu=True), sampled=True)
+        yield from case("get_stat", clean.get_stat)
+        yield from case("cpu_freq", clean.cpu_freq)
+        yield from case("cpu_freq(percpu)", lambda: clean.cpu_freq(True))
+        yield from case("getloadavg", lambda: clean.getloadavg(psutil.cpu_count() or 1))
+        yield from case("disk_io", lambda: clean.disk_io(), sampled=True)
+        yield from case("disk_io(perdisk, rates)", lambda: clean.disk_io(True, rates=True))
+        yield from case("disk_io(raw)", lambda: clean.disk_io(raw=True), sampled=True)
+        yield from case("diskusage", lambda: clean.diskusage(), sampled=True)
+        yield from case("diskusage(raw)", lambda: clean.diskusage(raw=True), sampled=True)
+        yield from case("getpart", clean.getpart)
+        yield from case("getvirt", lambda: clean.getvirt(), sampled=True)
+        yield from case("getvirt(raw)", lambda: clean.getvirt(raw=True), sampled=True)
+        yield from case("getvirt(lazy)", lambda: clean.getvirt(lazy=True), sampled=True)
+        yield from case("getswap", lambda: clean.getswap(), sampled=True)
+        yield from case("net_io", lambda: clean.net_io(), sampled=True)
+        yield from case("net_io(pernic)", lambda: clean.net_io(True), sampled=True)
+        yield from case("net_if_addrs", clean.net_if_addrs)
+        yield from case("net_if_stats", clean.net_if_stats)
+        yield from case("net_connections(limit=100)", lambda: clean.net_connections(limit=100))
+        yield from case("net_connections(pids=False)", lambda: clean.net_connections(limit=100, pids=False))
+        yield from case("net_connection_stats(status)", lambda: clean.net_connection_stats())
+        yield from case("net_connection_stats(lport)", lambda: clean.net_connection_stats(by="lport"))
+        yield from case("sensors_temperatures", clean.sensors_temperatures, sampled=True)
+        yield from case("sensors_fans", clean.sensors_fans, sampled=True)
+        yield from case("sensors_battery", clean.sensors_battery, sampled=True)
+        yield from case("boot_info", clean.boot_info)
+        yield from case("logged_in_users", clean.logged_in_users)
+        yield from case("process_details(self)", lambda: clean.process_details(me))
+        yield from case("process_details(self, memory+io)", lambda: clean.process_details(me, fields=["memory", "io"]))
+        yield from case("process_details_many(8)", lambda: clean.process_details_many(pids, budget=2.0), repeat=5)
+        yield from case("sample_history", clean.sample_history)
+        yield from case("history_series", clean.history_series)
+        yield from case("metric_history", lambda: clean.metric_history("bench.series"))
+        yield from case("sampler_status", clean.sampler_status)
+        yield from case("monitor_stats", clean.monitor_stats)
+        yield from case("win_services_list", clean.win_services_list)
+        yield from case("win_service_get", lambda: clean.win_service_get("bench"))
+        yield from case("exporter.payload(gzip)", lambda: exp.payload(True, True), setup=lambda: setattr(exp, "_key", None))
+        yield from case("exporter.payload(gzip) cached", lambda: exp.payload(True, True))
+    finally:
+        exp.stop()
+        clean.history = clean._recorder.history = saved
+
+
+# ---- SimpleParse ----
+_PATHS = (
+    "/usr/lib/python3/dist-packages/some/very/long/package/module_name_here.py",
+    "C:\\Users\\someone\\AppData\\Local\\Programs\\Vendor\\Tool\\bin\\tool.exe",
+    "\\\\fileserver\\share\\projects\\2024\\reports\\quarterly\\summary-final.xlsx",
+    "~/projects/monitoring/dashboards/exports/latest/cluster-overview.json",
+    "relative/dir/with/many/segments/and/a/fairly/long/file_name.tar.gz",
+    "/tmp/short",
+)
+
+
+def parser_suite(size: int = 10000, seed: int = 0) -> Iterator[Case]:
+    from bridge.parser import SimpleParse, make_default_config
+
+    rnd = random.Random(seed)
+    p = SimpleParse(make_default_config())
+    sizes = [rnd.choice((0, 1, 1023, 1 << 20, 5 << 30, 3 << 40)) + rnd.randint(0, 4096) for _ in range(size)]
+    pcts = [rnd.random() * 100 for _ in range(size)]
+    epochs = [1.7e9 + rnd.randint(0, 10**6) for _ in range(size)]
+    few_epochs = epochs[:64] * (size // 64)
+    paths = [rnd.choice(_PATHS) + str(i) for i in range(1000)]
+    clear_memo = lambda: p._ctime_memo().clear()
+
+    yield Case("parser/format_bytes", lambda: p.format_bytes(5 << 30), number=1000)
+    yield Case(f"parser/format_bytes x{size}", lambda: [p.format_bytes(v) for v in sizes])
+    yield Case(f"parser/format_bytes_many x{size}", lambda: p.format_bytes_many(sizes))
+    yield Case("parser/format_percent", lambda: p.format_percent(42.123), number=1000)
+    yield Case("parser/format_percent(list 64)", lambda: p.format_percent(pcts[:64]), number=100)
+    yield Case(f"parser/format_percent_many x{size}", lambda: p.format_percent_many(pcts))
+    yield Case("parser/format_ctime (memo hit)", lambda: p.format_ctime(epochs[0]), number=1000)
+    yield Case(f"parser/format_ctime x{size} (cold)", lambda: [p.format_ctime(v) for v in epochs], setup=clear_memo)
+    yield Case(f"parser/format_ctime_many x{size} (cold)", lambda: p.format_ctime_many(epochs), setup=clear_memo)
+    yield Case(f"parser/format_ctime_many x{size} (64 distinct)", lambda: p.format_ctime_many(few_epochs), setup=clear_memo)
+    yield Case("parser/format_freq", lambda: p.format_freq(2400.0), number=1000)
+    yield Case(f"parser/severity_for_many(cpu) x{size}", lambda: p.severity_for_many("cpu", pcts))
+    for i, path in enumerate(_PATHS):
+        yield Case(f"parser/shorten_path[{i}] max_len=24", lambda path=path: p.shorten_path(path, 24), number=200)
+    yield Case("parser/shorten_path max_len=None", lambda: p.shorten_path(_PATHS[0]), number=200)
+    yield Case("parser/shorten_path max_len=8", lambda: p.shorten_path(_PATHS[0], 8), number=200)
+    yield Case("parser/shorten_path x1000", lambda: [p.shorten_path(x, 40) for x in paths])
+
+
+SUITES = {
+    "process": process_suite,
+    "clean": clean_suite,
+    "parser": parser_suite,
+}
@@ -13,36 +13,33 @@ Kullanım:
         cpu_times, cpu_percent, get_stat, cpu_freq, getloadavg,
         disk_io, diskusage, getpart,
         getvirt, getswap,
-        net_io, net_if_addrs, net_if_stats, net_connections,
+        net_io, net_if_addrs, net_if_stats, net_connections, net_connection_stats,
         sensors_temperatures, sensors_fans, sensors_battery,
         boot_info, logged_in_users,
-        process_details,
+        process_details, process_details_many, follow_processes,
+        sample_history, history_series, metric_history,
+        start_sampler, stop_sampler, sampler_status,
+        engine_objects, use_engine, monitor_stats,
         win_services_list, win_service_get,
+        FormattedView,
         SimpleParse, make_default_config,
     )
-"""
 
-from .clean import (
-    # CPU
-    cpu_times, cpu_percent, get_stat, cpu_freq, getloadavg,
-    # Disk
-    disk_io, diskusage, getpart,
-    # Memory
-    getvirt, getswap,
-    # Network
-    net_io, net_if_addrs, net_if_stats, net_connections,
-    # Sensors
-    sensors_temperatures, sensors_fans, sensors_battery,
-    # System
-    boot_info, logged_in_users,
-    # Process deep dive
-    process_details,
-    # Windows services (destek yoksa supported=False döner)
-    win_services_list, win_service_get,
-)
+asyncio:
+    from bridge import aio
+    snap = await aio.snapshot_all(timeout=2.0)
+
+OpenMetrics / Prometheus:
+    from bridge import exporter
+    exp = exporter.start(port=9110)
+"""
 
+import importlib
+from typing import TYPE_CHECKING
 
-from .parser import SimpleParse, make_default_config, SeverityLevel, SeverityProfile, ParserConfig
+# clean (ve dolayısıyla engine/psutil) ilk erişimde yüklenir; `import bridge` iş yapmaz.
+_SUBMODULES = {"aio", "exporter"}
+_PARSER_NAMES = {"SimpleParse", "make_default_config", "SeverityLevel", "SeverityProfile", "SeverityClassifier", "ParserConfig"}
 
 __all__ = [
     # CPU
@@ -52,15 +49,72 @@ __all__ = [
     # Memory
     "getvirt", "getswap",
     # Network
-    "net_io", "net_if_addrs", "net_if_stats", "net_connections",
+    "net_io", "net_if_addrs", "net_if_stats", "net_connections", "net_connection_stats",
     # Sensors
     "sensors_temperatures", "sensors_fans", "sensors_battery",
     # System
     "boot_info", "logged_in_users",
     # Process deep dive
-    "process_details",
+    "process_details", "process_details_many", "follow_processes",
+    # History
+    "sample_history", "history_series", "metric_history",
+    # Sampler
+    "start_sampler", "stop_sampler", "sampler_status",
+    # Recording / replay (engine.record)
+    "engine_objects", "use_engine",
+    # Self-instrumentation
+    "monitor_stats",
     # Windows services
     "win_services_list", "win_service_get",
+    # Lazy formatting (raw=True / lazy=True)
+    "FormattedView",
     # Parser public API
-    "SimpleParse", "make_default_config", "SeverityLevel", "SeverityProfile", "ParserConfig",
+    "SimpleParse", "make_default_config", "SeverityLevel", "SeverityProfile", "SeverityClassifier", "ParserConfig",
 ]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(".parser" if name in _PARSER_NAMES else ".clean", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
+
+if TYPE_CHECKING:
+    from .clean import (
+        # CPU
+        cpu_times, cpu_percent, get_stat, cpu_freq, getloadavg,
+        # Disk
+        disk_io, diskusage, getpart,
+        # Memory
+        getvirt, getswap,
+        # Network
+        net_io, net_if_addrs, net_if_stats, net_connections, net_connection_stats,
+        # Sensors
+        sensors_temperatures, sensors_fans, sensors_battery,
+        # System
+        boot_info, logged_in_users,
+        # Process deep dive
+        process_details, process_details_many, follow_processes,
+        # History
+        sample_history, history_series, metric_history,
+        # Sampler
+        start_sampler, stop_sampler, sampler_status,
+        # Recording / replay (engine.record)
+        engine_objects, use_engine,
+        # Self-instrumentation
+        monitor_stats,
+        # Windows services (destek yoksa supported=False döner)
+        win_services_list, win_service_get,
+    )
+    from .views import FormattedView
+
+    from .parser import SimpleParse, make_default_config, SeverityLevel, SeverityProfile, SeverityClassifier, ParserConfig
@@ -0,0 +1,244 @@
+# bridge/aio.py
+"""
+asyncio karşılığı: bridge.clean fonksiyonlarının aynı çıktıyı veren
+`async` sürümleri.
+
+- bloklayan toplayıcılar sınırlı bir ThreadPoolExecutor'da çalışır
+  (configure(max_workers=...)); event loop hiç bloklanmaz
+- cpu_percent / cpu_times(psutil.cpu_times_percent) interval verilince
+  thread uyutmaz: iki cpu_times okuması arasında asyncio.sleep
+- her çağrı timeout= alır (asyncio.TimeoutError); iptal edilen çağrının
+  thread'i işini bitirir, sonucu atılır
+- snapshot_all() tüm alt sistemleri eşzamanlı örnekler
+
+Kullanım:
+    from bridge import aio
+    snap = await aio.snapshot_all(timeout=2.0)
+    cpu = await aio.cpu_percent(interval=1.0, percpu=True)
+"""
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import psutil
+
+from . import clean
+
+__all__ = [
+    "configure", "shutdown", "run",
+    "cpu_times", "cpu_percent", "get_stat", "cpu_freq", "getloadavg",
+    "disk_io", "diskusage", "getpart",
+    "getvirt", "getswap",
+    "net_io", "net_if_addrs", "net_if_stats", "net_connections", "net_connection_stats",
+    "sensors_temperatures", "sensors_fans", "sensors_battery",
+    "boot_info", "logged_in_users",
+    "process_details", "process_details_many",
+    "win_services_list", "win_service_get",
+    "snapshot_all",
+]
+
+MAX_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def configure(max_workers: int = MAX_WORKERS) -> None:
+    """Replace the executor (the old one finishes its running jobs)."""
+    global _executor
+    with _executor_lock:
+        old, _executor = _executor, ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bridge-aio")
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def shutdown(wait: bool = True) -> None:
+    global _executor
+    with _executor_lock:
+        old, _executor = _executor, None
+    if old is not None:
+        old.shutdown(wait=wait)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="bridge-aio")
+    return _executor
+
+
+async def run(fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+    """Run a blocking callable on the bridge executor."""
+    loop = asyncio.get_running_loop()
+    fut = loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+    if timeout is None:
+        return await fut
+    return await asyncio.wait_for(fut, timeout)
+
+
+def _offload(name: str):
+    fn = getattr(clean, name)
+
+    @functools.wraps(fn)
+    async def wrapper(*args, timeout: Optional[float] = None, **kwargs):
+        return await run(fn, *args, timeout=timeout, **kwargs)
+
+    wrapper.__doc__ = f"async {name}(...); see bridge.clean.{name}. timeout= in seconds."
+    return wrapper
+
+
+# doğrudan executor'a gidenler
+get_stat = _offload("get_stat")
+cpu_freq = _offload("cpu_freq")
+getloadavg = _offload("getloadavg")
+disk_io = _offload("disk_io")
+diskusage = _offload("diskusage")
+getpart = _offload("getpart")
+getvirt = _offload("getvirt")
+getswap = _offload("getswap")
+net_io = _offload("net_io")
+net_if_addrs = _offload("net_if_addrs")
+net_if_stats = _offload("net_if_stats")
+net_connections = _offload("net_connections")
+net_connection_stats = _offload("net_connection_stats")
+sensors_temperatures = _offload("sensors_temperatures")
+sensors_fans = _offload("sensors_fans")
+sensors_battery = _offload("sensors_battery")
+boot_info = _offload("boot_info")
+logged_in_users = _offload("logged_in_users")
+process_details = _offload("process_details")
+process_details_many = _offload("process_details_many")
+win_services_list = _offload("win_services_list")
+win_service_get = _offload("win_service_get")
+
+
+# ---- CPU: interval bekleme event loop üzerinde ----
+def _split_times(t) -> tuple:
+    """(busy, total) like psutil: guest time is already part of user/nice."""
+    total = sum(t)
+    total -= getattr(t, "guest", 0) + getattr(t, "guest_nice", 0)
+    idle = t.idle + getattr(t, "iowait", 0)
+    return total - idle, total
+
+
+def _busy_percent(t1, t2) -> float:
+    b1, a1 = _split_times(t1)
+    b2, a2 = _split_times(t2)
+    if a2 <= a1:
+        return 0.0
+    return max(0.0, min(100.0, (b2 - b1) / (a2 - a1) * 100.0))
+
+
+def _fields_percent(t1, t2) -> Dict[str, float]:
+    _, a1 = _split_times(t1)
+    _, a2 = _split_times(t2)
+    span = a2 - a1
+    out = {}
+    for k in t2._fields:
+        d = getattr(t2, k) - getattr(t1, k)
+        out[k] = max(0.0, min(100.0, d / span * 100.0)) if span > 0 else 0.0
+    return out
+
+
+async def _sample_times(interval: float, percpu: bool):
+    before = psutil.cpu_times(percpu=percpu)
+    await asyncio.sleep(interval)
+    return before, psutil.cpu_times(percpu=percpu)
+
+
+async def cpu_percent(interval: Optional[float] = None, percpu: bool = False,
+                      timeout: Optional[float] = None):
+    """
+    Same output as clean.cpu_percent. With interval, busy% is computed from
+    two cpu_times readings `interval` seconds apart while the loop stays free.
+    """
+    if not interval:
+        return await run(clean.cpu_percent, interval, percpu, timeout=timeout)
+
+    async def _measure():
+        before, after = await _sample_times(interval, percpu)
+        if percpu:
+            value = [_busy_percent(a, b) for a, b in zip(before, after)]
+        else:
+            value = _busy_percent(before, after)
+        return clean.parser.format_percent(value)
+
+    if timeout is None:
+        return await _measure()
+    return await asyncio.wait_for(_measure(), timeout)
+
+
+async def cpu_times(fn: Callable[..., Any], *, percpu: bool = False,
+                    interval: Optional[float] = None, timeout: Optional[float] = None):
+    """
+    Same output as clean.cpu_times. psutil.cpu_times_percent with an interval
+    is computed from two cpu_times readings around asyncio.sleep; anything
+    else runs on the executor.
+    """
+    if not (interval and fn is psutil.cpu_times_percent):
+        return await run(clean.cpu_times, fn, percpu=percpu, interval=interval, timeout=timeout)
+
+    async def _measure():
+        before, after = await _sample_times(interval, percpu)
+        if percpu:
+            pct = [type(b)(**_fields_percent(a, b)) for a, b in zip(before, after)]
+        else:
+            pct = type(after)(**_fields_percent(before, after))
+        # aynı normalizasyon clean.cpu_times'tan geçsin
+        return clean.cpu_times(lambda percpu=False: pct, percpu=percpu)
+
+    if timeout is None:
+        return await _measure()
+    return await asyncio.wait_for(_measure(), timeout)
+
+
+# ---- toplu ----
+_SNAPSHOT: Dict[str, Callable[[], Any]] = {
+    "cpu": lambda: cpu_percent(percpu=True),
+    "loadavg": lambda: getloadavg(psutil.cpu_count(logical=True) or 1),
+    "memory": getvirt,
+    "swap": getswap,
+    "disk_usage": diskusage,
+    "disk_io": lambda: disk_io(perdisk=True),
+    "net_io": lambda: net_io(pernic=True),
+    "temperatures": sensors_temperatures,
+    "fans": sensors_fans,
+    "battery": sensors_battery,
+    "boot": boot_info,
+}
+SNAPSHOT_PARTS = tuple(_SNAPSHOT)
+
+
+async def snapshot_all(timeout: Optional[float] = None,
+                       include: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Sample every subsystem concurrently (asyncio.gather). A part that fails
+    or exceeds `timeout` comes back as {"error": ...}; the others are kept.
+    """
+    names = list(include or SNAPSHOT_PARTS)
+
+    async def _one(name: str):
+        coro = _SNAPSHOT[name]()
+        if timeout is None:
+            return await coro
+        return await asyncio.wait_for(coro, timeout)
+
+    t0 = time.monotonic()
+    results = await asyncio.gather(*(_one(n) for n in names), return_exceptions=True)
+    out: Dict[str, Any] = {"ts": time.time()}
+    for name, res in zip(names, results):
+        if isinstance(res, asyncio.TimeoutError):
+            out[name] = {"error": "timeout"}
+        elif isinstance(res, asyncio.CancelledError):
+            raise res
+        elif isinstance(res, BaseException):
+            out[name] = {"error": str(res) or type(res).__name__}
+        else:
+            out[name] = res
+    out["duration"] = time.monotonic() - t0
+    return out
@@ -1,26 +1,218 @@
 from datetime import datetime
 from typing import List, Dict, Optional, Union, Callable, Any
 
+import inspect
+import threading
 import time
+from itertools import islice
 import psutil
 
-from engine import CPU, Memory, Disk, ProcessManager, Network, Sensors, System, ProcessDetail
+from engine import CPU, Memory, Disk, Network, Sensors, System
+from engine.history import History, HistoryRecorder
+from engine.inodes import SocketIndex
+from engine.instrument import instruments
+from engine.rates import RateTracker
+from engine.scheduler import Sampler
 try:
     from engine import WinServices
 except Exception:
     WinServices = None
 
 from .parser import SimpleParse
+from .views import FormatSpec, FormattedView
 
 parser = SimpleParse()
 
-cpu = CPU()
-disk = Disk()
-mem = Memory()
-net = Network()
-sensors = Sensors()
-sysinfo = System()
-win = WinServices() if WinServices is not None else None
+
+# ---- formatter tabloları: raw kayıt -> gösterim ----
+def _fmt_bytes(x: int) -> str:
+    return parser.format_bytes(x)
+
+
+def _fmt_pct(x: float) -> str:
+    return parser.format_percent(x, part="")
+
+
+def _fmt_ms(x: float) -> str:
+    return f"{int(x)} ms"
+
+
+def _fmt_bps(x: float) -> str:
+    return f"{parser.format_bytes(int(x))}/s"
+
+
+def _fmt_iops(x: float) -> str:
+    return f"{x:.1f}/s"
+
+
+def _fmt_await(x: float) -> str:
+    return f"{x:.2f} ms"
+
+
+MEMORY_FORMAT = FormatSpec({"percent": _fmt_pct}, default=_fmt_bytes)
+DISK_USAGE_FORMAT = FormatSpec({"percent": _fmt_pct}, default=_fmt_bytes)
+DISK_IO_FORMAT = FormatSpec({
+    "read_bytes": _fmt_bytes, "write_bytes": _fmt_bytes,
+    "read_time": _fmt_ms, "write_time": _fmt_ms, "busy_time": _fmt_ms,
+})
+DISK_RATE_FORMAT = FormatSpec({
+    "read_bps": _fmt_bps, "write_bps": _fmt_bps,
+    "read_iops": _fmt_iops, "write_iops": _fmt_iops,
+    "read_await_ms": _fmt_await, "write_await_ms": _fmt_await,
+    "util_percent": _fmt_pct,
+})
+NET_IO_FORMAT = FormatSpec({
+    "bytes_sent": _fmt_bytes, "bytes_recv": _fmt_bytes,
+    "recv_rate": _fmt_bps, "sent_rate": _fmt_bps,
+})
+
+
+def _asdict(rec) -> Dict[str, Any]:
+    return rec._asdict() if hasattr(rec, "_asdict") else dict(rec)
+
+
+def _render(spec: FormatSpec, rec: Dict[str, Any], raw: bool, lazy: bool):
+    """raw=True: numeric record; lazy=True: FormattedView; default: formatted dict."""
+    if raw:
+        return rec
+    return spec.view(rec) if lazy else spec.format(rec)
+
+
+class _Lazy:
+    """Engine nesnesini ilk öznitelik erişiminde kurar; import sırasında iş yapılmaz."""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._obj = None
+        self._lock = threading.Lock()
+
+    def _get(self):
+        if self._obj is None:
+            with self._lock:
+                if self._obj is None:
+                    self._obj = self._factory()
+        return self._obj
+
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+
+
+cpu = _Lazy(CPU)
+disk = _Lazy(Disk)
+mem = _Lazy(Memory)
+net = _Lazy(Network)
+sensors = _Lazy(Sensors)
+sysinfo = _Lazy(System)
+win = _Lazy(WinServices) if WinServices is not None else None
+
+history = History()
+# sayaç -> hız; seri başına kendi zaman damgası (net, disk, process I/O)
+rate_tracker = RateTracker()
+# soket inode -> (pid, fd); ProcessManager.socket_index() ile değiştirilebilir
+socket_index = SocketIndex()
+_recorder = HistoryRecorder(history, cpu=cpu, memory=mem, disk=disk, network=net)
+
+# Tüm toplayıcılar tek zamanlayıcıda; bridge çağrıları son örnekten beslenir.
+DEFAULT_INTERVALS = {
+    "cpu_percent": 1.0,
+    "cpu_percent_percpu": 1.0,
+    "virtual": 1.0,
+    "swap": 1.0,
+    "net_io": 1.0,
+    "net_io_pernic": 1.0,
+    "disk_io": 5.0,
+    "disk_io_perdisk": 5.0,
+    "disk_usage": 5.0,
+    "temperatures": 10.0,
+    "fans": 10.0,
+    "battery": 10.0,
+}
+
+sampler = Sampler()
+sampler.add("cpu_percent", lambda: cpu.get_percent(), DEFAULT_INTERVALS["cpu_percent"])
+sampler.add("cpu_percent_percpu", lambda: cpu.get_percent(percpu=True), DEFAULT_INTERVALS["cpu_percent_percpu"])
+sampler.add("virtual", lambda: mem.get_virtual(), DEFAULT_INTERVALS["virtual"])
+sampler.add("swap", lambda: mem.get_swap(), DEFAULT_INTERVALS["swap"])
+sampler.add("net_io", lambda: net.get_io_counters(pernic=False, nowrap=True), DEFAULT_INTERVALS["net_io"])
+sampler.add("net_io_pernic", lambda: net.get_io_counters(pernic=True, nowrap=True), DEFAULT_INTERVALS["net_io_pernic"])
+sampler.add("disk_io", lambda: disk.get_io_counters(perdisk=False, nowrap=False), DEFAULT_INTERVALS["disk_io"])
+sampler.add("disk_io_perdisk", lambda: disk.get_io_counters(perdisk=True, nowrap=False), DEFAULT_INTERVALS["disk_io_perdisk"])
+sampler.add("disk_usage", lambda: disk.get_usage(), DEFAULT_INTERVALS["disk_usage"])
+sampler.add("temperatures", lambda: sensors.get_temperatures(), DEFAULT_INTERVALS["temperatures"])
+sampler.add("fans", lambda: sensors.get_fans(), DEFAULT_INTERVALS["fans"])
+sampler.add("battery", lambda: sensors.get_battery(), DEFAULT_INTERVALS["battery"])
+
+
+def _record_history(name: str, sample) -> None:
+    if sample.error is not None or sample.value is None:
+        return
+    ts, v = sample.ts, sample.value
+    if name == "cpu_percent":
+        _recorder.record_cpu(ts, total=v)
+    elif name == "cpu_percent_percpu":
+        _recorder.record_cpu(ts, percpu=v)
+    elif name == "virtual":
+        _recorder.record_memory(ts, virtual=v)
+    elif name == "swap":
+        _recorder.record_memory(ts, swap=v)
+    elif name == "net_io_pernic":
+        _recorder.record_net(ts, v)
+    elif name == "disk_io_perdisk":
+        _recorder.record_disk(ts, v)
+
+
+def start_sampler(intervals: Optional[Dict[str, float]] = None, record_history: bool = True):
+    """
+    Arka planda tüm toplayıcıları kendi aralıklarında çalıştır.
+    intervals: {"cpu_percent": 0.5, "temperatures": 30, ...} DEFAULT_INTERVALS üzerine yazılır.
+    """
+    for name, iv in (intervals or {}).items():
+        sampler.set_interval(name, iv)
+    sampler.remove_listener(_record_history)
+    if record_history:
+        sampler.add_listener(_record_history)
+    sampler.start()
+    return sampler_status()
+
+
+def stop_sampler():
+    sampler.stop()
+    sampler.remove_listener(_record_history)
+
+
+def sampler_status():
+    return {"running": sampler.running, "collectors": sampler.status()}
+
+
+# kaynak adı (engine.record.SOURCES) -> bu modüldeki değişken
+_ENGINE_SLOTS = {"cpu": "cpu", "memory": "mem", "disk": "disk", "network": "net",
+                 "sensors": "sensors", "system": "sysinfo"}
+
+
+def engine_objects() -> Dict[str, Any]:
+    """Engine objects behind the bridge calls, keyed by source name."""
+    return {src: globals()[var] for src, var in _ENGINE_SLOTS.items()}
+
+
+def use_engine(**objs) -> Dict[str, Any]:
+    """
+    Replace engine objects behind every bridge call (recording or replay):
+        use_engine(**recorder.wrap_all(engine_objects()))
+        use_engine(**Player.open("incident.rec", speed=10).engine())
+    Cached sampler results are dropped. Returns the replaced objects, so
+    use_engine(**old) restores them.
+    """
+    unknown = set(objs) - set(_ENGINE_SLOTS)
+    if unknown:
+        raise ValueError(f"unknown engine source(s): {sorted(unknown)} (expected {sorted(_ENGINE_SLOTS)})")
+    old = {}
+    for src, obj in objs.items():
+        var = _ENGINE_SLOTS[src]
+        old[src] = globals()[var]
+        globals()[var] = obj
+    _recorder.cpu, _recorder.memory, _recorder.disk, _recorder.network = cpu, mem, disk, net
+    sampler.reset()
+    return old
 
 _EXPECTED_CPU_TIMES_KEYS = (
     "user", "system", "idle", "nice",
@@ -65,9 +257,11 @@ def cpu_percent(
     interval: Optional[float] = None,
     percpu: bool = False
 ):
-    return parser.format_percent(
-        cpu.get_percent(percpu=percpu, interval=interval)
-    )
+    if interval is None:
+        value = sampler.get("cpu_percent_percpu" if percpu else "cpu_percent")
+    else:
+        value = cpu.get_percent(percpu=percpu, interval=interval)
+    return parser.format_percent(value)
 
 
 def get_stat():
@@ -102,8 +296,9 @@ def cpu_freq(percpu: bool = False):
         avg = None
     elif percpu:
         mapped = [_map_one(x) for x in s]
-        currents = [m["current"] for m in mapped if m["current"] is not None]
-        avg = (sum(currents) / len(currents)) if currents else None
+        # ortalama ham MHz üzerinden; formatlanmış metinler toplanamaz
+        currents = [x.current for x in s if getattr(x, "current", None) is not None]
+        avg = parser.format_freq(sum(currents) / len(currents)) if currents else None
     else:
         mapped = _map_one(s)
         avg = mapped.get("current") if isinstance(mapped, dict) else None
@@ -146,45 +341,70 @@ def getloadavg(logical_count: int):
     }
 
 
-def disk_io(perdisk: bool = False, nowrap: bool = False):
-    d = disk.get_io_counters(perdisk, nowrap)
-
-    def _fmt_entry(stats):
-        s = stats._asdict() if hasattr(stats, "_asdict") else dict(stats)
-        out = {}
-        for k, v in s.items():
-            if v is None:
-                out[k] = None
-                continue
+def disk_io(perdisk: bool = False, nowrap: bool = False, *, rates: bool = False,
+            raw: bool = False, lazy: bool = False):
+    """
+    psutil.disk_io_counters wrapper.
+    rates=True: per-second view of successive calls (see _disk_rates); counters are
+    read fresh rather than from the 5 s sampler cache, so the rate covers the time
+    since the previous call. None until a previous reading exists for the disk.
+    """
+    if nowrap or rates:
+        d, mono = disk.get_io_counters(perdisk, nowrap), time.monotonic()
+    else:
+        sample = sampler.sample("disk_io_perdisk" if perdisk else "disk_io")
+        if sample.error is not None:
+            raise sample.error
+        d, mono = sample.value, sample.mono
 
-            if k in ("read_bytes", "write_bytes"):
-                out[k] = parser.format_bytes(v)
-            elif k in ("read_time", "write_time", "busy_time"):
-                out[k] = f"{int(v)} ms"
-            else:
-                out[k] = v
-        return out
+    if rates:
+        spec, one = DISK_RATE_FORMAT, lambda name, stats: _disk_rates(name, stats, mono)
+    else:
+        spec, one = DISK_IO_FORMAT, lambda name, stats: _asdict(stats)
 
     if perdisk:
-        return {name: _fmt_entry(stats) for name, stats in d.items()}
+        return {name: _render(spec, one(name, stats), raw, lazy) for name, stats in d.items()}
 
-    return _fmt_entry(d)
+    return _render(spec, one("__ALL__", d), raw, lazy)
 
 
-def diskusage():
+_DISK_RATE_FIELDS = ("read_bytes", "write_bytes", "read_count", "write_count",
+                     "read_time", "write_time", "busy_time")
+
+
+def _disk_rates(name: str, stats, mono: float) -> Dict[str, Optional[float]]:
+    """
+    bytes/s and IOPS from count deltas; await = Δ*_time / Δ*_count (ms per op);
+    util = Δbusy_time / Δt (busy_time yoksa None).
+    """
+    r = rate_tracker.update_many(("disk", name), _asdict(stats), mono, _DISK_RATE_FIELDS)
+    rc, wc = r["read_count"], r["write_count"]
+
+    def _await(t, n):
+        if t is None or n is None:
+            return None
+        return t / n if n > 0 else 0.0
+
+    busy = r["busy_time"]
+    return {
+        "read_bps": r["read_bytes"],
+        "write_bps": r["write_bytes"],
+        "read_iops": rc,
+        "write_iops": wc,
+        "read_await_ms": _await(r["read_time"], rc),
+        "write_await_ms": _await(r["write_time"], wc),
+        # ms/s -> yüzde
+        "util_percent": min(100.0, busy / 10.0) if busy is not None else None,
+    }
+
+
+def diskusage(*, raw: bool = False, lazy: bool = False):
     order = ("total", "used", "free", "percent")
-    d = disk.get_usage()
+    d = sampler.get("disk_usage")
     out = {}
     for mount, stats in d.items():
-        s = stats._asdict() if hasattr(stats, "_asdict") else dict(stats)
-        pretty = {}
-        for k in order:
-            v = s[k]
-            if k == "percent":
-                pretty[k] = parser.format_percent(v, part="")
-            else:
-                pretty[k] = parser.format_bytes(v)
-        out[mount] = pretty
+        s = _asdict(stats)
+        out[mount] = _render(DISK_USAGE_FORMAT, {k: s[k] for k in order}, raw, lazy)
     return out
 
 
@@ -193,34 +413,12 @@ def getpart():
     return [stats._asdict() for stats in d]
 
 
-def getvirt():
-    s = mem.get_virtual()
-    if hasattr(s, "_asdict"):
-        s = s._asdict()
-    out = {}
-    for k, v in s.items():
-        if k == "percent":
-            out[k] = parser.format_percent(v, part="")
-        else:
-            out[k] = parser.format_bytes(v)
-    return out
+def getvirt(*, raw: bool = False, lazy: bool = False):
+    return _render(MEMORY_FORMAT, _asdict(sampler.get("virtual")), raw, lazy)
 
 
-def getswap():
-    s = mem.get_swap()
-    if hasattr(s, "_asdict"):
-        s = s._asdict()
-    out = {}
-    for k, v in s.items():
-        if k == "percent":
-            out[k] = parser.format_percent(v, part="")
-        else:
-            out[k] = parser.format_bytes(v)
-    return out
-
-
-def _fmt_bps(x: float) -> str:
-    return f"{parser.format_bytes(int(x))}/s"
+def getswap(*, raw: bool = False, lazy: bool = False):
+    return _render(MEMORY_FORMAT, _asdict(sampler.get("swap")), raw, lazy)
 
 
 def _addr_family_name(fam) -> str:
@@ -228,18 +426,25 @@ def _addr_family_name(fam) -> str:
     return s.split(".")[-1]
 
 
-def net_io(pernic: bool = False, nowrap: bool = True):
+def net_io(pernic: bool = False, nowrap: bool = True, *, raw: bool = False, lazy: bool = False):
     """
-    psutil.net_io_counters wrapper with simple rate calculation.
+    psutil.net_io_counters wrapper with per-NIC rates (see `rate_tracker`).
+    raw=True: numeric counters, rates in bytes/s and ts as epoch seconds.
     """
-    counters = net.get_io_counters(pernic=pernic, nowrap=nowrap)
-    now = time.time()
+    if nowrap:
+        sample = sampler.sample("net_io_pernic" if pernic else "net_io")
+        if sample.error is not None:
+            raise sample.error
+        counters, now, mono = sample.value, sample.ts, sample.mono
+    else:
+        counters = net.get_io_counters(pernic=pernic, nowrap=nowrap)
+        now, mono = time.time(), time.monotonic()
 
     def _one(name: str, c) -> dict:
-        d = c._asdict() if hasattr(c, "_asdict") else dict(c)
+        d = _asdict(c)
         out = {
-            "bytes_sent": parser.format_bytes(d.get("bytes_sent", 0)),
-            "bytes_recv": parser.format_bytes(d.get("bytes_recv", 0)),
+            "bytes_sent": d.get("bytes_sent", 0),
+            "bytes_recv": d.get("bytes_recv", 0),
             "packets_sent": d.get("packets_sent"),
             "packets_recv": d.get("packets_recv"),
             "errin": d.get("errin"),
@@ -247,30 +452,17 @@ def net_io(pernic: bool = False, nowrap: bool = True):
             "dropin": d.get("dropin"),
             "dropout": d.get("dropout"),
         }
-
-        prev = parser.state.last_io_bytes.get(name)
-        if prev and parser.state.last_ts:
-            dt = max(1e-3, now - parser.state.last_ts)
-            prev_recv, prev_sent = prev
-            rrate = max(0.0, (d.get("bytes_recv", 0) - prev_recv) / dt)
-            srate = max(0.0, (d.get("bytes_sent", 0) - prev_sent) / dt)
-            out["recv_rate"] = _fmt_bps(rrate)
-            out["sent_rate"] = _fmt_bps(srate)
-        else:
-            out["recv_rate"] = None
-            out["sent_rate"] = None
-
-        parser.state.last_io_bytes[name] = (d.get("bytes_recv", 0), d.get("bytes_sent", 0))
-        return out
+        out["recv_rate"] = rate_tracker.update(("net", name, "bytes_recv"), out["bytes_recv"], mono)
+        out["sent_rate"] = rate_tracker.update(("net", name, "bytes_sent"), out["bytes_sent"], mono)
+        return _render(NET_IO_FORMAT, out, raw, lazy)
 
     if pernic:
         out = {name: _one(name, c) for name, c in counters.items()}
     else:
         out = _one("__ALL__", counters)
 
-    parser.state.last_ts = now
     return {
-        "ts": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "ts": now if raw else datetime.fromtimestamp(now).astimezone().isoformat(timespec="seconds"),
         "pernic": pernic,
         "io": out,
     }
@@ -321,8 +513,18 @@ def net_if_stats():
     return out
 
 
-def net_connections(kind: str = "inet", limit: int | None = 100):
-    conns = net.get_connections(kind=kind)
+def net_connections(kind: str = "inet", limit: int | None = 100, *,
+                    states: Optional[List[str]] = None, pids: bool = True):
+    """
+    Streams /proc/net on Linux and stops after `limit` sockets. pids=True
+    attributes them through `socket_index` (only new pids are scanned);
+    pids=False skips attribution (pid/fd None).
+    """
+    if pids:
+        conns = net.get_connections_with_pids(kind=kind, limit=limit, states=states, index=socket_index)
+    else:
+        it = net.iter_connections(kind=kind, states=states)
+        conns = list(islice(it, limit)) if limit is not None else list(it)
 
     def _addr_tuple(t):
         if not t:
@@ -334,7 +536,7 @@ def net_connections(kind: str = "inet", limit: int | None = 100):
             return {"raw": str(t)}
 
     rows = []
-    for c in conns[: (None if limit is None else limit)]:
+    for c in conns:
         d = c._asdict() if hasattr(c, "_asdict") else dict(c)
         rows.append({
             "fd": d.get("fd"),
@@ -348,8 +550,28 @@ def net_connections(kind: str = "inet", limit: int | None = 100):
     return rows
 
 
+def net_connection_stats(kind: str = "inet", by: str = "status", *,
+                         states: Optional[List[str]] = None, top: int | None = None):
+    """
+    Socket counts without per-socket rows. by: status, lport, laddr, raddr,
+    rport or proto; counts are sorted descending, top=N keeps the N largest.
+    """
+    counts = net.get_connection_counts(kind=kind, by=by, states=states)
+    ranked = sorted(counts.items(), key=lambda kv: (-kv[1], str(kv[0])))
+    if top is not None:
+        ranked = ranked[:top]
+    return {
+        "ts": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "kind": kind,
+        "by": by,
+        "total": sum(counts.values()),
+        "distinct": len(counts),
+        "counts": [{"key": k, "count": n} for k, n in ranked],
+    }
+
+
 def sensors_temperatures():
-    temps = sensors.get_temperatures()
+    temps = sampler.get("temperatures")
     if not temps:
         return {"supported": False, "temperatures": None}
 
@@ -375,7 +597,7 @@ def sensors_temperatures():
 
 
 def sensors_fans():
-    fans = sensors.get_fans()
+    fans = sampler.get("fans")
     if not fans:
         return {"supported": False, "fans": None}
     out = {}
@@ -390,7 +612,7 @@ def sensors_fans():
 
 
 def sensors_battery():
-    b = sensors.get_battery()
+    b = sampler.get("battery")
     if not b:
         return {"supported": False, "battery": None}
     d = b._asdict() if hasattr(b, "_asdict") else dict(b)
@@ -448,87 +670,192 @@ def logged_in_users():
     return rows
 
 
-def process_details(pid: int, *, sample_conn: int = 20, shorten_path_len: int = 64):
+def _detail_memory(p, pid: int, opts: Dict[str, Any]):
+    m = p.memory_full_info()
+    md = m._asdict() if hasattr(m, "_asdict") else dict(m)
+    return {k: parser.format_bytes(v or 0) for k, v in md.items()}
+
+
+def _detail_io(p, pid: int, opts: Dict[str, Any]):
+    io = p.io_counters()
+    if io is None:
+        return None
+    d = io._asdict() if hasattr(io, "_asdict") else dict(io)
+    # (pid, create_time): PID yeniden kullanılırsa eski sayaçla karışmasın
+    key = ("proc", pid, p.create_time())
+    read_rate = rate_tracker.update(key + ("read_bytes",), d.get("read_bytes"))
+    write_rate = rate_tracker.update(key + ("write_bytes",), d.get("write_bytes"))
+    return {
+        "read_count": d.get("read_count"),
+        "write_count": d.get("write_count"),
+        "read_bytes": parser.format_bytes(d.get("read_bytes", 0)),
+        "write_bytes": parser.format_bytes(d.get("write_bytes", 0)),
+        "read_rate": _fmt_bps(read_rate) if read_rate is not None else None,
+        "write_rate": _fmt_bps(write_rate) if write_rate is not None else None,
+    }
+
+
+def _detail_open_files(p, pid: int, opts: Dict[str, Any]):
+    files = p.open_files()
+    return [
+        parser.shorten_path(getattr(f, "path", str(f)), max_len=opts["shorten_path_len"])
+        for f in files
+    ]
+
+
+def _detail_connections(p, pid: int, opts: Dict[str, Any]):
+    conns = p.connections()
+    status_counts = {}
+    sample = []
+    for c in conns[:opts["sample_conn"]]:
+        d = c._asdict() if hasattr(c, "_asdict") else dict(c)
+        st = d.get("status")
+        status_counts[st] = status_counts.get(st, 0) + 1
+
+        def _addr(t):
+            return None if not t else {"ip": t[0], "port": t[1]}
+
+        sample.append({
+            "laddr": _addr(d.get("laddr")),
+            "raddr": _addr(d.get("raddr")),
+            "status": st,
+            "fd": d.get("fd"),
+        })
+    return {
+        "total": len(conns),
+        "by_status": status_counts,
+        "sample": sample,
+    }
+
+
+def _detail_threads(p, pid: int, opts: Dict[str, Any]):
+    ths = p.threads()
+    return {
+        "count": len(ths),
+        "sample": [{"id": t.id, "user_time": t.user_time, "system_time": t.system_time} for t in ths[:10]],
+    }
+
+
+# alan -> (okuyucu, hata durumunda dönen değer; None ise {"error": ...})
+_DETAIL_FIELDS = {
+    "memory": (_detail_memory, None),
+    "io": (_detail_io, None),
+    "open_files": (_detail_open_files, None),
+    "connections": (_detail_connections, None),
+    "num_fds": (lambda p, pid, opts: p.num_fds(), lambda e: None),
+    "threads": (_detail_threads, None),
+}
+DETAIL_FIELDS = tuple(_DETAIL_FIELDS)
+
+
+def _detail_fields(fields: Optional[List[str]]) -> List[str]:
+    if not fields:
+        return list(DETAIL_FIELDS)
+    unknown = [f for f in fields if f not in _DETAIL_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown detail field(s): {unknown} (expected {list(DETAIL_FIELDS)})")
+    return list(fields)
+
+
+def _collect_details(pid: int, out: Dict[str, Any], fields, opts: Dict[str, Any],
+                     deadline: Optional[float] = None) -> Dict[str, Any]:
+    """Fill `out` field by field inside one oneshot(); stops starting new fields past deadline."""
+    from engine import ProcessDetail
     try:
         p = ProcessDetail(pid)
     except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-        return {"error": str(e), "pid": pid}
+        out["error"] = str(e)
+        return out
 
-    out = {"pid": pid}
+    with p.oneshot():
+        for name in fields:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            fn, on_error = _DETAIL_FIELDS[name]
+            try:
+                out[name] = fn(p, pid, opts)
+            except Exception as e:
+                out[name] = on_error(e) if on_error else {"error": str(e)}
+    return out
 
-    try:
-        m = p.memory_full_info()
-        md = m._asdict() if hasattr(m, "_asdict") else dict(m)
-        mem_fmt = {k: parser.format_bytes(v or 0) for k, v in md.items()}
-        out["memory"] = mem_fmt
-    except Exception as e:
-        out["memory"] = {"error": str(e)}
 
-    try:
-        io = p.io_counters()
-        if io is not None:
-            d = io._asdict() if hasattr(io, "_asdict") else dict(io)
-            out["io"] = {
-                "read_count": d.get("read_count"),
-                "write_count": d.get("write_count"),
-                "read_bytes": parser.format_bytes(d.get("read_bytes", 0)),
-                "write_bytes": parser.format_bytes(d.get("write_bytes", 0)),
-            }
-        else:
-            out["io"] = None
-    except Exception as e:
-        out["io"] = {"error": str(e)}
+def process_details(pid: int, *, sample_conn: int = 20, shorten_path_len: int = 64,
+                    fields: Optional[List[str]] = None):
+    opts = {"sample_conn": sample_conn, "shorten_path_len": shorten_path_len}
+    out = _collect_details(pid, {"pid": pid}, _detail_fields(fields), opts)
+    if "error" in out:
+        return {"error": out["error"], "pid": pid}
+    return out
 
-    try:
-        files = p.open_files()
-        out["open_files"] = [
-            parser.shorten_path(getattr(f, "path", str(f)), max_len=shorten_path_len)
-            for f in files
-        ]
-    except Exception as e:
-        out["open_files"] = {"error": str(e)}
 
-    try:
-        conns = p.connections()
-        status_counts = {}
-        sample = []
-        for c in conns[:sample_conn]:
-            d = c._asdict() if hasattr(c, "_asdict") else dict(c)
-            st = d.get("status")
-            status_counts[st] = status_counts.get(st, 0) + 1
-
-            def _addr(t):
-                return None if not t else {"ip": t[0], "port": t[1]}
-
-            sample.append({
-                "laddr": _addr(d.get("laddr")),
-                "raddr": _addr(d.get("raddr")),
-                "status": st,
-                "fd": d.get("fd"),
-            })
-        out["connections"] = {
-            "total": len(conns),
-            "by_status": status_counts,
-            "sample": sample,
-        }
-    except Exception as e:
-        out["connections"] = {"error": str(e)}
+def process_details_many(pids: List[int], *, budget: float = 1.0, workers: int = 4,
+                         fields: Optional[List[str]] = None,
+                         sample_conn: int = 20, shorten_path_len: int = 64) -> Dict[int, Dict[str, Any]]:
+    """
+    process_details for several pids on a worker pool within `budget` seconds.
+    Whatever is ready at the deadline is returned: fields still running or not
+    reached get {"error": "timeout"} and the pid entry gets "partial": True.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait
 
+    fields = _detail_fields(fields)
+    opts = {"sample_conn": sample_conn, "shorten_path_len": shorten_path_len}
+    deadline = time.monotonic() + budget
+    outs = {pid: {"pid": pid} for pid in pids}
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(outs))), thread_name_prefix="details")
     try:
-        out["num_fds"] = p.num_fds()
-    except Exception:
-        out["num_fds"] = None
+        futures = [pool.submit(_collect_details, pid, out, fields, opts, deadline) for pid, out in outs.items()]
+        wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+    finally:
+        # takılan süreçleri bekleme; başlamamış işler iptal
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    result = {}
+    for pid, out in outs.items():
+        snap = dict(out)  # işçi hâlâ yazıyor olabilir
+        if "error" in snap:
+            result[pid] = {"error": snap["error"], "pid": pid}
+            continue
+        missing = [f for f in fields if f not in snap]
+        for f in missing:
+            snap[f] = {"error": "timeout"}
+        if missing:
+            snap["partial"] = True
+        result[pid] = snap
+    return result
+
+
+def _prune_process_rates(snap) -> None:
+    removed = snap.delta.removed
+    if removed:
+        rate_tracker.forget_prefixes(("proc",) + key for key in removed)
+
+
+def follow_processes(pm) -> None:
+    """
+    Drop process_details read/write rate series when a process exits, using
+    the ProcessManager's per-refresh delta (otherwise they age out only past
+    rate_tracker.max_series).
+    """
+    pm.remove_listener(_prune_process_rates)
+    pm.add_listener(_prune_process_rates)
 
-    try:
-        ths = p.threads()
-        out["threads"] = {
-            "count": len(ths),
-            "sample": [{"id": t.id, "user_time": t.user_time, "system_time": t.system_time} for t in ths[:10]],
-        }
-    except Exception as e:
-        out["threads"] = {"error": str(e)}
 
-    return out
+def sample_history():
+    """CPU / memory / swap / per-NIC / per-disk değerlerini geçmişe bir kez yaz."""
+    ts = _recorder.sample()
+    return {"ts": ts, "series": len(history.names()), "bytes": history.nbytes}
+
+
+def history_series(prefix: str = ""):
+    return history.names(prefix)
+
+
+def metric_history(name: str, last: int | None = None):
+    buf = history.get(name)
+    if buf is None:
+        return {"name": name, "ts": [], "values": []}
+    return {"name": name, "ts": buf.timestamps(last), "values": buf.values(last)}
 
 
 def win_services_list():
@@ -564,7 +891,36 @@ def win_service_get(name: str):
         return {"supported": False, "error": str(e)}
 
 
+def monitor_stats(prefix: str = "", stuck_after: float = 5.0, reset: bool = False):
+    """
+    The monitor's own cost: per-call counts, latency percentiles, errors by
+    type and in-flight calls for engine collectors ("cpu.", "disk.",
+    "processes.", ...) and bridge calls ("bridge."), plus this process's CPU
+    and RSS. `stuck` lists calls running longer than stuck_after seconds
+    (e.g. "disk.disk_usage:/mnt/nfs"). reset=True starts new counts.
+    """
+    out = {
+        "ts": time.time(),
+        "self": instruments.self_usage(),
+        "calls": instruments.stats(prefix),
+        "stuck": instruments.stuck(stuck_after),
+        "sampler": sampler.status(),
+    }
+    if reset:
+        instruments.reset()
+    return out
+
+
+# public çağrılar "bridge.<ad>" olarak ölçülür (monitor_stats hariç)
+for _name, _fn in list(globals().items()):
+    if (inspect.isfunction(_fn) and _fn.__module__ == __name__ and not _name.startswith("_")
+            and _name != "monitor_stats"):
+        globals()[_name] = instruments.wrap(f"bridge.{_name}", _fn)
+del _name, _fn
+
+
 if __name__ == "__main__":
+    from engine import ProcessManager
     pm = ProcessManager(interval=1.0)
     pm.start()
     rows = pm(
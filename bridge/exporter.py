@@ -0,0 +1,472 @@
+# bridge/exporter.py
+"""
+OpenMetrics / Prometheus exporter: CPU, memory, swap, filesystems, disk and
+NIC counters, sensors, top-N processes, collector health and the monitor's
+own call histograms on a small HTTP endpoint.
+
+- değerler sampler'ın son örneğinden okunur; scrape psutil'e gitmez
+- gövde örnek değiştiğinde (sampler dinleyicisi / yeni process snapshot'ı)
+  ilk scrape'te bir kez kodlanır, gzip'li hali de bir kez sıkıştırılır;
+  eşzamanlı scrape'ler aynı bayt dizisini paylaşır
+- Accept: application/openmetrics-text -> OpenMetrics 1.0, yoksa
+  Prometheus text 0.0.4; Accept-Encoding: gzip -> sıkıştırılmış yanıt
+
+Kullanım:
+    from bridge import exporter
+    exp = exporter.start(port=9110)          # sampler + ProcessManager başlatılır
+    # curl -s --compressed http://127.0.0.1:9110/metrics
+    exp.stop()
+
+    python -m bridge.exporter --port 9110 --top 10
+"""
+import gzip
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from engine.instrument import instruments
+
+from . import clean
+
+__all__ = ["Exporter", "start", "OPENMETRICS_TYPE", "TEXT_TYPE"]
+
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+TEXT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_PORT = 9110
+TOP_FIELDS = ("cpu_percent", "memory_percent", "num_threads")
+
+# (alan, aile soneki, açıklama, çarpan)
+_DISK_COUNTERS = (
+    ("read_bytes", "disk_read_bytes", "Bytes read from the disk.", 1),
+    ("write_bytes", "disk_written_bytes", "Bytes written to the disk.", 1),
+    ("read_count", "disk_reads_completed", "Reads completed.", 1),
+    ("write_count", "disk_writes_completed", "Writes completed.", 1),
+    ("read_time", "disk_read_time_seconds", "Time spent reading.", 1e-3),
+    ("write_time", "disk_write_time_seconds", "Time spent writing.", 1e-3),
+    ("busy_time", "disk_io_time_seconds", "Time spent doing I/O.", 1e-3),
+)
+_NET_COUNTERS = (
+    ("bytes_recv", "network_receive_bytes", "Bytes received."),
+    ("bytes_sent", "network_transmit_bytes", "Bytes sent."),
+    ("packets_recv", "network_receive_packets", "Packets received."),
+    ("packets_sent", "network_transmit_packets", "Packets sent."),
+    ("errin", "network_receive_errors", "Receive errors."),
+    ("errout", "network_transmit_errors", "Transmit errors."),
+    ("dropin", "network_receive_drops", "Incoming packets dropped."),
+    ("dropout", "network_transmit_drops", "Outgoing packets dropped."),
+)
+
+
+def _num(v: Any) -> Optional[str]:
+    """Sample value text; None for missing / non-numeric (ad_value "-")."""
+    if isinstance(v, bool):
+        return "1" if v else "0"
+    if isinstance(v, int):
+        return str(v)
+    if isinstance(v, float):
+        if math.isnan(v):
+            return "NaN"
+        if math.isinf(v):
+            return "+Inf" if v > 0 else "-Inf"
+        return repr(v)
+    return None
+
+
+def _escape(v: Any) -> str:
+    return str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**kv) -> str:
+    if not kv:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in kv.items()) + "}"
+
+
+def _sensor_names(entries) -> List[Tuple[str, Any]]:
+    """(sensor label, entry) pairs of one chip, labels made unique."""
+    out, seen = [], set()
+    for i, e in enumerate(entries):
+        # aynı çipte etiketsiz / tekrar eden sensörler ayrı seri olsun
+        sensor = e.label or str(i)
+        if sensor in seen:
+            sensor = f"{sensor}_{i}"
+        seen.add(sensor)
+        out.append((sensor, e))
+    return out
+
+
+class _Family:
+    __slots__ = ("name", "type", "help", "samples")
+
+    def __init__(self, name: str, type_: str, help_: str):
+        self.name = name
+        self.type = type_
+        self.help = help_
+        self.samples: List[Tuple[str, str, str]] = []   # (sonek, etiketler, değer)
+
+    def add(self, value: Any, labels: str = "", suffix: str = "") -> None:
+        v = _num(value)
+        if v is not None:
+            self.samples.append((suffix, labels, v))
+
+
+def render(families: List[_Family], openmetrics: bool = True) -> bytes:
+    """Text exposition of metric families (OpenMetrics 1.0 or Prometheus 0.0.4)."""
+    out = []
+    for f in families:
+        if not f.samples:
+            continue
+        # OpenMetrics'te counter ailesi _total'sız adlandırılır, 0.0.4'te örnek adıyla
+        name = f.name + "_total" if f.type == "counter" and not openmetrics else f.name
+        out.append(f"# HELP {name} {f.help}")
+        out.append(f"# TYPE {name} {f.type}")
+        out.extend(f"{f.name}{suffix}{labels} {value}" for suffix, labels, value in f.samples)
+    if openmetrics:
+        out.append("# EOF")
+    return ("\n".join(out) + "\n").encode("utf-8")
+
+
+class Exporter:
+    """
+    Builds the metric page from cached samples and serves it over HTTP.
+    processes: a started ProcessManager for the top-N tables (None: no
+    process metrics); top_by picks the sort column.
+    """
+
+    def __init__(self, sampler=None, processes=None, top_n: int = 10, top_by: str = "cpu_percent",
+                 namespace: str = "psutil_bridge", self_metrics: bool = True, compresslevel: int = 6):
+        self.sampler = clean.sampler if sampler is None else sampler
+        self.processes = processes
+        self.top_n = top_n
+        self.top_by = top_by
+        self.namespace = namespace
+        self.self_metrics = self_metrics
+        self.compresslevel = compresslevel
+        self.encodes = 0
+        self.scrapes = 0
+        self._version = 0
+        self._key: Optional[tuple] = None
+        self._families: List[_Family] = []
+        self._bodies: Dict[Tuple[bool, bool], bytes] = {}   # (openmetrics, gzip) -> gövde
+        self._lock = threading.Lock()
+        self._owned = []        # start() içinde başlatılıp stop()'ta durdurulacaklar
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.sampler.add_listener(self._on_sample)
+
+    def _on_sample(self, name: str, sample) -> None:
+        self._version += 1
+
+    # ---- toplama ----
+    def _fam(self, fams: List[_Family], suffix: str, type_: str, help_: str) -> _Family:
+        f = _Family(f"{self.namespace}_{suffix}", type_, help_)
+        fams.append(f)
+        return f
+
+    def _value(self, name: str):
+        s = self.sampler.latest(name)
+        if s is None or s.error is not None:
+            return None
+        return s.value
+
+    def collect(self) -> List[_Family]:
+        """Metric families from the latest samples (no collector is run here)."""
+        fams: List[_Family] = []
+        fam = lambda suffix, type_, help_: self._fam(fams, suffix, type_, help_)
+
+        f = fam("cpu_usage_percent", "gauge", "CPU utilisation over the last sampler interval.")
+        f.add(self._value("cpu_percent"))
+        f = fam("cpu_core_usage_percent", "gauge", "Per-CPU utilisation over the last sampler interval.")
+        for i, v in enumerate(self._value("cpu_percent_percpu") or ()):
+            f.add(v, _labels(cpu=i))
+
+        for key, what in (("virtual", "memory"), ("swap", "swap")):
+            v = self._value(key)
+            if v is None:
+                continue
+            f = fam(f"{what}_bytes", "gauge", f"{what.capitalize()} by kind.")
+            for k, x in v._asdict().items():
+                if k not in ("percent", "sin", "sout"):
+                    f.add(x, _labels(kind=k))
+            fam(f"{what}_usage_percent", "gauge", f"{what.capitalize()} in use.").add(v.percent)
+            if what == "swap":
+                f = fam("swap_paged_bytes", "counter", "Bytes swapped in / out.")
+                f.add(getattr(v, "sin", None), _labels(direction="in"), "_total")
+                f.add(getattr(v, "sout", None), _labels(direction="out"), "_total")
+
+        usage = self._value("disk_usage") or {}
+        size = fam("filesystem_size_bytes", "gauge", "Filesystem size.")
+        used = fam("filesystem_used_bytes", "gauge", "Filesystem space in use.")
+        free = fam("filesystem_free_bytes", "gauge", "Filesystem space available.")
+        pct = fam("filesystem_usage_percent", "gauge", "Filesystem space in use.")
+        for mount, u in usage.items():
+            lb = _labels(mountpoint=mount)
+            size.add(u.total, lb)
+            used.add(u.used, lb)
+            free.add(u.free, lb)
+            pct.add(u.percent, lb)
+
+        disks = self._value("disk_io_perdisk") or {}
+        for field, suffix, help_, scale in _DISK_COUNTERS:
+            f = fam(suffix, "counter", help_)
+            for name, d in disks.items():
+                v = getattr(d, field, None)
+                f.add(v * scale if scale != 1 and v is not None else v, _labels(disk=name), "_total")
+
+        nics = self._value("net_io_pernic") or {}
+        for field, suffix, help_ in _NET_COUNTERS:
+            f = fam(suffix, "counter", help_)
+            for name, c in nics.items():
+                f.add(getattr(c, field, None), _labels(nic=name), "_total")
+
+        self._collect_sensors(fam)
+        if self.processes is not None and self.top_n > 0:
+            self._collect_processes(fam)
+        self._collect_health(fam)
+        return fams
+
+    def _collect_sensors(self, fam) -> None:
+        temp = fam("temperature_celsius", "gauge", "Sensor temperature.")
+        high = fam("temperature_high_celsius", "gauge", "Sensor high threshold.")
+        crit = fam("temperature_critical_celsius", "gauge", "Sensor critical threshold.")
+        for chip, entries in (self._value("temperatures") or {}).items():
+            for sensor, e in _sensor_names(entries):
+                lb = _labels(chip=chip, sensor=sensor)
+                temp.add(e.current, lb)
+                high.add(e.high, lb)
+                crit.add(e.critical, lb)
+
+        f = fam("fan_speed_rpm", "gauge", "Fan speed.")
+        for chip, entries in (self._value("fans") or {}).items():
+            for sensor, e in _sensor_names(entries):
+                f.add(e.current, _labels(chip=chip, sensor=sensor))
+
+        b = self._value("battery")
+        if b is not None:
+            fam("battery_percent", "gauge", "Battery charge.").add(b.percent)
+            secs = b.secsleft if isinstance(b.secsleft, int) and b.secsleft >= 0 else None
+            fam("battery_seconds_left", "gauge", "Estimated battery time left.").add(secs)
+            fam("battery_power_plugged", "gauge", "1 when on AC power.").add(b.power_plugged)
+
+    def _collect_processes(self, fam) -> None:
+        snap = self.processes.snapshot()
+        fam("processes", "gauge", "Processes in the latest snapshot.").add(len(snap))
+        attrs = self.processes.attrs
+        fields = [f for f in TOP_FIELDS if f in attrs]
+        keys = [f for f in ("pid", "name", "username") if f in attrs]
+        rows = snap.columns.query(sort_by=self.top_by, limit=self.top_n, fields=keys + fields)
+        helps = {"cpu_percent": "CPU utilisation of the top processes.",
+                 "memory_percent": "Resident memory share of the top processes.",
+                 "num_threads": "Thread count of the top processes."}
+        for field in fields:
+            f = fam(f"top_process_{field}", "gauge", helps[field])
+            for r in rows:
+                f.add(r.get(field), _labels(pid=r.get("pid"), name=r.get("name"), user=r.get("username")))
+
+    def _collect_health(self, fam) -> None:
+        dur = fam("collector_duration_seconds", "gauge", "Time the collector's last run took.")
+        ok = fam("collector_success", "gauge", "1 when the collector's last run succeeded.")
+        ts = fam("collector_timestamp_seconds", "gauge", "Unix time of the collector's last run.")
+        for name in self.sampler.names():
+            s = self.sampler.latest(name)
+            if s is None:
+                continue
+            lb = _labels(collector=name)
+            dur.add(s.duration, lb)
+            ok.add(s.error is None, lb)
+            ts.add(s.ts, lb)
+
+        h = fam("call_duration_seconds", "histogram", "Latency of engine collectors and bridge calls.")
+        err = fam("call_errors", "counter", "Failed calls by exception type.")
+        inflight = fam("calls_in_flight", "gauge", "Calls currently running.")
+        for name, st in instruments.stats().items():
+            hist = instruments.histogram(name)
+            if hist is None or not st["calls"]:
+                continue
+            buckets = hist.buckets()
+            for bound, n in buckets:
+                h.add(n, _labels(call=name, le=_num(float(bound))), "_bucket")
+            # +Inf kovası ile _count aynı okumadan gelsin
+            h.add(buckets[-1][1], _labels(call=name), "_count")
+            h.add(float(st["total_s"]), _labels(call=name), "_sum")
+            for kind, n in st["errors"].items():
+                err.add(n, _labels(call=name, type=kind), "_total")
+            inflight.add(st["in_flight"], _labels(call=name))
+
+        if self.self_metrics:
+            me = instruments.self_usage(update=False)
+            fam("self_cpu_seconds", "counter", "CPU time used by this monitor.").add(me["cpu_seconds"], suffix="_total")
+            fam("self_resident_memory_bytes", "gauge", "Resident memory of this monitor.").add(me["rss"])
+            fam("self_threads", "gauge", "Threads in this monitor.").add(me["threads"])
+            fam("self_open_fds", "gauge", "Open file descriptors of this monitor.").add(me["fds"])
+            fam("exporter_encodes", "counter", "Metric pages encoded so far.").add(self.encodes, suffix="_total")
+
+    # ---- kodlama ----
+    def _refresh(self) -> None:
+        """Without the sampler thread, run collectors whose result is older than their interval."""
+        if not self.sampler.running:
+            for name in self.sampler.names():
+                self.sampler.sample(name)
+
+    def _state(self) -> tuple:
+        return self._version, self.processes.version if self.processes is not None else 0
+
+    def payload(self, openmetrics: bool = True, compressed: bool = False) -> bytes:
+        """Encoded page; rebuilt only after a new sample or process snapshot."""
+        self._refresh()
+        body = self._bodies.get((openmetrics, compressed)) if self._state() == self._key else None
+        if body is not None:
+            return body
+        with self._lock:
+            key = self._state()
+            if key != self._key:
+                self.encodes += 1
+                with instruments.timer("exporter.encode"):
+                    self._families = self.collect()
+                self._bodies = {}
+                self._key = key
+            body = self._bodies.get((openmetrics, compressed))
+            if body is None:
+                body = render(self._families, openmetrics)
+                if compressed:
+                    body = gzip.compress(body, self.compresslevel, mtime=0)
+                self._bodies[(openmetrics, compressed)] = body
+        return body
+
+    # ---- HTTP ----
+    def start(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> Tuple[str, int]:
+        """Serve /metrics on a background thread; port=0 picks a free port. Returns (host, port)."""
+        if self._server is None:
+            server = ThreadingHTTPServer((host, port), _Handler)
+            server.daemon_threads = True
+            server.exporter = self
+            self._server = server
+            self._thread = threading.Thread(target=server.serve_forever, name="exporter", daemon=True)
+            self._thread.start()
+        return self.address
+
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        return self._server.server_address[:2] if self._server is not None else None
+
+    @property
+    def url(self) -> Optional[str]:
+        addr = self.address
+        return f"http://{addr[0]}:{addr[1]}/metrics" if addr else None
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+        self.sampler.remove_listener(self._on_sample)
+        for stop in reversed(self._owned):
+            stop()
+        self._owned = []
+
+
+def _qvalue(params: str) -> float:
+    """q of an Accept-Encoding entry; missing or malformed q counts as 1."""
+    for param in params.split(";"):
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 1.0
+    return 1.0
+
+
+def _accepts_gzip(header: str) -> bool:
+    q: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if token in ("gzip", "*"):
+            q.setdefault(token, _qvalue(params))
+    # açık "gzip" girdisi "*"dan önce gelir
+    return q.get("gzip", q.get("*", 0.0)) > 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "psutil-bridge-exporter"
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            exp: Exporter = self.server.exporter
+            exp.scrapes += 1
+            try:
+                om = "application/openmetrics-text" in self.headers.get("Accept", "")
+                gz = _accepts_gzip(self.headers.get("Accept-Encoding", ""))
+                body = exp.payload(om, gz)
+            except Exception as e:
+                self._send(500, "text/plain; charset=utf-8", f"{type(e).__name__}: {e}\n".encode())
+                return
+            self._send(200, OPENMETRICS_TYPE if om else TEXT_TYPE, body, gz)
+        elif path == "/":
+            self._send(200, "text/html; charset=utf-8",
+                       b'<html><body><a href="/metrics">/metrics</a></body></html>\n')
+        else:
+            self._send(404, "text/plain; charset=utf-8", b"not found\n")
+
+    def _send(self, code: int, ctype: str, body: bytes, compressed: bool = False) -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept, Accept-Encoding")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start(port: int = DEFAULT_PORT, host: str = "127.0.0.1", *, top_n: int = 10,
+          processes=None, process_interval: float = 5.0, **kwargs) -> Exporter:
+    """
+    Start the bridge sampler (if needed), a ProcessManager for the top-N
+    tables (unless `processes` is given or top_n=0) and the HTTP server.
+    exp.stop() stops whatever this call started.
+    """
+    owned = []
+    if not clean.sampler.running:
+        clean.start_sampler()
+        owned.append(clean.stop_sampler)
+    if processes is None and top_n > 0:
+        from engine import ProcessManager
+        processes = ProcessManager(interval=process_interval)
+        processes.start(wait=False)
+        clean.follow_processes(processes)
+        owned.append(processes.stop)
+    exp = Exporter(processes=processes, top_n=top_n, **kwargs)
+    exp._owned = owned
+    exp.start(host, port)
+    return exp
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    ap = argparse.ArgumentParser(description="OpenMetrics exporter for psutil-bridge")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--top", type=int, default=10, help="top-N processes (0: none)")
+    ap.add_argument("--process-interval", type=float, default=5.0)
+    args = ap.parse_args()
+    exp = start(args.port, args.host, top_n=args.top, process_interval=args.process_interval)
+    print(f"serving {exp.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exp.stop()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TypedDict, List, Dict, Optional, Literal, Tuple
+from typing import TypedDict, List, Dict, Optional, Literal, Tuple, Iterable
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from enum import Enum
 import datetime
 
@@ -23,7 +24,9 @@ class ParserConfig:
 
 @dataclass
 class ParserState:
-    # IO hızları için önceki sayaçlar
+    # Deprecated: no longer updated. IO rates are tracked per series in
+    # bridge.clean.rate_tracker (engine.rates.RateTracker); last_io_bytes and
+    # last_ts are kept for backward compatibility only.
     last_io_bytes: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # name -> (read_bytes, write_bytes)
     last_ts: Optional[float] = None
     # Process stabilizasyonu vs. için de alan açılabilir
@@ -41,6 +44,17 @@ class SeverityProfile:
     bands: List[SeverityBand] = field(default_factory=list)
     clamp: Tuple[float, float] = (0.0, 100.0)
     higher_is_worse: bool = True
+    _compiled: Optional[Tuple[tuple, "SeverityClassifier"]] = field(default=None, init=False, repr=False, compare=False)
+
+    def compile(self) -> "SeverityClassifier":
+        """validate() + SeverityClassifier; rebuilt only when bands/clamp/direction change."""
+        key = (tuple(self.bands), tuple(self.clamp), self.higher_is_worse)
+        if self._compiled is not None and self._compiled[0] == key:
+            return self._compiled[1]
+        self.validate()
+        clf = SeverityClassifier(self)
+        self._compiled = (key, clf)
+        return clf
     
     def validate(self) -> None:
         eps = 1e-9
@@ -91,22 +105,66 @@ class SeverityProfile:
                 f"[{self.name}] son band clamp.max’e kadar gitmiyor: son={prev_max}, clamp.max={hi}"
             )
     
+class SeverityClassifier:
+    """
+    Compiled form of a validated SeverityProfile: band lower edges sorted for
+    bisect. classify(v) matches the linear band scan; classify_many(values)
+    labels a whole column (None stays None).
+    """
+
+    __slots__ = ("lo", "hi", "higher_is_worse", "_edges", "_labels", "_top", "_fallback")
+
+    def __init__(self, profile: SeverityProfile):
+        bands = sorted(profile.bands, key=lambda b: b.min_inclusive)
+        self.lo, self.hi = profile.clamp
+        self.higher_is_worse = profile.higher_is_worse
+        self._edges = [b.min_inclusive for b in bands[1:]]
+        self._labels = [b.label for b in bands]
+        self._top = bands[-1].max_exclusive
+        # hiçbir banda düşmeyen (ör. v == clamp.max) değer listedeki son bandı alır
+        self._fallback = profile.bands[-1].label
+
+    def classify(self, value: float) -> SeverityLevel:
+        lo, hi = self.lo, self.hi
+        v = lo if value < lo else hi if value > hi else value
+        if not self.higher_is_worse:
+            v = hi - (v - lo)
+        if v >= self._top:
+            return self._fallback
+        return self._labels[bisect_right(self._edges, v)]
+
+    def classify_many(self, values: Iterable[Optional[float]]) -> List[Optional[SeverityLevel]]:
+        lo, hi, top = self.lo, self.hi, self._top
+        edges, labels, fallback = self._edges, self._labels, self._fallback
+        invert = not self.higher_is_worse
+        out = []
+        append = out.append
+        for value in values:
+            if value is None:
+                append(None)
+                continue
+            v = lo if value < lo else hi if value > hi else value
+            if invert:
+                v = hi - (v - lo)
+            append(fallback if v >= top else labels[bisect_right(edges, v)])
+        return out
+
 def make_default_config() -> ParserConfig:
     bands = [
         SeverityBand(0.0, 50.0,  SeverityLevel.OK),
         SeverityBand(50.0, 75.0, SeverityLevel.INFO),
         SeverityBand(75.0, 85.0, SeverityLevel.WARN),
-        SeverityBand(85.0, 101.0, SeverityLevel.CRIT),  # 100'ü kapsasın diye 101
+        SeverityBand(85.0, 100.0, SeverityLevel.CRIT),  # 100 (clamp.max) son banda düşer
     ]
 
     cpu_profile  = SeverityProfile(name="cpu_percent",  bands=bands, clamp=(0.0, 100.0), higher_is_worse=True)
     mem_profile  = SeverityProfile(name="mem_percent",  bands=bands, clamp=(0.0, 100.0), higher_is_worse=True)
     disk_profile = SeverityProfile(name="disk_percent", bands=bands, clamp=(0.0, 100.0), higher_is_worse=True)
 
-    # validate hepsini
-    cpu_profile.validate()
-    mem_profile.validate()
-    disk_profile.validate()
+    # validate + derle
+    cpu_profile.compile()
+    mem_profile.compile()
+    disk_profile.compile()
 
     cfg = ParserConfig(
         profiles={
@@ -152,10 +210,22 @@ class Parser(ABC):
         pass
     
     def severity_for(self, metric: Literal["cpu", "mem", "disk"], value: float) -> SeverityLevel:
-        profile = self.config.profiles.get(metric)
-        if profile is None:
+        clf = self.classifier(metric)
+        if clf is None:
             return SeverityLevel.OK
-        return self.severity_from_percent(value, profile)
+        return clf.classify(value)
+
+    def severity_for_many(self, metric: Literal["cpu", "mem", "disk"],
+                          values: Iterable[Optional[float]]) -> List[Optional[SeverityLevel]]:
+        """severity_for over a column (per-CPU percents, mounts, process table)."""
+        clf = self.classifier(metric)
+        if clf is None:
+            return [None if v is None else SeverityLevel.OK for v in values]
+        return clf.classify_many(values)
+
+    def classifier(self, metric: str) -> Optional[SeverityClassifier]:
+        profile = self.config.profiles.get(metric)
+        return profile.compile() if profile is not None else None
     
     @abstractmethod
     def shorten_path(self, path: str, max_len: Optional[int] = None) -> str:
@@ -167,7 +237,25 @@ class Parser(ABC):
         pass
 
 class SimpleParse(Parser):
+    CTIME_MEMO_SIZE = 4096
+
+    # ---- tekil ----
     def format_ctime(self, epoch: float) -> str:
+        memo = self._ctime_memo()
+        try:
+            return memo[epoch]
+        except KeyError:
+            pass
+        except TypeError:  # hashlenemeyen girdi
+            return self._format_ctime(epoch)
+        out = self._format_ctime(epoch)
+        if len(memo) >= self.CTIME_MEMO_SIZE:
+            memo.clear()
+        memo[epoch] = out
+        return out
+
+    @staticmethod
+    def _format_ctime(epoch: float) -> str:
         try:
             dt = datetime.datetime.fromtimestamp(epoch)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -175,17 +263,11 @@ class SimpleParse(Parser):
             return "-"
 
     def format_bytes(self, value: int) -> str:
-        units = ["B", "KiB", "MiB", "GiB", "TiB"] if self.config.use_binary_units else ["B", "KB", "MB", "GB", "TB"]
-        step = 1024 if self.config.use_binary_units else 1000
-        
-        num = float(value) 
-        for unit in units:
-            if abs(num) < step:
-                return f"{num:.1f} {unit}"
-            else:
-                num /= step
-        return f"{num:.1f} {units[-1]}"
-            
+        limits, divisors, units = self._byte_units()
+        num = float(value)
+        i = bisect_right(limits, abs(num))
+        return f"{num / divisors[i]:.1f} {units[i]}"
+
     def format_percent(self, value: List[float], 
                         decimals: Optional[int] = None,
                         part: str = "CPU: "):          
@@ -193,8 +275,89 @@ class SimpleParse(Parser):
             decimals = self.config.percent_decimals
         if isinstance(value, (int, float)):
             return f"{part}{max(0.0, min(100.0, round(value, decimals)))}%"
-        return [f"{part}{idx}: {max(0.0, min(100.0, round(v, decimals)))}%" for idx, v in enumerate(value)]    
-    
+        return self.format_percent_many(value, decimals, part=part, indexed=True)
+
+    # ---- toplu (kolon) ----
+    def format_bytes_many(self, values: Iterable[Optional[int]], none: Optional[str] = None) -> List[str]:
+        """format_bytes over a whole column; None values become `none`."""
+        limits, divisors, units = self._byte_units()
+        out = []
+        append = out.append
+        for v in values:
+            if v is None:
+                append(none)
+                continue
+            num = float(v)
+            i = bisect_right(limits, abs(num))
+            append(f"{num / divisors[i]:.1f} {units[i]}")
+        return out
+
+    def format_percent_many(self, values: Iterable[Optional[float]],
+                            decimals: Optional[int] = None,
+                            part: str = "",
+                            indexed: bool = False,
+                            none: Optional[str] = None) -> List[str]:
+        """
+        format_percent over a column. indexed=True gives the per-CPU form
+        '{part}{idx}: x%'; None values become `none`.
+        """
+        if decimals is None:
+            decimals = self.config.percent_decimals
+        out = []
+        append = out.append
+        for idx, v in enumerate(values):
+            if v is None:
+                append(none)
+                continue
+            v = max(0.0, min(100.0, round(v, decimals)))
+            append(f"{part}{idx}: {v}%" if indexed else f"{part}{v}%")
+        return out
+
+    def format_ctime_many(self, values: Iterable[Optional[float]], none: str = "-") -> List[str]:
+        """format_ctime over a column; repeated epochs are served from the memo."""
+        memo = self._ctime_memo()
+        fmt = self._format_ctime
+        out = []
+        append = out.append
+        for v in values:
+            if v is None:
+                append(none)
+                continue
+            try:
+                r = memo.get(v)
+            except TypeError:  # hashlenemeyen girdi; format_ctime gibi memo'suz
+                append(fmt(v))
+                continue
+            if r is None:
+                r = fmt(v)
+                if len(memo) >= self.CTIME_MEMO_SIZE:
+                    memo.clear()
+                memo[v] = r
+            append(r)
+        return out
+
+    # ---- önhesap ----
+    def _byte_units(self) -> Tuple[List[float], List[float], List[str]]:
+        """(limits, divisors, units) for the current unit system, computed once."""
+        binary = self.config.use_binary_units
+        cached = self.__dict__.get("_byte_table")
+        if cached is not None and cached[0] == binary:
+            return cached[1]
+        units = ["B", "KiB", "MiB", "GiB", "TiB"] if binary else ["B", "KB", "MB", "GB", "TB"]
+        step = 1024 if binary else 1000
+        # i. birim: abs(v) < step**(i+1); son birim üst sınırsız
+        limits = [float(step ** (i + 1)) for i in range(len(units) - 1)]
+        divisors = [float(step ** i) for i in range(len(units))]
+        table = (limits, divisors, units)
+        self._byte_table = (binary, table)
+        return table
+
+    def _ctime_memo(self) -> Dict[float, str]:
+        memo = self.__dict__.get("_ctime_cache")
+        if memo is None:
+            memo = self._ctime_cache = {}
+        return memo
+
     def format_freq(self, mhz: Optional[float]) -> str:
         units = ["MHz", "GHz"]
         for unit in units:
@@ -204,14 +367,8 @@ class SimpleParse(Parser):
                 return f"{round((mhz / 1000), 2)} GHz"
             
     def severity_from_percent(self, value: float, profile: SeverityProfile) -> SeverityLevel:
-        lo, hi = profile.clamp      
-        v = min(max(value, lo), hi)
-        if not profile.higher_is_worse:
-            v = hi - (v - lo)
-        for band in profile.bands:
-            if band.min_inclusive <= v < band.max_exclusive:
-                return band.label
-        return profile.bands[-1].label
+        return profile.compile().classify(value)
+
     def shorten_path(self, path, max_len = None):
         r"""
         Uzun dosya yolunu kısaltır.
@@ -233,6 +390,9 @@ class SimpleParse(Parser):
         - Ellipsis unicode '…' (1 char). İstersen '...' kullan.
         """
         s = path if isinstance(path, str) else str(path)
+        if max_len is None:
+            max_len = self.config.shorten_len
+        ellipsis = "…"
         if max_len <= 0:
             return ""
         if len(s) <= max_len:
@@ -291,7 +451,7 @@ class SimpleParse(Parser):
             elif len(pfx) == 2 and pfx.endswith(":"):  # Drive
                 out = pfx + ("/" + "/".join(segs) if segs else "")
             else:
-                out = (pfx + "/") if pfx else ""
+                out = pfx if pfx.endswith("/") else (pfx + "/") if pfx else ""
                 out += "/".join(segs)
             return out.replace("/", orig_sep)
 
@@ -0,0 +1,67 @@
+# bridge/views.py
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional
+
+Formatter = Callable[[Any], Any]
+
+
+class FormattedView(Mapping):
+    """
+    Read-only mapping over a raw numeric record. A field is formatted the
+    first time it is read (fields[k], or `default` for the rest) and then
+    memoized; None values and fields without a formatter pass through.
+    `.raw` is the underlying record.
+    """
+
+    __slots__ = ("raw", "_fields", "_default", "_cache")
+
+    def __init__(self, raw: Mapping, fields: Dict[str, Formatter], default: Optional[Formatter] = None):
+        self.raw = raw
+        self._fields = fields
+        self._default = default
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        v = self.raw[key]
+        fn = self._fields.get(key, self._default)
+        if fn is not None and v is not None:
+            v = fn(v)
+        self._cache[key] = v
+        return v
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: self[k] for k in self.raw}
+
+    def __repr__(self) -> str:
+        return f"FormattedView({self.to_dict()!r})"
+
+
+class FormatSpec:
+    """Formatter table for one record kind; view()/format() share it."""
+
+    __slots__ = ("fields", "default")
+
+    def __init__(self, fields: Dict[str, Formatter], default: Optional[Formatter] = None):
+        self.fields = fields
+        self.default = default
+
+    def view(self, raw: Mapping) -> FormattedView:
+        return FormattedView(raw, self.fields, self.default)
+
+    def format(self, raw: Mapping) -> Dict[str, Any]:
+        fields, default = self.fields, self.default
+        out = {}
+        for k, v in raw.items():
+            fn = fields.get(k, default)
+            out[k] = fn(v) if fn is not None and v is not None else v
+        return out
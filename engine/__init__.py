@@ -9,22 +9,87 @@ Kullanım örneği:
     cpu = CPU()
     print(cpu.get_percent())
 
+Alt modüller ilk erişimde yüklenir; `import engine` hiçbir iş yapmaz.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from .cpu import CPU
-from .memory import Memory
-from .disk import Disk
-from .processes import ProcessManager, ProcessDetail
-from .network import Network
-from .sensors import Sensors
-from .system import System
-from .winservices import WinServices
+# ad -> tanımlandığı alt modül
+_LAZY = {
+    "CPU": ".cpu",
+    "Memory": ".memory",
+    "Disk": ".disk",
+    "ProcessManager": ".processes",
+    "ProcessDetail": ".processes",
+    "ColumnFormatter": ".processes",
+    "ProcfsReader": ".procfs",
+    "ProcessTable": ".proctable",
+    "ProcessDelta": ".proctable",
+    "ProcessSnapshot": ".snapshot",
+    "ProcessTree": ".proctree",
+    "ShardedReader": ".parallel",
+    "RateTracker": ".rates",
+    "Instruments": ".instrument",
+    "instruments": ".instrument",
+    "Recorder": ".record",
+    "RecordingLog": ".record",
+    "RecordingReader": ".record",
+    "Player": ".record",
+    "ReplayReader": ".record",
+    "NameCache": ".usercache",
+    "name_cache": ".usercache",
+    "Network": ".network",
+    "NetstatReader": ".netstat",
+    "SocketIndex": ".inodes",
+    "Sensors": ".sensors",
+    "System": ".system",
+    "WinServices": ".winservices",
+}
 
 __all__ = [
     "CPU", "Memory", "Disk",
-    "ProcessManager", "ProcessDetail",
-    "Network", "Sensors", "System",
+    "ProcessManager", "ProcessDetail", "ColumnFormatter", "ProcfsReader",
+    "ProcessTable", "ProcessDelta", "ProcessSnapshot", "ProcessTree",
+    "ShardedReader", "RateTracker", "Instruments", "instruments", "NameCache", "name_cache",
+    "Recorder", "RecordingLog", "RecordingReader", "Player", "ReplayReader",
+    "Network", "NetstatReader", "SocketIndex", "Sensors", "System",
     "WinServices",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if TYPE_CHECKING:
+    from .cpu import CPU
+    from .memory import Memory
+    from .disk import Disk
+    from .processes import ProcessManager, ProcessDetail, ColumnFormatter
+    from .procfs import ProcfsReader
+    from .proctable import ProcessTable, ProcessDelta
+    from .snapshot import ProcessSnapshot
+    from .proctree import ProcessTree
+    from .parallel import ShardedReader
+    from .rates import RateTracker
+    from .instrument import Instruments, instruments
+    from .record import Recorder, RecordingLog, RecordingReader, Player, ReplayReader
+    from .usercache import NameCache, name_cache
+    from .network import Network
+    from .netstat import NetstatReader
+    from .inodes import SocketIndex
+    from .sensors import Sensors
+    from .system import System
+    from .winservices import WinServices
@@ -0,0 +1,240 @@
+# columnar.py
+import heapq
+from array import array
+from itertools import compress
+from typing import List, Dict, Any, Iterable, Optional, Callable, Sequence
+
+# kolon tipleri
+NUM = "num"    # array('q') / array('d'); sayısal olmayan değerler missing'de tutulur
+CODE = "code"  # array('i') kodları + vocab (name, username, status...)
+OBJ = "obj"    # düz liste (cmdline gibi)
+
+
+class ColumnarSnapshot:
+    """
+    Column-oriented copy of a process snapshot.
+    Numeric fields live in array.array, string fields as interned codes; sort,
+    filter, limit and projection work on row indices and only materialize the
+    rows that are returned.
+    """
+
+    def __init__(self, size: int, fields: List[str], kinds: Dict[str, str],
+                 columns: Dict[str, Any], vocab: Dict[str, List[Any]],
+                 missing: Dict[str, Dict[int, Any]]):
+        self._size = size
+        self.fields = fields
+        self._kinds = kinds
+        self._cols = columns
+        self._vocab = vocab
+        self._missing = missing
+        self._vocab_index: Dict[str, Dict[Any, int]] = {}
+        self._pid_order: Optional[List[int]] = None
+        self._ranks: Dict[str, array] = {}
+        # (by, reverse) -> sıralı indeks öneki; snapshot başına bir kez hesaplanır
+        self._ranked: Dict[tuple, List[int]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict[str, Any]], fields: Optional[Iterable[str]] = None) -> "ColumnarSnapshot":
+        fields = list(fields) if fields is not None else (list(rows[0].keys()) if rows else [])
+        kinds: Dict[str, str] = {}
+        columns: Dict[str, Any] = {}
+        vocab: Dict[str, List[Any]] = {}
+        missing: Dict[str, Dict[int, Any]] = {}
+        for f in fields:
+            vals = [r.get(f) for r in rows]
+            n_num = n_float = n_other = 0
+            for v in vals:
+                if v is None or isinstance(v, str):
+                    continue
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    n_num += 1
+                    if isinstance(v, float):
+                        n_float += 1
+                else:
+                    n_other += 1
+            if n_other:
+                kinds[f] = OBJ
+                columns[f] = vals
+            elif n_num:
+                # erişim hatası ("-") ve None değerleri ayrı tutulur
+                miss = {i: v for i, v in enumerate(vals) if v is None or isinstance(v, str)}
+                if miss:
+                    vals = [0 if i in miss else v for i, v in enumerate(vals)]
+                kinds[f] = NUM
+                columns[f] = array("d" if n_float else "q", vals)
+                missing[f] = miss
+            else:
+                index: Dict[Any, int] = {}
+                codes = array("i", [index.setdefault(v, len(index)) for v in vals])
+                kinds[f] = CODE
+                columns[f] = codes
+                vocab[f] = list(index)
+        return cls(len(rows), fields, kinds, columns, vocab, missing)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ---- erişim ----
+    def _getter(self, field: str) -> Callable[[int], Any]:
+        kind = self._kinds.get(field)
+        if kind is None:
+            return lambda i: None
+        col = self._cols[field]
+        if kind == CODE:
+            vocab = self._vocab[field]
+            return lambda i: vocab[col[i]]
+        if kind == NUM and self._missing[field]:
+            miss = self._missing[field]
+            return lambda i: miss[i] if i in miss else col[i]
+        return col.__getitem__
+
+    def column(self, field: str) -> List[Any]:
+        return list(map(self._getter(field), range(self._size)))
+
+    def rows(self, index: Optional[Iterable[int]] = None, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        index = range(self._size) if index is None else list(index)
+        fields = fields or self.fields
+        cols = [list(map(self._getter(f), index)) for f in fields]
+        return [dict(zip(fields, vals)) for vals in zip(*cols)] if fields else [{} for _ in index]
+
+    # ---- filtre ----
+    def select(self, field: str, value: Any, index: Optional[Iterable[int]] = None) -> List[int]:
+        """Indices whose field equals value."""
+        kind = self._kinds.get(field)
+        if kind is None:
+            return [] if value is not None else list(range(self._size) if index is None else index)
+        if kind == CODE:
+            lookup = self._vocab_index.get(field)
+            if lookup is None:
+                lookup = self._vocab_index[field] = {v: c for c, v in enumerate(self._vocab[field])}
+            code = lookup.get(value)
+            if code is None:
+                return []
+            codes = self._cols[field]
+            if index is None:
+                return list(compress(range(self._size), map(code.__eq__, codes)))
+            return [i for i in index if codes[i] == code]
+        get = self._getter(field)
+        candidates = range(self._size) if index is None else index
+        return [i for i in candidates if get(i) == value]
+
+    # ---- sıralama ----
+    def _by_pid(self, index: Optional[Iterable[int]], reverse: bool) -> List[int]:
+        if index is None:
+            if self._pid_order is None:
+                pid = self._cols.get("pid")
+                base = range(self._size)
+                self._pid_order = sorted(base, key=pid.__getitem__) if self._kinds.get("pid") == NUM else list(base)
+            return self._pid_order[::-1] if reverse else self._pid_order
+        if self._kinds.get("pid") != NUM:
+            return list(index)
+        return sorted(index, key=self._cols["pid"].__getitem__, reverse=reverse)
+
+    def _rank(self, field: str) -> array:
+        """Per-row sort rank of a coded column (vocab sorted once)."""
+        ranks = self._ranks.get(field)
+        if ranks is None:
+            vocab = self._vocab[field]
+            order = sorted(range(len(vocab)), key=lambda c: (vocab[c] is None, str(vocab[c])))
+            code_rank = array("i", bytes(4 * len(vocab)))
+            for r, c in enumerate(order):
+                code_rank[c] = r
+            ranks = self._ranks[field] = array("i", map(code_rank.__getitem__, self._cols[field]))
+        return ranks
+
+    def order(self, by: str, reverse: bool = True, index: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Row indices sorted like sorted(rows, key=(v is None, v, pid), reverse=reverse):
+        missing values first when reverse, last otherwise; ties broken by pid.
+        """
+        if index is not None:
+            return self._order(by, reverse, index)
+        ranked = self._ranked.get((by, reverse))
+        if ranked is None or len(ranked) < self._size:
+            ranked = self._ranked[(by, reverse)] = self._order(by, reverse, None)
+        return list(ranked)
+
+    def _order(self, by: str, reverse: bool, index: Optional[Iterable[int]]) -> List[int]:
+        base = self._by_pid(index, reverse)
+        kind = self._kinds.get(by)
+        if kind is None:
+            return list(base)
+        col = self._cols[by]
+        if kind == NUM:
+            miss = self._missing[by]
+            if not miss:
+                return sorted(base, key=col.__getitem__, reverse=reverse)
+            present = [i for i in base if i not in miss]
+            absent = [i for i in base if i in miss]
+            ordered = sorted(present, key=col.__getitem__, reverse=reverse)
+            return absent + ordered if reverse else ordered + absent
+        if kind == CODE:
+            vocab = self._vocab[by]
+            ranks = self._rank(by)
+            absent_code = {c for c, v in enumerate(vocab) if v is None}
+            if not absent_code:
+                return sorted(base, key=ranks.__getitem__, reverse=reverse)
+            present = [i for i in base if col[i] not in absent_code]
+            absent = [i for i in base if col[i] in absent_code]
+            ordered = sorted(present, key=ranks.__getitem__, reverse=reverse)
+            return absent + ordered if reverse else ordered + absent
+        pid = self._getter("pid")
+        return sorted(base, key=lambda i: (col[i] is None, col[i], pid(i)), reverse=reverse)
+
+    def _sort_key(self, by: str):
+        """(key func, missing predicate) for by; None if only a full sort applies."""
+        kind = self._kinds.get(by)
+        if kind == NUM:
+            miss = self._missing[by]
+            return self._cols[by].__getitem__, (miss.__contains__ if miss else None)
+        if kind == CODE:
+            col = self._cols[by]
+            absent_code = {c for c, v in enumerate(self._vocab[by]) if v is None}
+            return self._rank(by).__getitem__, ((lambda i: col[i] in absent_code) if absent_code else None)
+        return None
+
+    def top(self, by: str, k: int, reverse: bool = True, index: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        First k indices of order(by, reverse) using a bounded heap instead of a
+        full sort. Results over the whole snapshot are cached per (by, reverse),
+        so repeated top-N queries on the same snapshot are a slice.
+        """
+        k = max(0, k)
+        cache_key = (by, reverse)
+        if index is None:
+            ranked = self._ranked.get(cache_key)
+            if ranked is not None and (k <= len(ranked) or len(ranked) == self._size):
+                return ranked[:k]
+
+        base = self._by_pid(index, reverse)
+        sk = self._sort_key(by)
+        if by not in self._kinds:
+            out = list(base[:k])
+        elif sk is None or k * 8 >= len(base):
+            out = self.order(by, reverse=reverse, index=index)
+        else:
+            key, is_missing = sk
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            if is_missing is None:
+                out = select(k, base, key=key)
+            else:
+                present = [i for i in base if not is_missing(i)]
+                absent = [i for i in base if is_missing(i)]
+                if reverse:
+                    out = absent[:k] + select(max(0, k - len(absent)), present, key=key)
+                else:
+                    out = select(k, present, key=key)
+                    out += absent[:k - len(out)]
+        if index is None:
+            self._ranked[cache_key] = out
+        return out[:k]
+
+    def query(self, *, sort_by: str = "cpu_percent", reverse: bool = True,
+              limit: Optional[int] = None, fields: Optional[List[str]] = None,
+              user: Optional[str] = None) -> List[Dict[str, Any]]:
+        index = self.select("username", user) if user else None
+        if limit is not None and limit >= 0:
+            idx = self.top(sort_by, limit, reverse=reverse, index=index)
+        else:
+            idx = self.order(sort_by, reverse=reverse, index=index)
+        return self.rows(idx, fields)
@@ -2,9 +2,16 @@
 import psutil
 from typing import List, Union, Optional
 import psutil._common
+from .instrument import instruments
 
+@instruments.instrument_class("cpu")
 class CPU:
     def __init__(self):
+        # ilk get_percent() 0.0 dönmesin; bloklamayan taban ölçümü
+        self.warmup()
+
+    def warmup(self) -> None:
+        """cpu_percent(interval=None) için taban ölçümü al; bloklamaz."""
         psutil.cpu_percent()
         psutil.cpu_percent(percpu=True)
 
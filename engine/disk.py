@@ -2,10 +2,19 @@
 import psutil
 from typing import List, Dict, Optional
 import psutil._common
+from .instrument import instruments
 
+@instruments.instrument_class("disk")
 class Disk:
     def __init__(self):
-        self._partition = psutil.disk_partitions(all=False)
+        self._partitions: Optional[List[psutil._common.sdiskpart]] = None
+
+    @property
+    def _partition(self) -> List[psutil._common.sdiskpart]:
+        # bölümler ilk kullanımda okunur
+        if self._partitions is None:
+            self._partitions = psutil.disk_partitions(all=False)
+        return self._partitions
     
     def get_part(self) -> List[psutil._common.sdiskpart]:
         return self._partition
@@ -14,7 +23,10 @@ class Disk:
         usage_info = {}
         for part in self._partition:
             try:
-                usage_info[part.mountpoint] = psutil.disk_usage(part.mountpoint)
+                # tek istatistik; bağlama noktası yalnızca sürmekte olan çağrıda tutulur,
+                # asılı kalan bir NFS stuck() çıktısında "disk.disk_usage:/mnt/nfs" diye görünür
+                with instruments.timer("disk.disk_usage", detail=part.mountpoint):
+                    usage_info[part.mountpoint] = psutil.disk_usage(part.mountpoint)
             except PermissionError:
                 continue
         return usage_info
@@ -0,0 +1,163 @@
+# history.py
+import threading
+import time
+from array import array
+from typing import List, Dict, Any, Optional, Tuple
+
+
+class RingBuffer:
+    """Fixed-capacity (ts, value) series over two preallocated array('d')."""
+
+    __slots__ = ("capacity", "_ts", "_val", "_head", "_count")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._val = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+
+    def append(self, ts: float, value: float) -> None:
+        i = self._head
+        self._ts[i] = ts
+        self._val[i] = value
+        self._head = i + 1 if i + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _span(self, last: Optional[int]) -> Tuple[int, int]:
+        n = self._count if last is None else max(0, min(last, self._count))
+        return (self._head - n) % self.capacity, n
+
+    def _slice(self, arr: array, last: Optional[int]) -> List[float]:
+        start, n = self._span(last)
+        end = start + n
+        if end <= self.capacity:
+            return arr[start:end].tolist()
+        return arr[start:].tolist() + arr[:end - self.capacity].tolist()
+
+    def values(self, last: Optional[int] = None) -> List[float]:
+        """Oldest first; last=N returns only the newest N."""
+        return self._slice(self._val, last)
+
+    def timestamps(self, last: Optional[int] = None) -> List[float]:
+        return self._slice(self._ts, last)
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        if not self._count:
+            return None
+        i = self._head - 1
+        return self._ts[i], self._val[i]
+
+    @property
+    def nbytes(self) -> int:
+        return 16 * self.capacity
+
+
+class History:
+    """
+    Named ring buffers with a fixed upper bound on memory:
+    max_series * capacity * 16 bytes. Buffers are allocated when a series
+    first appears; appends after that only write into the arrays.
+    """
+
+    def __init__(self, capacity: int = 600, max_series: int = 1024):
+        self.capacity = capacity
+        self.max_series = max_series
+        self._series: Dict[str, RingBuffer] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0  # max_series dolduktan sonra gelen yeni seriler
+
+    @property
+    def max_nbytes(self) -> int:
+        return self.max_series * self.capacity * 16
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._series) * self.capacity * 16
+
+    def series(self, name: str) -> Optional[RingBuffer]:
+        buf = self._series.get(name)
+        if buf is None:
+            with self._lock:
+                buf = self._series.get(name)
+                if buf is None:
+                    if len(self._series) >= self.max_series:
+                        self.dropped += 1
+                        return None
+                    buf = self._series[name] = RingBuffer(self.capacity)
+        return buf
+
+    def append(self, name: str, ts: float, value: float) -> None:
+        buf = self._series.get(name) or self.series(name)
+        if buf is not None:
+            buf.append(ts, value)
+
+    def get(self, name: str) -> Optional[RingBuffer]:
+        return self._series.get(name)
+
+    def names(self, prefix: str = "") -> List[str]:
+        return sorted(n for n in list(self._series) if n.startswith(prefix))
+
+
+class HistoryRecorder:
+    """
+    Samples engine objects into a History. Series names:
+      cpu.total, cpu.<n>                          percent
+      mem.<field>, swap.<field>                   bytes / percent
+      net.<nic>.<field>                           cumulative counters
+      disk.<dev>.<field>                          cumulative counters
+    """
+
+    def __init__(self, history: History, cpu=None, memory=None, disk=None, network=None):
+        self.history = history
+        self.cpu = cpu
+        self.memory = memory
+        self.disk = disk
+        self.network = network
+
+    def _put_fields(self, prefix: str, ts: float, nt: Any) -> None:
+        if nt is None:
+            return
+        append = self.history.append
+        d = nt._asdict() if hasattr(nt, "_asdict") else dict(nt)
+        for k, v in d.items():
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                append(f"{prefix}.{k}", ts, v)
+
+    def record_cpu(self, ts: float, total: Optional[float] = None, percpu: Optional[List[float]] = None) -> None:
+        append = self.history.append
+        if total is not None:
+            append("cpu.total", ts, total)
+        for i, v in enumerate(percpu or ()):
+            append(f"cpu.{i}", ts, v)
+
+    def record_memory(self, ts: float, virtual: Any = None, swap: Any = None) -> None:
+        self._put_fields("mem", ts, virtual)
+        self._put_fields("swap", ts, swap)
+
+    def record_net(self, ts: float, pernic: Optional[Dict[str, Any]]) -> None:
+        for nic, c in (pernic or {}).items():
+            self._put_fields(f"net.{nic}", ts, c)
+
+    def record_disk(self, ts: float, perdisk: Optional[Dict[str, Any]]) -> None:
+        for dev, c in (perdisk or {}).items():
+            self._put_fields(f"disk.{dev}", ts, c)
+
+    def sample(self, ts: Optional[float] = None) -> float:
+        """Poll every attached engine object once and append the results."""
+        ts = time.time() if ts is None else ts
+        if self.cpu is not None:
+            self.record_cpu(ts, self.cpu.get_percent(), self.cpu.get_percent(percpu=True))
+        if self.memory is not None:
+            self.record_memory(ts, self.memory.get_virtual(), self.memory.get_swap())
+        if self.network is not None:
+            self.record_net(ts, self.network.get_io_counters(pernic=True))
+        if self.disk is not None:
+            self.record_disk(ts, self.disk.get_io_counters(perdisk=True))
+        return ts
@@ -0,0 +1,182 @@
+# inodes.py
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .proctable import ProcessDelta
+
+
+class SocketIndex:
+    """
+    socket inode -> (pid, fd), kept per pid so only new or gone processes
+    cost anything:
+
+    - sync_pids() / apply_delta() / follow(snapshot) scan new pids and drop
+      gone ones (ProcessManager deltas also catch pid reuse)
+    - resolve(inodes) serves hits from the index; misses (sockets opened by
+      already-known processes) rescan pids whose fd count changed (st_size of
+      /proc/<pid>/fd on Linux >= 6.2) or that were not scanned within
+      rescan_interval, busiest first, stopping once every miss is found;
+      inodes still unowned after a full pass (e.g. other users' sockets
+      without root) are not looked for again until rescan_interval passes
+    """
+
+    def __init__(self, root: str = "/proc", rescan_interval: float = 2.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.root = root
+        self.rescan_interval = rescan_interval
+        self.clock = clock
+        self._by_pid: Dict[int, Dict[int, int]] = {}       # pid -> {inode: fd}
+        self._owner: Dict[int, Tuple[int, int]] = {}        # inode -> (pid, fd)
+        self._scanned: Dict[int, float] = {}                # pid -> son tarama zamanı
+        self._nfds: Dict[int, int] = {}                     # pid -> taramadaki fd sayısı
+        self._unowned: Dict[int, float] = {}                # inode -> bulunamadığı zaman
+        self._version = 0
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    # ---- tarama ----
+    def _read_fds(self, pid: int) -> Tuple[Dict[int, int], int]:
+        socks: Dict[int, int] = {}
+        try:
+            dfd = os.open(f"{self.root}/{pid}/fd", os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return socks, 0  # süreç bitti ya da izin yok
+        names = []
+        try:
+            names = os.listdir(dfd)
+            for name in names:
+                try:
+                    target = os.readlink(name, dir_fd=dfd)
+                except OSError:
+                    continue
+                if target.startswith("socket:["):
+                    socks[int(target[8:-1])] = int(name)
+        except OSError:
+            pass
+        finally:
+            os.close(dfd)
+        return socks, len(names)
+
+    def _fd_count(self, pid: int) -> int:
+        """Open fd count from the directory size; 0 where the kernel does not report it."""
+        try:
+            return os.stat(f"{self.root}/{pid}/fd").st_size
+        except OSError:
+            return 0
+
+    def _scan(self, pid: int) -> None:
+        socks, nfds = self._read_fds(pid)
+        self._nfds[pid] = nfds
+        self.scans += 1
+        old = self._by_pid.get(pid)
+        if old:
+            for inode in old:
+                if self._owner.get(inode, (None,))[0] == pid:
+                    del self._owner[inode]
+        self._by_pid[pid] = socks
+        self._scanned[pid] = self.clock()
+        for inode, fd in socks.items():
+            self._owner[inode] = (pid, fd)
+
+    def _drop(self, pid: int) -> None:
+        for inode in self._by_pid.pop(pid, ()):
+            if self._owner.get(inode, (None,))[0] == pid:
+                del self._owner[inode]
+        self._scanned.pop(pid, None)
+        self._nfds.pop(pid, None)
+
+    # ---- pid değişimi ----
+    def sync_pids(self, pids: Optional[Iterable[int]] = None) -> None:
+        """Scan pids not seen before and drop those that are gone."""
+        if pids is None:
+            pids = [int(n) for n in os.listdir(self.root) if n.isdigit()]
+        live = set(pids)
+        with self._lock:
+            for pid in [p for p in self._by_pid if p not in live]:
+                self._drop(pid)
+            for pid in live:
+                if pid not in self._by_pid:
+                    self._scan(pid)
+
+    def apply_delta(self, delta: ProcessDelta) -> None:
+        """Apply a ProcessManager delta: removed keys are dropped, added keys scanned."""
+        with self._lock:
+            for pid, _ in delta.removed:
+                self._drop(pid)
+            for pid, _ in delta.added:
+                self._scan(pid)
+
+    def follow(self, snapshot) -> None:
+        """Catch up with a ProcessSnapshot; a skipped version falls back to sync_pids."""
+        if snapshot.version == self._version:
+            return
+        if self._version and snapshot.version == self._version + 1 and snapshot.delta is not None:
+            self.apply_delta(snapshot.delta)
+        else:
+            self.sync_pids(r["pid"] for r in snapshot.rows)
+        self._version = snapshot.version
+
+    @property
+    def following(self) -> bool:
+        """True once fed from ProcessManager snapshots (follow())."""
+        return self._version > 0
+
+    # ---- sorgu ----
+    def lookup(self, inode: int) -> Optional[Tuple[int, int]]:
+        return self._owner.get(inode)
+
+    def pid_sockets(self, pid: int) -> Dict[int, int]:
+        return dict(self._by_pid.get(pid, {}))
+
+    def resolve(self, inodes: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+        """inode -> (pid, fd) for every inode that belongs to a process."""
+        wanted = {i for i in inodes if i}
+        owner = self._owner
+        found = {i: owner[i] for i in wanted if i in owner}
+        missing = wanted - found.keys()
+        if not missing:
+            return found
+        now = self.clock()
+        cutoff = now - self.rescan_interval
+        unowned = self._unowned
+        missing = {i for i in missing if unowned.get(i, cutoff) <= cutoff}
+        if not missing:
+            return found
+        with self._lock:
+            stale = []
+            for p, t in self._scanned.items():
+                if t <= cutoff:
+                    stale.append(p)
+                else:
+                    n = self._fd_count(p)
+                    if n and n != self._nfds.get(p):
+                        stale.append(p)
+            # soket açan süreçler genelde yenilerini de açar: en kalabalık önce
+            stale.sort(key=lambda p: len(self._by_pid.get(p, ())), reverse=True)
+            for pid in stale:
+                self._scan(pid)
+                for i in missing.intersection(self._by_pid[pid]):
+                    found[i] = owner[i]
+                    missing.discard(i)
+                if not missing:
+                    break
+            # tam bir geçişte de bulunamadı: bir rescan_interval boyunca arama
+            for i in [i for i, t in unowned.items() if t <= cutoff]:
+                del unowned[i]
+            for i in missing:
+                unowned[i] = now
+        return found
+
+    def stats(self) -> Dict[str, int]:
+        return {"pids": len(self._by_pid), "sockets": len(self._owner), "scans": self.scans}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_pid.clear()
+            self._owner.clear()
+            self._scanned.clear()
+            self._nfds.clear()
+            self._unowned.clear()
+            self._version = 0
@@ -0,0 +1,272 @@
+# instrument.py
+import functools
+import itertools
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# saniye cinsinden kova üst sınırları (1-2.5-5 dizisi, 50 µs .. 30 s); sonrası +Inf
+BUCKETS = (
+    50e-6, 100e-6, 250e-6, 500e-6,
+    1e-3, 2.5e-3, 5e-3, 10e-3, 25e-3, 50e-3, 100e-3, 250e-3, 500e-3,
+    1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; quantiles interpolate inside a bucket."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lo = BUCKETS[i - 1] if i else 0.0
+                hi = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return min(lo + (hi - lo) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+    def buckets(self) -> List[tuple]:
+        """Cumulative (upper bound, count) pairs, Prometheus style; last bound is inf."""
+        out, acc = [], 0
+        for bound, n in zip(BUCKETS + (float("inf"),), self.counts):
+            acc += n
+            out.append((bound, acc))
+        return out
+
+
+class _Stat:
+    __slots__ = ("hist", "errors", "inflight", "last_error", "last_seconds", "lock")
+
+    def __init__(self):
+        self.hist = Histogram()
+        self.errors: Dict[str, int] = {}
+        self.inflight: Dict[int, tuple] = {}   # token -> (başlangıç, ayrıntı ya da None)
+        self.last_error: Optional[str] = None
+        self.last_seconds: Optional[float] = None
+        self.lock = threading.Lock()
+
+
+class Instruments:
+    """
+    Per-collector call counts, latency histograms, error counts by exception
+    type and in-flight calls (a hung collector shows up as an old in-flight
+    call before it returns). Plus the monitor's own CPU and RSS.
+    """
+
+    def __init__(self, enabled: bool = True, clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self._stats: Dict[str, _Stat] = {}
+        self._lock = threading.Lock()
+        self._tokens = itertools.count()
+        self._started = time.monotonic()
+        self._proc = None
+        self._last_cpu: Optional[tuple] = None  # (monotonic, cpu saniyesi)
+
+    def _stat(self, name: str) -> _Stat:
+        s = self._stats.get(name)
+        if s is None:
+            with self._lock:
+                s = self._stats.setdefault(name, _Stat())
+        return s
+
+    # ---- ölçüm ----
+    def _begin(self, s: _Stat, detail: Optional[str] = None) -> tuple:
+        token = next(self._tokens)
+        t0 = self.clock()
+        with s.lock:
+            s.inflight[token] = (t0, detail)
+        return token, t0
+
+    def _end(self, s: _Stat, token: int, t0: float, exc: Optional[BaseException]) -> None:
+        dt = self.clock() - t0
+        with s.lock:
+            s.inflight.pop(token, None)
+            s.hist.add(dt)
+            s.last_seconds = dt
+            if exc is not None:
+                kind = type(exc).__name__
+                s.errors[kind] = s.errors.get(kind, 0) + 1
+                s.last_error = f"{kind}: {exc}"
+
+    @contextmanager
+    def timer(self, name: str, detail: Optional[str] = None):
+        """
+        with instruments.timer("disk.disk_usage", detail="/mnt"): ...
+        detail only tags the in-flight entry (stuck() reports "name:detail");
+        counts and histograms stay under `name`, so the table stays bounded.
+        """
+        if not self.enabled:
+            yield
+            return
+        s = self._stat(name)
+        token, t0 = self._begin(s, detail)
+        exc = None
+        try:
+            yield
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            self._end(s, token, t0, exc)
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        s = self._stat(name)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            token, t0 = self._begin(s)
+            try:
+                out = fn(*args, **kwargs)
+            except BaseException as e:
+                self._end(s, token, t0, e)
+                raise
+            self._end(s, token, t0, None)
+            return out
+
+        wrapper.__wrapped_name__ = name
+        return wrapper
+
+    def instrumented(self, name: str) -> Callable[[Callable], Callable]:
+        """Function decorator: @instruments.instrumented("bridge.getvirt")."""
+        return lambda fn: self.wrap(name, fn)
+
+    def instrument_class(self, prefix: str, include: Iterable[str] = (), exclude: Iterable[str] = ()):
+        """
+        Class decorator wrapping every public method (plus `include`) as
+        "<prefix>.<method>". Properties and static/class methods are left alone.
+        """
+        include, exclude = set(include), set(exclude)
+
+        def deco(cls):
+            for attr, value in list(vars(cls).items()):
+                if attr in exclude or not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+                    continue
+                if attr.startswith("_") and attr not in include:
+                    continue
+                setattr(cls, attr, self.wrap(f"{prefix}.{attr}", value))
+            return cls
+
+        return deco
+
+    # ---- okuma ----
+    def stats(self, prefix: str = "") -> Dict[str, Dict[str, Any]]:
+        now = self.clock()
+        out = {}
+        for name, s in list(self._stats.items()):
+            if not name.startswith(prefix):
+                continue
+            with s.lock:
+                h = s.hist
+                oldest = min((t0 for t0, _ in s.inflight.values()), default=None)
+                out[name] = {
+                    "calls": h.count,
+                    "errors": dict(s.errors),
+                    "error_count": sum(s.errors.values()),
+                    "in_flight": len(s.inflight),
+                    "oldest_in_flight_s": None if oldest is None else now - oldest,
+                    "total_s": h.sum,
+                    "mean_s": h.sum / h.count if h.count else None,
+                    "p50_s": h.quantile(0.5),
+                    "p90_s": h.quantile(0.9),
+                    "p99_s": h.quantile(0.99),
+                    "max_s": h.max if h.count else None,
+                    "last_s": s.last_seconds,
+                    "last_error": s.last_error,
+                }
+        return out
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        s = self._stats.get(name)
+        return s.hist if s is not None else None
+
+    def stuck(self, older_than: float = 5.0) -> Dict[str, float]:
+        """
+        name -> age (s) of the oldest call still running for longer than
+        older_than; calls timed with a detail are keyed "name:detail".
+        """
+        now = self.clock()
+        out: Dict[str, float] = {}
+        for name, s in list(self._stats.items()):
+            with s.lock:
+                running = list(s.inflight.values())
+            for t0, detail in running:
+                age = now - t0
+                if age < older_than:
+                    continue
+                key = name if detail is None else f"{name}:{detail}"
+                if age > out.get(key, 0.0):
+                    out[key] = age
+        return out
+
+    def self_usage(self, update: bool = True) -> Dict[str, Any]:
+        """
+        This process: cpu seconds, cpu % since the previous call, rss, threads,
+        fds. update=False reads without moving the cpu % baseline (exporters).
+        """
+        import psutil
+        if self._proc is None:
+            self._proc = psutil.Process(os.getpid())
+        p = self._proc
+        with p.oneshot():
+            ct = p.cpu_times()
+            mem = p.memory_info()
+            threads = p.num_threads()
+            try:
+                fds = p.num_fds()
+            except (AttributeError, psutil.Error):
+                fds = None
+        now = time.monotonic()
+        cpu_s = ct.user + ct.system
+        last = self._last_cpu
+        if update:
+            self._last_cpu = (now, cpu_s)
+        if last is None:
+            last = (self._started, 0.0)
+        span = now - last[0]
+        return {
+            "cpu_seconds": cpu_s,
+            "cpu_percent": (cpu_s - last[1]) / span * 100.0 if span > 0 else None,
+            "rss": mem.rss,
+            "threads": threads,
+            "fds": fds,
+            "uptime_s": now - self._started,
+        }
+
+    def reset(self) -> None:
+        """Drop counts and histograms; calls still running keep their in-flight entries."""
+        with self._lock:
+            for s in self._stats.values():
+                with s.lock:
+                    s.hist = Histogram()
+                    s.errors.clear()
+                    s.last_error = None
+                    s.last_seconds = None
+
+
+# süreç genelinde tek kayıt; engine sınıfları ve bridge.clean buraya yazar
+instruments = Instruments()
@@ -3,7 +3,9 @@ import psutil
 from typing import List, Union, Optional
 import psutil._common
 import psutil._pslinux
+from .instrument import instruments
 
+@instruments.instrument_class("memory")
 class Memory:
     def get_virtual(self) -> psutil._pslinux.svmem:
         return psutil.virtual_memory()
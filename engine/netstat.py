@@ -0,0 +1,195 @@
+# netstat.py
+import os
+import socket
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# /proc/net/tcp "st" sütunu -> psutil durum adları
+TCP_STATES = {
+    "01": "ESTABLISHED",
+    "02": "SYN_SENT",
+    "03": "SYN_RECV",
+    "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2",
+    "06": "TIME_WAIT",
+    "07": "CLOSE",
+    "08": "CLOSE_WAIT",
+    "09": "LAST_ACK",
+    "0A": "LISTEN",
+    "0B": "CLOSING",
+}
+NONE = "NONE"  # UDP soketlerinin durumu (psutil.CONN_NONE)
+
+# proto dosyası -> (family, type)
+_PROTOS = {
+    "tcp": (socket.AF_INET, socket.SOCK_STREAM),
+    "tcp6": (socket.AF_INET6, socket.SOCK_STREAM),
+    "udp": (socket.AF_INET, socket.SOCK_DGRAM),
+    "udp6": (socket.AF_INET6, socket.SOCK_DGRAM),
+}
+
+# psutil.net_connections kind değerleri (unix hariç)
+KINDS = {
+    "all": ("tcp", "tcp6", "udp", "udp6"),
+    "inet": ("tcp", "tcp6", "udp", "udp6"),
+    "inet4": ("tcp", "udp"),
+    "inet6": ("tcp6", "udp6"),
+    "tcp": ("tcp", "tcp6"),
+    "tcp4": ("tcp",),
+    "tcp6": ("tcp6",),
+    "udp": ("udp", "udp6"),
+    "udp4": ("udp",),
+    "udp6": ("udp6",),
+}
+
+# count(by=...) -> (sütun: 1 local / 2 remote / 3 st, parça: "ip" / "port" / None)
+GROUP_BY = {
+    "status": (3, None),
+    "laddr": (1, "ip"),
+    "lport": (1, "port"),
+    "raddr": (2, "ip"),
+    "rport": (2, "port"),
+    "proto": (0, None),
+}
+
+
+class Conn(NamedTuple):
+    # ilk 7 alan psutil sconn ile aynı sırada
+    fd: Optional[int]
+    family: int
+    type: int
+    laddr: tuple              # (ip, port) ya da ()
+    raddr: tuple
+    status: str
+    pid: Optional[int]
+    uid: Optional[int] = None
+    inode: Optional[int] = None
+    proto: Optional[str] = None  # tcp / tcp6 / udp / udp6
+
+
+class NetstatReader:
+    """
+    Streaming parser for /proc/net/{tcp,tcp6,udp,udp6}. Lines are parsed as
+    they are read, so connections(limit=N) stops after N sockets and count()
+    aggregates without building per-socket objects. No PID mapping.
+    """
+
+    def __init__(self, root: str = "/proc"):
+        self.root = root
+        self._ip_cache: Dict[str, str] = {}
+
+    def available(self) -> bool:
+        return os.path.exists(os.path.join(self.root, "net", "tcp"))
+
+    @staticmethod
+    def protos(kind: str) -> Tuple[str, ...]:
+        try:
+            return KINDS[kind]
+        except KeyError:
+            raise ValueError(f"unsupported kind: {kind!r} (expected one of {sorted(KINDS)})") from None
+
+    def _lines(self, proto: str) -> Iterator[str]:
+        try:
+            f = open(os.path.join(self.root, "net", proto), "r")
+        except (FileNotFoundError, PermissionError):
+            return  # ör. IPv6 kapalı
+        with f:
+            next(f, None)  # başlık
+            yield from f
+
+    # ---- adres çözme ----
+    def _ip(self, hexip: str) -> str:
+        ip = self._ip_cache.get(hexip)
+        if ip is None:
+            raw = bytes.fromhex(hexip)
+            # kernel her 32 bitlik kelimeyi host (little-endian) sırasıyla yazar
+            raw = b"".join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+            ip = socket.inet_ntop(socket.AF_INET if len(raw) == 4 else socket.AF_INET6, raw)
+            if len(self._ip_cache) >= 65536:
+                self._ip_cache.clear()
+            self._ip_cache[hexip] = ip
+        return ip
+
+    def _addr(self, field: str) -> tuple:
+        hexip, _, hexport = field.partition(":")
+        port = int(hexport, 16)
+        if not port:
+            return ()
+        return (self._ip(hexip), port)
+
+    # ---- akış ----
+    def iter_connections(self, kind: str = "inet", states: Optional[Iterable[str]] = None) -> Iterator[Conn]:
+        """Yield Conn rows file by file; states filters by psutil status name."""
+        wanted = set(states) if states is not None else None
+        for proto in self.protos(kind):
+            family, type_ = _PROTOS[proto]
+            is_tcp = type_ == socket.SOCK_STREAM
+            for line in self._lines(proto):
+                parts = line.split()
+                if len(parts) < 10:
+                    continue
+                status = TCP_STATES.get(parts[3], parts[3]) if is_tcp else NONE
+                if wanted is not None and status not in wanted:
+                    continue
+                yield Conn(None, family, type_, self._addr(parts[1]), self._addr(parts[2]),
+                           status, None, int(parts[7]), int(parts[9]), proto)
+
+    def connections(self, kind: str = "inet", limit: Optional[int] = None,
+                    states: Optional[Iterable[str]] = None) -> List[Conn]:
+        it = self.iter_connections(kind, states)
+        if limit is None:
+            return list(it)
+        out = list(islice(it, limit))
+        it.close()
+        return out
+
+    def count(self, kind: str = "inet", by: str = "status",
+              states: Optional[Iterable[str]] = None) -> Dict[object, int]:
+        """
+        Socket counts grouped by status, laddr, lport, raddr, rport or proto.
+        Only the needed columns are split; addresses are decoded once per
+        distinct value at the end. Ports are ints; empty addresses group as None.
+        """
+        try:
+            col, part = GROUP_BY[by]
+        except KeyError:
+            raise ValueError(f"unsupported group: {by!r} (expected one of {sorted(GROUP_BY)})") from None
+        wanted = set(states) if states is not None else None
+        raw: Dict[str, int] = {}
+        for proto in self.protos(kind):
+            is_tcp = proto.startswith("tcp")
+            if not is_tcp and wanted is not None and NONE not in wanted:
+                continue
+            for line in self._lines(proto):
+                parts = line.split(None, 4)
+                if len(parts) < 4:
+                    continue
+                if is_tcp and wanted is not None:
+                    st = parts[3]
+                    if TCP_STATES.get(st, st) not in wanted:
+                        continue
+                if col == 0:
+                    key = proto
+                elif col == 3:
+                    key = parts[3] if is_tcp else ""
+                else:
+                    field = parts[col]
+                    if part == "port":
+                        key = field[-4:]
+                    else:
+                        # port 0 -> adres yok (psutil: ())
+                        key = field[:-5] if field[-4:] != "0000" else ""
+                raw[key] = raw.get(key, 0) + 1
+
+        out: Dict[object, int] = {}
+        for key, n in raw.items():
+            if col == 0:
+                name = key
+            elif col == 3:
+                name = TCP_STATES.get(key, key) if key else NONE
+            elif part == "port":
+                name = int(key, 16) or None
+            else:
+                name = self._ip(key) if key else None
+            out[name] = out.get(name, 0) + n
+        return out
@@ -1,7 +1,23 @@
+import socket
 import psutil
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 
+from .netstat import NetstatReader, Conn, GROUP_BY
+from .inodes import SocketIndex
+from .instrument import instruments
+
+
+def _proto(c) -> str:
+    if c.family == getattr(socket, "AF_UNIX", None):
+        return "unix"
+    base = "tcp" if c.type == socket.SOCK_STREAM else "udp"
+    return base + "6" if c.family == socket.AF_INET6 else base
+
+@instruments.instrument_class("network", exclude=("iter_connections",))
 class Network:
+    def __init__(self):
+        self._netstat: Optional[NetstatReader] = None
+
     def get_io_counters(self, pernic: bool = False, nowrap: bool = True) -> Dict[str, Any]:
         return psutil.net_io_counters(pernic=pernic, nowrap=nowrap)
 
@@ -9,6 +25,70 @@ class Network:
         # kind: 'tcp', 'udp', 'inet', 'all'
         return psutil.net_connections(kind=kind)
 
+    def _streaming(self, kind: str) -> Optional[NetstatReader]:
+        if kind == "all" or not psutil.LINUX:
+            return None  # unix soketleri /proc/net/{tcp,udp} dışında
+        if self._netstat is None:
+            self._netstat = NetstatReader()
+        return self._netstat if self._netstat.available() else None
+
+    def iter_connections(self, kind: str = "inet", states: Optional[Iterable[str]] = None) -> Iterator[Conn]:
+        """
+        Streaming connections (pid/fd None) from /proc/net on Linux;
+        elsewhere falls back to psutil.net_connections.
+        """
+        reader = self._streaming(kind)
+        if reader is not None:
+            return reader.iter_connections(kind, states)
+        wanted = set(states) if states is not None else None
+        return (Conn(*c, proto=_proto(c)) for c in psutil.net_connections(kind=kind)
+                if wanted is None or c.status in wanted)
+
+    def get_connections_with_pids(self, kind: str = "inet", limit: Optional[int] = None,
+                                  states: Optional[Iterable[str]] = None,
+                                  index: Optional[SocketIndex] = None) -> List[Conn]:
+        """
+        Connections with pid/fd filled in (unknown owner: pid None, fd -1 as in psutil).
+        On Linux the first `limit` sockets are streamed and attributed through
+        `index` (synced against /proc unless it already follows a ProcessManager);
+        otherwise psutil.net_connections.
+        """
+        reader = self._streaming(kind)
+        if reader is None or index is None:
+            wanted = set(states) if states is not None else None
+            conns = [Conn(*c, proto=_proto(c)) for c in psutil.net_connections(kind=kind)
+                     if wanted is None or c.status in wanted]
+            return conns[:limit] if limit is not None else conns
+        conns = reader.connections(kind, limit, states)
+        if not index.following:
+            index.sync_pids()
+        owners = index.resolve(c.inode for c in conns)
+        out = []
+        for c in conns:
+            o = owners.get(c.inode)
+            out.append(c._replace(pid=o[0], fd=o[1]) if o else c._replace(fd=-1))
+        return out
+
+    def get_connection_counts(self, kind: str = "inet", by: str = "status",
+                              states: Optional[Iterable[str]] = None) -> Dict[Any, int]:
+        """Socket counts grouped by status / laddr / lport / raddr / rport / proto."""
+        reader = self._streaming(kind)
+        if reader is not None:
+            return reader.count(kind, by, states)
+        if by not in GROUP_BY:
+            raise ValueError(f"unsupported group: {by!r} (expected one of {sorted(GROUP_BY)})")
+        out: Dict[Any, int] = {}
+        for c in self.iter_connections(kind, states):
+            if by == "status":
+                key = c.status
+            elif by == "proto":
+                key = c.proto
+            else:
+                addr = c.laddr if by[0] == "l" else c.raddr
+                key = (addr[1] if by.endswith("port") else addr[0]) if addr else None
+            out[key] = out.get(key, 0) + 1
+        return out
+
     def get_if_addrs(self) -> Dict[str, list]:
         return psutil.net_if_addrs()
 
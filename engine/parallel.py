@@ -0,0 +1,59 @@
+# parallel.py
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional, Callable
+
+
+class ShardedReader:
+    """
+    Splits the PID space across a thread pool. Shard i owns pids with
+    pid % workers == i and keeps its own reader, so per-pid CPU state stays
+    with one shard between ticks. Exposes the same read/read_one interface.
+    """
+
+    def __init__(self, make_reader: Callable[[], Any], workers: int,
+                 list_pids: Optional[Callable[[], List[int]]] = None):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.workers = workers
+        self._shards = [make_reader() for _ in range(workers)]
+        self._list_pids = list_pids or self._shards[0].pids
+        # havuz ilk okumada kurulur; close() sonrası tekrar okunursa yeniden kurulur
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def pids(self) -> List[int]:
+        return self._list_pids()
+
+    def read(self, attrs: Iterable[str], pids: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        attrs = list(attrs)
+        pids = sorted(self._list_pids() if pids is None else pids)
+        n = self.workers
+        parts: List[List[int]] = [[] for _ in range(n)]
+        for pid in pids:
+            parts[pid % n].append(pid)
+        pool = self._get_pool()
+        futures = [
+            pool.submit(shard.read, attrs, part, True)
+            for shard, part in zip(self._shards, parts)
+        ]
+        results = [f.result() for f in futures]
+        # her parça pid sıralı; tek snapshot olarak birleştir
+        return list(heapq.merge(*results, key=lambda r: r.get("pid", 0)))
+
+    def read_one(self, pid: int, attrs: Iterable[str]) -> Optional[Dict[str, Any]]:
+        return self._shards[pid % self.workers].read_one(pid, attrs)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="proc-shard")
+            return self._pool
+
+    def close(self) -> None:
+        """Stop the worker threads; a later read() starts a new pool."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
@@ -2,10 +2,140 @@
 import psutil
 import threading
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Optional
 
+from .procfs import ProcfsReader
+from .proctable import ProcessTable, ProcessDelta
+from .columnar import ColumnarSnapshot
+from .snapshot import ProcessSnapshot
+from .proctree import ProcessTree
+from .usercache import NameCache, name_cache
+from .inodes import SocketIndex
+from .instrument import instruments
+from .parallel import ShardedReader
+
+# POSIX'te username, uids + önbellekli ad çözümlemesiyle üretilir
+_HAS_UIDS = hasattr(psutil.Process, "uids")
+
+
+class PsutilReader:
+    """process_iter tabanlı varsayılan okuyucu; ProcfsReader ile aynı arayüz."""
+
+    def __init__(self, ad_value: Any = None, names: Optional[NameCache] = None):
+        self.ad_value = ad_value
+        self.names = names or name_cache
+        # pids verilerek okunduğunda cpu_percent için Process nesneleri saklanır
+        self._procs: Dict[int, psutil.Process] = {}
+
+    def pids(self) -> List[int]:
+        return psutil.pids()
+
+    def _attrs(self, attrs: Iterable[str]) -> tuple:
+        """psutil'e gidecek attrs ve username'in uids'den çözülüp çözülmeyeceği."""
+        attrs = list(attrs)
+        if not _HAS_UIDS or "username" not in attrs:
+            return attrs, False, False
+        want_uids = "uids" in attrs
+        attrs = [a for a in attrs if a != "username"]
+        if not want_uids:
+            attrs.append("uids")
+        return attrs, True, want_uids
+
+    def _fix_username(self, row: Dict[str, Any], want_uids: bool) -> Dict[str, Any]:
+        uids = row.get("uids") if want_uids else row.pop("uids", None)
+        row["username"] = self.names.user(uids[0]) if isinstance(uids, tuple) else self.ad_value
+        return row
+
+    def _proc(self, pid: int) -> Optional[psutil.Process]:
+        proc = self._procs.get(pid)
+        if proc is not None and proc.is_running():
+            return proc
+        try:
+            proc = self._procs[pid] = psutil.Process(pid)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            self._procs.pop(pid, None)
+            return None
+        return proc
+
+    def read(self, attrs: Iterable[str], pids: Optional[Iterable[int]] = None,
+             prune: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        pids=None: psutil.process_iter ile tüm süreçler.
+        pids verilirse yalnızca onlar; prune=True ise bu okuyucunun sorumlu olduğu
+        kümenin tamamı sayılır ve dışarıda kalan önbellek girdileri bırakılır.
+        """
+        attrs, by_uid, want_uids = self._attrs(attrs)
+        rows: List[Dict[str, Any]] = []
+        if pids is None:
+            # ad_value verildiği için çoğu hata değer ile doldurulur;
+            # yine de garanti için try/except ile devam et.
+            for proc in psutil.process_iter(attrs=attrs, ad_value=self.ad_value):
+                try:
+                    rows.append(self._fix_username(proc.info, want_uids) if by_uid else proc.info)
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+            if self._procs:
+                # pids ile yapılmış eski okumalardan kalan ölü süreçler
+                for pid in self._procs.keys() - {r.get("pid") for r in rows}:
+                    del self._procs[pid]
+            return rows
+
+        pids = list(pids)
+        for pid in pids:
+            proc = self._proc(pid)
+            if proc is None:
+                continue
+            try:
+                row = proc.as_dict(attrs=attrs, ad_value=self.ad_value)
+                rows.append(self._fix_username(row, want_uids) if by_uid else row)
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                self._procs.pop(pid, None)
+        if prune:
+            for pid in self._procs.keys() - set(pids):
+                del self._procs[pid]
+        return rows
+
+    def read_one(self, pid: int, attrs: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Tek süreç; Process nesnesi önbelleğe alınmaz (cpu_percent tabanı gerekmez)."""
+        attrs, by_uid, want_uids = self._attrs(attrs)
+        try:
+            row = psutil.Process(pid).as_dict(attrs=attrs, ad_value=self.ad_value)
+            return self._fix_username(row, want_uids) if by_uid else row
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return None
+
+
+STATIC = "static"
+EVERY_TICK = "tick"
+
+
+# snapshot()/version/wait_for_newer gibi okuyucu ve bekleme çağrıları ölçülmez
+@instruments.instrument_class("processes", include=("_take_snapshot", "__call__"),
+                              exclude=("start", "stop", "snapshot", "wait_for_newer", "socket_index",
+                                       "add_listener", "remove_listener"))
 class ProcessManager:
-    def __init__(self, interval: float = 1.0, attrs: List[str] = None, ad_value: Any = None):
+    BACKENDS = ("psutil", "procfs")
+    # "static": (pid, create_time) başına bir kez okunur; int N: N tikte bir; "tick": her tik
+    # create_time kimlik anahtarı olduğundan her tik okunur (psutil Process içinde önbellekler)
+    DEFAULT_REFRESH: Dict[str, Any] = {
+        "cmdline": STATIC,
+        "username": STATIC,
+        "ppid": 5,  # yeniden ebeveynleme (reparent) olabildiği için periyodik
+    }
+
+    def __init__(self, interval: float = 1.0, attrs: List[str] = None, ad_value: Any = None,
+                 backend: str = "psutil", workers: int = 1,
+                 refresh: Optional[Dict[str, Any]] = None, reader: Any = None):
+        """
+        backend: "psutil" (process_iter) veya "procfs" (Linux'ta /proc doğrudan okunur).
+        procfs desteklenmiyorsa ya da attrs onun kapsamı dışındaysa psutil'e düşülür.
+        workers > 1: PID alanı bu kadar iş parçacığına bölünerek paralel okunur.
+        refresh: alan bazlı yenileme politikası, DEFAULT_REFRESH üzerine yazılır
+                 ({"cmdline": "static", "num_threads": 3, "ppid": "tick"}).
+        reader: hazır bir okuyucu (ör. engine.record.ReplayReader); backend/workers yok sayılır.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"unknown backend: {backend!r} (expected one of {self.BACKENDS})")
         self.interval = interval
         self.attrs = attrs or [
             'pid', 'name', 'username',
@@ -14,71 +144,270 @@ class ProcessManager:
         ]
         # Erişim hatalarında döngü kırılmasın
         self.ad_value = "-" if ad_value is None else ad_value
+        self.backend = "procfs" if self._use_procfs(backend) else "psutil"
+        self.workers = workers
+        if reader is not None:
+            self._reader = reader
+        elif workers > 1:
+            self._reader = ShardedReader(self._make_reader, workers)
+        else:
+            self._reader = self._make_reader()
 
-        self._processes: List[Dict[str, Any]] = []
-        self._lock = threading.Lock()
+        self._set_refresh(refresh)
+        self._tick = 0
+
+        self._table = ProcessTable()
+        # yayınlanan snapshot yalnızca referans olarak değişir; okuyucular kilit almaz
+        self._snapshot = ProcessSnapshot(0, None, (), attrs=self.attrs)
+        self._cond = threading.Condition()
         self._running = False
-        self._thread = threading.Thread(target=self._update_loop, daemon=True)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._warmup = 0.0
+        self._error: Optional[Exception] = None   # güncelleyicinin son hatası
+        self._sockets: Optional[SocketIndex] = None
+        self._listeners: List[Callable[[ProcessSnapshot], None]] = []
 
-    def _take_snapshot(self):
-        """Tek seferlik snapshot al ve atomik yaz."""
-        snapshot: List[Dict[str, Any]] = []
-        # ad_value verildiği için çoğu hata değer ile doldurulur;
-        # yine de garanti için try/except ile devam et.
-        for proc in psutil.process_iter(attrs=self.attrs, ad_value=self.ad_value):
-            try:
-                snapshot.append(proc.info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+    def _use_procfs(self, backend: str) -> bool:
+        return backend == "procfs" and ProcfsReader.available() and ProcfsReader.supports(self.attrs)
+
+    @property
+    def reader(self):
+        return self._reader
+
+    @reader.setter
+    def reader(self, reader) -> None:
+        """Swap the row source, e.g. RecordingReader(pm.reader, recorder)."""
+        self._reader = reader
+
+    def _make_reader(self):
+        if self.backend == "procfs":
+            return ProcfsReader(ad_value=self.ad_value)
+        return PsutilReader(ad_value=self.ad_value)
+
+    def _set_refresh(self, refresh: Optional[Dict[str, Any]]) -> None:
+        policy = dict(self.DEFAULT_REFRESH)
+        policy.update(refresh or {})
+        static: List[str] = []
+        periodic: Dict[str, int] = {}
+        free = ProcfsReader.BASE_ATTRS if self.backend == "procfs" else {"pid", "create_time"}
+        for attr, p in policy.items():
+            if attr not in self.attrs or attr in free:
+                continue
+            if p == STATIC:
+                static.append(attr)
+            elif p == EVERY_TICK or p == 1:
                 continue
-        with self._lock:
-            self._processes[:] = snapshot
+            elif isinstance(p, int) and p > 1:
+                periodic[attr] = p
+            else:
+                raise ValueError(f"invalid refresh policy for {attr!r}: {p!r} (use 'static', 'tick' or int >= 1)")
+        self._static_attrs = static
+        self._periodic = periodic
+        self._cold_attrs = static + list(periodic)
+        hot = [a for a in self.attrs if a not in self._cold_attrs]
+        # politikalar etkinse create_time her satırda bulunur
+        if self._cold_attrs and "create_time" not in hot:
+            hot.append("create_time")
+        self._hot_attrs = hot
 
-    def start(self):
-        """Update process list in background"""
-        if not self._thread.is_alive():
-            self._thread = threading.Thread(target=self._update_loop, daemon=True)
+    def _read_rows(self) -> List[Dict[str, Any]]:
+        """Hot alanları herkes için, static/periyodik alanları yalnızca gerektiğinde oku."""
+        self._tick += 1
+        if not self._cold_attrs:
+            return self._reader.read(self.attrs)
 
-        if self._running:
-            return
-        self._running = True
+        table = self._table
+        cold_attrs = self._cold_attrs
+        if not len(table):
+            rows = self._reader.read(self._hot_attrs + cold_attrs)
+            for row in rows:
+                st = table.state((row.get("pid"), row.get("create_time")))
+                st["cold"] = {a: row.get(a) for a in cold_attrs}
+                st["name"] = row.get("name")
+            return rows
 
-        # cold start
-        for _ in range(2):
-            for _ in psutil.process_iter(attrs=self.attrs, ad_value=self.ad_value):
+        rows = self._reader.read(self._hot_attrs)
+        tick = self._tick
+        periodic = self._periodic
+        for row in rows:
+            pid = row.get("pid")
+            st = table.state((pid, row.get("create_time")))
+            cold = st.get("cold")
+            if cold is None or st.get("name") != row.get("name"):
+                # yeni süreç ya da exec ile ad değişti
+                need = cold_attrs
+            else:
+                need = [a for a, n in periodic.items() if (tick + pid) % n == 0]
+            if need:
+                fresh = self._reader.read_one(pid, need)
+                cold = dict(cold) if cold else {}
+                for a in need:
+                    cold[a] = fresh.get(a, self.ad_value) if fresh else cold.get(a, self.ad_value)
+                st["cold"] = cold
+                st["name"] = row.get("name")
+            row.update(cold)
+        return rows
+
+    def _take_snapshot(self):
+        """Tek seferlik snapshot al ve yeni sürüm olarak yayınla."""
+        ts = time.time()
+        rows = self._read_rows()
+        delta = self._table.update(rows)
+        snap = ProcessSnapshot(self._snapshot.version + 1, ts, self._table.rows(), delta, self.attrs)
+        with self._cond:
+            self._snapshot = snap
+            self._cond.notify_all()
+        if self._sockets is not None:
+            self._sockets.follow(snap)
+        for fn in list(self._listeners):
+            try:
+                # bozuk bir dinleyici yayını durdurmasın; hatası monitor_stats'ta görünür
+                with instruments.timer("processes.listener"):
+                    fn(snap)
+            except Exception:
                 pass
-        time.sleep(1)
 
-        self._take_snapshot()
+    def add_listener(self, fn: Callable[[ProcessSnapshot], None]) -> None:
+        """fn(snapshot) is called after every refresh (snapshot.delta has added/removed keys)."""
+        self._listeners.append(fn)
 
-        self._thread.start()
+    def remove_listener(self, fn: Callable[[ProcessSnapshot], None]) -> None:
+        if fn in self._listeners:
+            self._listeners.remove(fn)
 
-    def stop(self):
+    def start(self, wait: bool = True, timeout: Optional[float] = None,
+              warmup: Optional[float] = None) -> bool:
+        """
+        Update process list in background.
+        Warm-up (cpu_percent baseline, default min(1s, interval); 0 skips it) runs on
+        the worker thread; wait=True blocks until the first snapshot is published,
+        wait=False returns immediately (use wait_for_newer(0) later).
+        Returns True once a snapshot exists. If the first read fails, wait=True
+        re-raises its error and the manager can be started again.
+        """
         if not self._running:
+            self._running = True
+            self._error = None
+            self._warmup = min(1.0, self.interval) if warmup is None else warmup
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._update_loop, daemon=True)
+            self._thread.start()
+        if wait:
+            snap = self.wait_for_newer(0, timeout)
+            if snap is None and self._failed():
+                raise self._error
+            return snap is not None
+        return self.version > 0
+
+    def stop(self):
+        # ilk okuma hata verip iş parçacığı çıktıysa da havuz kapatılsın
+        if self._thread is None:
             return
         self._running = False
+        self._stop.set()
         self._thread.join()
+        self._thread = None
+        # workers > 1: shard havuzunun thread'leri de kapansın (start() yeniden kurar)
+        if isinstance(self._reader, ShardedReader):
+            self._reader.close()
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Error of the most recent failed refresh (None after a successful one)."""
+        return self._error
+
+    def _failed(self) -> bool:
+        # ilk okuma hata verdi ve iş parçacığı çıktı
+        return self._error is not None and not self._running
 
     def _update_loop(self):
-        while self._running:
+        try:
+            if self.version == 0 and self._warmup > 0 and "cpu_percent" in self.attrs:
+                # cold start: cpu_percent için taban al, kısa bir süre bekle
+                self._reader.read(self.attrs)
+                if self._stop.wait(self._warmup):
+                    return
             self._take_snapshot()
-            time.sleep(self.interval)
+        except Exception as e:
+            # ilk snapshot yoksa bekleyenleri uyandır; start() hatayı yeniden fırlatır
+            with self._cond:
+                self._error = e
+                self._running = False
+                self._cond.notify_all()
+            return
+        while self._running:
+            if self._stop.wait(self.interval):
+                break
+            try:
+                self._take_snapshot()
+                self._error = None
+            except Exception as e:
+                # sonraki tiklerde hata döngüyü öldürmesin (processes._take_snapshot'ta sayılır)
+                self._error = e
     
+    def snapshot(self) -> ProcessSnapshot:
+        """Latest published snapshot; immutable, safe to hold without locking."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def wait_for_newer(self, version: int, timeout: Optional[float] = None) -> Optional[ProcessSnapshot]:
+        """
+        Block until a snapshot newer than version is published.
+        Returns it, or None if timeout expires first.
+        """
+        with self._cond:
+            if self._cond.wait_for(lambda: self._snapshot.version > version or self._failed(), timeout):
+                return self._snapshot if self._snapshot.version > version else None
+            return None
+
     def get_processes(self) -> List[Dict[str, Any]]:
         """
         Instant process list.
         changing the returned list does not affect the main list.
         """
-        with self._lock:
-            return list(self._processes) # return its copy
+        return list(self._snapshot.rows)
     
+    def get_changes(self) -> ProcessDelta:
+        """
+        added/removed/changed (pid, create_time) keys of the last refresh.
+        Unchanged rows keep the same dict object between refreshes.
+        """
+        return self._snapshot.delta
+
+    def get_tree(self) -> ProcessTree:
+        """
+        ppid tree of the current snapshot with subtree cpu_percent / num_threads /
+        count rollups, plus rss when attrs include "memory_info" or "rss".
+        """
+        return self._snapshot.tree
+
+    def socket_index(self) -> SocketIndex:
+        """
+        inode -> (pid, fd) index that follows this manager: each refresh only
+        scans the fds of added pids and drops removed ones.
+        """
+        if self._sockets is None:
+            self._sockets = SocketIndex()
+            self._sockets.follow(self._snapshot)
+        return self._sockets
+
+    def get_columns(self) -> ColumnarSnapshot:
+        """Columnar view of the current snapshot, built once per refresh."""
+        return self._snapshot.columns
+
     def sort_processes(self, 
                         by:str="cpu_percent", 
                         reverse:bool=True) -> List[Dict[str, Any]]:
-        procs = self.get_processes()
-        return sorted(procs, key=lambda p: (p.get(by, 0) is None, p.get(by, 0), p.get("pid", 0)), reverse=reverse)
+        cols = self.get_columns()
+        return cols.rows(cols.order(by, reverse=reverse))
     
     def filter_by_user(self, uname:str) -> List[Dict[str, any]]:
-        return [p for p in self.get_processes() if p.get("username") == uname]
+        cols = self.get_columns()
+        return cols.rows(cols.select("username", uname))
     
     def __call__(self,
                 *,
@@ -96,55 +425,96 @@ class ProcessManager:
         - user: belli kullanıcıya filtrele
         - formatters: {"cpu_percent": fn, "memory_percent": fn, ...} alan bazlı formatter
         """
-        procs = self.sort_processes(by=sort_by, reverse=reverse)
-        
-        if user:
-            procs = [p for p in procs if p.get("username") == user]
-        if limit is not None and limit >= 0:
-            procs = procs[:limit]
-        if fields:
-            projected = []
-            for p in procs:
-                row = {k: p.get(k) for k in fields}
-                projected.append(row)
-            procs = projected
+        procs = self._snapshot.columns.query(
+            sort_by=sort_by, reverse=reverse, limit=limit, fields=fields, user=user
+        )
         if formatters:
-            out = []
-            for p in procs:
-                q = {}
-                for k,v in p.items():
-                    fmt = formatters.get(k)
+            procs = self._format_columns(procs, formatters)
+        return procs
+
+    @staticmethod
+    def _format_columns(procs: List[Dict[str, Any]], formatters: dict) -> List[Dict[str, Any]]:
+        """Format column by column: one fmt.many() call per field when available."""
+        out = [dict(p) for p in procs]
+        for k, fmt in formatters.items():
+            rows = [q for q in out if k in q]
+            if not rows:
+                continue
+            values = [q[k] for q in rows]
+            many = getattr(fmt, "many", None)
+            col = None
+            if many is not None:
+                try:
+                    col = many(values)
+                except Exception:
+                    col = None
+            if col is None:
+                col = []
+                for v in values:
                     try:
-                        q[k] = fmt(v) if fmt else v
+                        col.append(fmt(v))
                     except Exception:
-                        q[k] = v
-                out.append(q)
-            procs = out
-        return procs
+                        col.append(v)
+            for q, v in zip(rows, col):
+                q[k] = v
+        return out
     
     @staticmethod
     def default_formatters(parser) -> dict:
-        """İstersen hızlıca tak-çalıştır formatter seti."""
+        """İstersen hızlıca tak-çalıştır formatter seti (ColumnFormatter: tek değer ya da .many kolon)."""
+        zero_pct = parser.format_percent(0.0, part="")
+        zero_bytes = parser.format_bytes(0)
+        pct = ColumnFormatter(lambda v: parser.format_percent(v or 0.0, part=""),
+                              lambda vs: parser.format_percent_many(vs, none=zero_pct))
+        size = ColumnFormatter(lambda b: parser.format_bytes(b or 0),
+                               lambda vs: parser.format_bytes_many(vs, none=zero_bytes))
         return {
-            "cpu_percent":  lambda v: parser.format_percent(v or 0.0, part=""),
-            "memory_percent": lambda v: parser.format_percent(v or 0.0, part=""),
-            "rss": lambda b: parser.format_bytes(b or 0),
-            "vms": lambda b: parser.format_bytes(b or 0),
-            "read_bytes": lambda b: parser.format_bytes(b or 0),
-            "write_bytes": lambda b: parser.format_bytes(b or 0),
-            "create_time": lambda t: parser.format_ctime(t),
+            "cpu_percent": pct,
+            "memory_percent": pct,
+            "rss": size,
+            "vms": size,
+            "read_bytes": size,
+            "write_bytes": size,
+            "create_time": ColumnFormatter(parser.format_ctime, parser.format_ctime_many),
         }
 
+
+class ColumnFormatter:
+    """Formatter usable per value (fmt(v)) or per column (fmt.many(values))."""
+
+    __slots__ = ("one", "many")
+
+    def __init__(self, one: Callable[[Any], Any], many: Optional[Callable[[List[Any]], List[Any]]] = None):
+        self.one = one
+        self.many = many or (lambda values: [one(v) for v in values])
+
+    def __call__(self, value: Any) -> Any:
+        return self.one(value)
+
+# __init__ ölçülür: NoSuchProcess/AccessDenied çoğunlukla orada çıkar
+@instruments.instrument_class("process_detail", include=("__init__",), exclude=("oneshot",))
 class ProcessDetail:
     def __init__(self, pid: int):
         self.proc = psutil.Process(pid)
 
+    def oneshot(self):
+        """psutil.Process.oneshot(): reads inside share /proc/<pid>/stat & co."""
+        return self.proc.oneshot()
+
+    def username(self) -> str:
+        if _HAS_UIDS:
+            return name_cache.user(self.proc.uids().real)
+        return self.proc.username()
+
     def memory_full_info(self):
         return self.proc.memory_full_info()
 
     def io_counters(self):
         return self.proc.io_counters()
 
+    def create_time(self) -> float:
+        return self.proc.create_time()
+
     def open_files(self):
         return self.proc.open_files()
 
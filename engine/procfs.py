@@ -0,0 +1,241 @@
+# procfs.py
+import os
+import sys
+import time
+from collections import namedtuple
+from typing import List, Dict, Any, Iterable, Optional
+
+from .usercache import NameCache, name_cache
+
+# psutil ile aynı alan sırası (Linux pmem / puids / pgids)
+pmem = namedtuple("pmem", ["rss", "vms", "shared", "text", "lib", "data", "dirty"])
+puids = namedtuple("puids", ["real", "effective", "saved"])
+pgids = namedtuple("pgids", ["real", "effective", "saved"])
+
+PROC_STATUSES = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "Z": "zombie",
+    "X": "dead",
+    "x": "dead",
+    "K": "wake-kill",
+    "W": "waking",
+    "I": "idle",
+    "P": "parked",
+}
+
+# stat dosyasında ')' sonrası alan indeksleri
+_STATE, _PPID, _UTIME, _STIME, _NICE, _NUM_THREADS, _STARTTIME = 0, 1, 11, 12, 16, 17, 19
+
+_STAT_ATTRS = frozenset({"name", "status", "ppid", "nice", "num_threads", "create_time", "cpu_percent"})
+_STATM_ATTRS = frozenset({"memory_percent", "memory_info"})
+_STATUS_ATTRS = frozenset({"username", "uids", "gids"})
+
+
+class ProcfsReader:
+    """
+    Reads /proc/[pid]/stat, statm, status (and cmdline when asked) directly,
+    producing the same rows as psutil.process_iter(attrs=...).info.
+    Linux only; one instance keeps per-pid CPU state, so it is not thread safe.
+    """
+
+    # stat her satırda okunduğu için bu alanlar ek maliyetsizdir
+    BASE_ATTRS = frozenset({"pid"} | _STAT_ATTRS)
+    SUPPORTED_ATTRS = frozenset(
+        {"pid", "cmdline"} | _STAT_ATTRS | _STATM_ATTRS | _STATUS_ATTRS
+    )
+
+    def __init__(self, ad_value: Any = None, root: str = "/proc", bufsize: int = 8192,
+                 names: Optional[NameCache] = None):
+        self.ad_value = ad_value
+        self.names = names or name_cache
+        self.root = root
+        self._buf = bytearray(bufsize)
+        self._view = memoryview(self._buf)
+        self._clk_tck = os.sysconf("SC_CLK_TCK")
+        self._pagesize = os.sysconf("SC_PAGE_SIZE")
+        self._boot_time: Optional[float] = None
+        self._mem_total: Optional[int] = None
+        # pid -> (starttime, cpu seconds, monotonic ts)
+        self._last_cpu: Dict[int, tuple] = {}
+
+    @staticmethod
+    def available(root: str = "/proc") -> bool:
+        return sys.platform.startswith("linux") and os.path.exists(os.path.join(root, "self", "stat"))
+
+    @classmethod
+    def supports(cls, attrs: Iterable[str]) -> bool:
+        return set(attrs) <= cls.SUPPORTED_ATTRS
+
+    # ---- low level ----
+    def _read(self, name: str, dir_fd: int) -> bytes:
+        fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+        try:
+            n = os.readv(fd, [self._buf])
+            if n < len(self._buf):
+                return bytes(self._view[:n])
+            # buffer dolduysa (uzun cmdline vb.) kalanını oku
+            chunks = [bytes(self._view)]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            os.close(fd)
+
+    def pids(self) -> List[int]:
+        return sorted(int(d) for d in os.listdir(self.root) if d.isdigit())
+
+    def boot_time(self) -> float:
+        if self._boot_time is None:
+            with open(os.path.join(self.root, "stat"), "rb") as f:
+                for line in f:
+                    if line.startswith(b"btime"):
+                        self._boot_time = float(line.split()[1])
+                        break
+                else:
+                    self._boot_time = 0.0
+        return self._boot_time
+
+    def mem_total(self) -> int:
+        if self._mem_total is None:
+            with open(os.path.join(self.root, "meminfo"), "rb") as f:
+                for line in f:
+                    if line.startswith(b"MemTotal:"):
+                        self._mem_total = int(line.split()[1]) * 1024
+                        break
+                else:
+                    self._mem_total = 0
+        return self._mem_total
+
+    @staticmethod
+    def _status_ids(data: bytes, key: bytes) -> tuple:
+        start = data.find(key)
+        if start < 0:
+            return ()
+        end = data.find(b"\n", start)
+        return tuple(int(x) for x in data[start + len(key):end].split()[:3])
+
+    # ---- rows ----
+    def _read_pid(self, root_fd: int, pid: int, want: frozenset, now: float) -> Optional[Dict[str, Any]]:
+        ad = self.ad_value
+        try:
+            dir_fd = os.open(str(pid), os.O_RDONLY | os.O_DIRECTORY, dir_fd=root_fd)
+        except (FileNotFoundError, ProcessLookupError, NotADirectoryError):
+            return None
+        try:
+            row: Dict[str, Any] = {}
+            if "pid" in want:
+                row["pid"] = pid
+
+            # stat her zaman okunur: create_time kimlik için gerekli
+            stat = self._read("stat", dir_fd)
+            lpar = stat.find(b"(")
+            rpar = stat.rfind(b")")
+            comm = stat[lpar + 1:rpar].decode("utf-8", "replace")
+            f = stat[rpar + 2:].split()
+            starttime = int(f[_STARTTIME])
+
+            if "name" in want:
+                row["name"] = comm
+            if "status" in want:
+                st = f[_STATE].decode()
+                row["status"] = PROC_STATUSES.get(st, st)
+            if "ppid" in want:
+                row["ppid"] = int(f[_PPID])
+            if "nice" in want:
+                row["nice"] = int(f[_NICE])
+            if "num_threads" in want:
+                row["num_threads"] = int(f[_NUM_THREADS])
+            if "create_time" in want:
+                row["create_time"] = self.boot_time() + starttime / self._clk_tck
+            if "cpu_percent" in want:
+                cpu_s = (int(f[_UTIME]) + int(f[_STIME])) / self._clk_tck
+                prev = self._last_cpu.get(pid)
+                self._last_cpu[pid] = (starttime, cpu_s, now)
+                if prev is None or prev[0] != starttime or now <= prev[2]:
+                    row["cpu_percent"] = 0.0
+                else:
+                    row["cpu_percent"] = round((cpu_s - prev[1]) / (now - prev[2]) * 100, 1)
+
+            if want & _STATM_ATTRS:
+                try:
+                    sm = [int(x) * self._pagesize for x in self._read("statm", dir_fd).split()]
+                    if "memory_info" in want:
+                        row["memory_info"] = pmem(sm[1], sm[0], sm[2], sm[3], sm[4], sm[5], sm[6])
+                    if "memory_percent" in want:
+                        total = self.mem_total()
+                        row["memory_percent"] = (sm[1] / total * 100) if total else ad
+                except PermissionError:
+                    for k in want & _STATM_ATTRS:
+                        row[k] = ad
+
+            if want & _STATUS_ATTRS:
+                try:
+                    status = self._read("status", dir_fd)
+                    uids = self._status_ids(status, b"Uid:")
+                    if "uids" in want:
+                        row["uids"] = puids(*uids) if len(uids) == 3 else ad
+                    if "gids" in want:
+                        gids = self._status_ids(status, b"Gid:")
+                        row["gids"] = pgids(*gids) if len(gids) == 3 else ad
+                    if "username" in want:
+                        row["username"] = self.names.user(uids[0]) if uids else ad
+                except PermissionError:
+                    for k in want & _STATUS_ATTRS:
+                        row[k] = ad
+
+            if "cmdline" in want:
+                try:
+                    data = self._read("cmdline", dir_fd)
+                    if data.endswith(b"\x00"):
+                        data = data[:-1]
+                    row["cmdline"] = [a.decode("utf-8", "surrogateescape") for a in data.split(b"\x00")] if data else []
+                except PermissionError:
+                    row["cmdline"] = ad
+            return row
+        except (FileNotFoundError, ProcessLookupError):
+            # process okuma sırasında öldü
+            return None
+        finally:
+            os.close(dir_fd)
+
+    def read(self, attrs: Iterable[str], pids: Optional[Iterable[int]] = None,
+             prune: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        One pass over /proc; rows are ordered by pid like psutil.process_iter.
+        prune (default: True for a full scan) drops CPU state of pids not read.
+        """
+        want = frozenset(attrs)
+        if prune is None:
+            prune = pids is None
+        pids = self.pids() if pids is None else pids
+        now = time.monotonic()
+        rows: List[Dict[str, Any]] = []
+        seen = set()
+        root_fd = os.open(self.root, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for pid in pids:
+                row = self._read_pid(root_fd, pid, want, now)
+                if row is not None:
+                    rows.append(row)
+                    seen.add(pid)
+        finally:
+            os.close(root_fd)
+        if prune:
+            # ölen pid'lerin CPU durumunu bırak
+            for pid in self._last_cpu.keys() - seen:
+                del self._last_cpu[pid]
+        return rows
+
+    def read_one(self, pid: int, attrs: Iterable[str]) -> Optional[Dict[str, Any]]:
+        root_fd = os.open(self.root, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            return self._read_pid(root_fd, pid, frozenset(attrs), time.monotonic())
+        finally:
+            os.close(root_fd)
@@ -0,0 +1,78 @@
+# proctable.py
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
+
+# (pid, create_time): pid yeniden kullanılsa da kimlik değişir
+ProcessKey = Tuple[int, Optional[float]]
+
+
+def process_key(row: Dict[str, Any]) -> ProcessKey:
+    return (row.get("pid"), row.get("create_time"))
+
+
+@dataclass
+class ProcessDelta:
+    added: Set[ProcessKey] = field(default_factory=set)
+    removed: Set[ProcessKey] = field(default_factory=set)
+    changed: Set[ProcessKey] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+
+class ProcessTable:
+    """
+    Diffing process table keyed on (pid, create_time).
+    Unchanged rows keep their previous dict object, so consumers can cache by
+    identity; per-process state attached via state() lives until the process exits.
+    """
+
+    def __init__(self):
+        self._rows: Dict[ProcessKey, Dict[str, Any]] = {}
+        self._order: List[Dict[str, Any]] = []
+        self._state: Dict[ProcessKey, Dict[str, Any]] = {}
+
+    def update(self, rows: Iterable[Dict[str, Any]]) -> ProcessDelta:
+        old = self._rows
+        new: Dict[ProcessKey, Dict[str, Any]] = {}
+        order: List[Dict[str, Any]] = []
+        delta = ProcessDelta()
+        for row in rows:
+            key = process_key(row)
+            prev = old.get(key)
+            if prev is None:
+                delta.added.add(key)
+            elif prev == row:
+                row = prev
+            else:
+                delta.changed.add(key)
+            new[key] = row
+            order.append(row)
+        delta.removed = old.keys() - new.keys()
+        for key in self._state.keys() - new.keys():
+            del self._state[key]
+        self._rows = new
+        self._order = order
+        return delta
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return self._order
+
+    def get(self, key: ProcessKey) -> Optional[Dict[str, Any]]:
+        return self._rows.get(key)
+
+    def state(self, key: ProcessKey) -> Dict[str, Any]:
+        """Per-process scratch dict reused across ticks."""
+        st = self._state.get(key)
+        if st is None:
+            st = self._state[key] = {}
+        return st
+
+    def __contains__(self, key: ProcessKey) -> bool:
+        return key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
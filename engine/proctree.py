@@ -0,0 +1,180 @@
+# proctree.py
+import heapq
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# subtree toplamları: alan -> _agg içindeki sıra
+ROLLUP_FIELDS = ("cpu_percent", "rss", "num_threads", "count")
+
+
+_NUMERIC = (int, float)
+
+
+def _num(v: Any) -> float:
+    # ad_value ("-") ya da None -> 0
+    return v if v.__class__ in _NUMERIC else 0
+
+
+def _rss(row: Dict[str, Any]) -> float:
+    v = row.get("rss")
+    if v is None:
+        mi = row.get("memory_info")
+        v = getattr(mi, "rss", None)
+    return _num(v)
+
+
+class ProcessTree:
+    """
+    parent -> children index over one snapshot's rows, with subtree rollups
+    (cpu_percent, num_threads, count, plus rss when rows carry "rss" or
+    "memory_info") computed bottom-up once, so subtree(pid) is O(1).
+    Processes whose parent is missing are roots; a ppid cycle is broken at
+    its smallest member, so processes hanging off the cycle keep their parent.
+    """
+
+    __slots__ = ("_rows", "_parent", "_children", "_roots", "_agg", "_depth")
+
+    def __init__(self, rows: Sequence[Dict[str, Any]]):
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        for r in rows:
+            pid = r.get("pid")
+            if isinstance(pid, int):
+                self._rows[pid] = r
+        self._parent: Dict[int, int] = {}
+        self._children: Dict[int, List[int]] = {}
+        roots: List[int] = []
+        for pid, r in self._rows.items():
+            ppid = r.get("ppid")
+            if isinstance(ppid, int) and ppid != pid and ppid in self._rows:
+                self._parent[pid] = ppid
+                self._children.setdefault(ppid, []).append(pid)
+            else:
+                roots.append(pid)
+        for kids in self._children.values():
+            kids.sort()
+        roots.sort()
+
+        # üstten alta sıra (BFS); derin ağaçlarda özyineleme yok
+        order: List[int] = []
+        self._depth: Dict[int, int] = {}
+        self._walk(roots, order)
+        if len(order) < len(self._rows):
+            # kökten ulaşılamayanlar bir ppid döngüsünde ya da ona bağlı;
+            # ppid zincirini tekrar eden pid'e kadar izle, döngünün en küçük üyesini kök yap
+            for pid in sorted(self._rows):
+                if pid in self._depth:
+                    continue
+                seen: Dict[int, int] = {}
+                p = pid
+                while p not in seen:
+                    seen[p] = len(seen)
+                    p = self._parent[p]
+                cycle = [q for q, i in seen.items() if i >= seen[p]]
+                head = min(cycle)
+                self._children[self._parent.pop(head)].remove(head)
+                roots.append(head)
+                self._walk([head], order)
+            roots.sort()
+        self._roots = tuple(roots)
+
+        # alttan üste: her düğüm kendi toplamını ebeveynine ekler
+        rows_ = self._rows
+        cols = {
+            "cpu_percent": {p: _num(r.get("cpu_percent")) for p, r in rows_.items()},
+            "num_threads": {p: _num(r.get("num_threads")) for p, r in rows_.items()},
+            "count": dict.fromkeys(rows_, 1),
+        }
+        # rss yalnızca satırlarda bellek bilgisi varsa (varsayılan attrs'ta yok)
+        first = next(iter(rows_.values()), None)
+        if first is not None and ("rss" in first or "memory_info" in first):
+            cols["rss"] = {p: _rss(r) for p, r in rows_.items()}
+        parent = self._parent
+        agg = list(cols.values())
+        for pid in reversed(order):
+            pp = parent.get(pid)
+            if pp is not None:
+                for col in agg:
+                    col[pp] += col[pid]
+        self._agg = {f: cols[f] for f in ROLLUP_FIELDS if f in cols}
+
+    def _walk(self, start: Iterable[int], order: List[int]) -> None:
+        depth = self._depth
+        frontier = [p for p in start if p not in depth]
+        for p in frontier:
+            depth[p] = depth[self._parent[p]] + 1 if p in self._parent else 0
+        while frontier:
+            order.extend(frontier)
+            nxt = []
+            for p in frontier:
+                for c in self._children.get(p, ()):
+                    if c not in depth:
+                        depth[c] = depth[p] + 1
+                        nxt.append(c)
+            frontier = nxt
+
+    # ---- yapı ----
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def roots(self) -> Tuple[int, ...]:
+        return self._roots
+
+    def row(self, pid: int) -> Optional[Dict[str, Any]]:
+        return self._rows.get(pid)
+
+    def parent(self, pid: int) -> Optional[int]:
+        return self._parent.get(pid)
+
+    def children(self, pid: int) -> Tuple[int, ...]:
+        return tuple(self._children.get(pid, ()))
+
+    def depth(self, pid: int) -> int:
+        return self._depth[pid]
+
+    def ancestors(self, pid: int) -> List[int]:
+        """Parent first, root last."""
+        out = []
+        p = self._parent.get(pid)
+        while p is not None:
+            out.append(p)
+            p = self._parent.get(p)
+        return out
+
+    def descendants(self, pid: int) -> Iterator[int]:
+        """Pre-order, pid itself excluded."""
+        stack = list(reversed(self._children.get(pid, ())))
+        while stack:
+            p = stack.pop()
+            yield p
+            stack.extend(reversed(self._children.get(p, ())))
+
+    # ---- toplamlar ----
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Rollup fields of this tree (rss only when the rows carry memory)."""
+        return tuple(self._agg)
+
+    def _col(self, field: str) -> Dict[int, float]:
+        try:
+            return self._agg[field]
+        except KeyError:
+            raise ValueError(f"no {field!r} rollup (available: {', '.join(self._agg)})") from None
+
+    def subtree(self, pid: int) -> Dict[str, float]:
+        """Rollup of pid and every descendant: cpu_percent, rss, num_threads, count."""
+        return {f: col[pid] for f, col in self._agg.items()}
+
+    def total(self, pid: int, field: str) -> float:
+        return self._col(field)[pid]
+
+    def top(self, by: str = "cpu_percent", k: int = 10, parent: Optional[int] = None) -> List[Tuple[int, Dict[str, float]]]:
+        """
+        Children of `parent` (roots when None) ranked by their subtree rollup,
+        e.g. top("cpu_percent", parent=1) -> busiest service trees under init.
+        """
+        col = self._col(by)
+        pool = self._roots if parent is None else self._children.get(parent, ())
+        best = heapq.nlargest(k, pool, key=lambda p: (col[p], -p))
+        return [(p, self.subtree(p)) for p in best]
@@ -0,0 +1,149 @@
+# rates.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+# sayaç genişlikleri: 32 bit (eski NIC/kernel sayaçları) ve 64 bit
+_WIDTHS = (1 << 32, 1 << 64)
+
+
+class _Series:
+    __slots__ = ("ts", "value", "rate", "smooth")
+
+    def __init__(self, ts: float, value: float):
+        self.ts = ts
+        self.value = value
+        self.rate: Optional[float] = None
+        self.smooth: Optional[float] = None
+
+
+class RateTracker:
+    """
+    Cumulative counter -> per-second rate, one state per series key.
+
+    - every series keeps its own (ts, value); callers that read the same
+      sample again (same ts and value) get the previous rate back
+    - a counter that goes down is treated as a wrap when it was near the top
+      of a 32/64-bit range, otherwise as a reset (rate None, new baseline)
+    - halflife (seconds) enables time-aware EWMA smoothing
+    - bounded: least recently updated series are evicted past max_series
+    """
+
+    def __init__(self, halflife: Optional[float] = None, max_series: int = 8192,
+                 clock: Callable[[], float] = time.monotonic):
+        if halflife is not None and halflife <= 0:
+            raise ValueError(f"halflife must be > 0, got {halflife}")
+        self.halflife = halflife
+        self.max_series = max_series
+        self.clock = clock
+        self._series: "OrderedDict[Hashable, _Series]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.wraps = 0
+        self.resets = 0
+
+    def update(self, key: Hashable, value: Optional[float], ts: Optional[float] = None) -> Optional[float]:
+        """Feed one counter reading; returns its rate (smoothed if halflife) or None."""
+        if value is None:
+            return None
+        ts = self.clock() if ts is None else ts
+        with self._lock:
+            return self._update(key, value, ts)
+
+    def update_many(self, prefix: Tuple, counters: Dict[str, Any], ts: Optional[float] = None,
+                    fields: Optional[Iterable[str]] = None) -> Dict[str, Optional[float]]:
+        """update() for several fields of one record under one lock; keys are prefix + (field,)."""
+        ts = self.clock() if ts is None else ts
+        names = counters.keys() if fields is None else fields
+        out = {}
+        with self._lock:
+            for f in names:
+                v = counters.get(f)
+                out[f] = None if v is None else self._update(prefix + (f,), v, ts)
+        return out
+
+    def _update(self, key: Hashable, value: float, ts: float) -> Optional[float]:
+        s = self._series.get(key)
+        if s is None:
+            self._series[key] = _Series(ts, value)
+            if len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+            return None
+        self._series.move_to_end(key)
+        return self._advance(s, value, ts)
+
+    def _advance(self, s: _Series, value: float, ts: float) -> Optional[float]:
+        dt = ts - s.ts
+        if dt <= 0:
+            # aynı örnek tekrar (ya da eski bir örnek) geldi: durumu bozma
+            return s.smooth if self.halflife else s.rate
+        delta = value - s.value
+        if delta < 0:
+            width = self._wrap_width(s.value, value)
+            if width is None:
+                self.resets += 1
+                s.ts, s.value, s.rate, s.smooth = ts, value, None, None
+                return None
+            self.wraps += 1
+            delta += width
+        rate = delta / dt
+        s.ts, s.value, s.rate = ts, value, rate
+        if self.halflife:
+            if s.smooth is None:
+                s.smooth = rate
+            else:
+                alpha = 1.0 - 0.5 ** (dt / self.halflife)
+                s.smooth += alpha * (rate - s.smooth)
+            return s.smooth
+        return rate
+
+    @staticmethod
+    def _wrap_width(prev: float, value: float) -> Optional[int]:
+        for width in _WIDTHS:
+            if prev < width:
+                # üst çeyrekten alt çeyreğe düştüyse taşma, değilse sıfırlama
+                if prev >= width * 0.75 and value < width * 0.25:
+                    return width
+                return None
+        return None
+
+    def rate(self, key: Hashable) -> Optional[float]:
+        s = self._series.get(key)
+        if s is None:
+            return None
+        return s.smooth if self.halflife else s.rate
+
+    def forget(self, key: Hashable) -> None:
+        with self._lock:
+            self._series.pop(key, None)
+
+    def forget_prefixes(self, prefixes: Iterable[Tuple]) -> int:
+        """
+        Drop every series whose tuple key starts with one of prefixes, e.g.
+        ("proc", pid, create_time) of exited processes. Returns how many were dropped.
+        """
+        prefixes = set(prefixes)
+        if not prefixes:
+            return 0
+        sizes = {len(p) for p in prefixes}
+        with self._lock:
+            dead = [k for k in self._series
+                    if isinstance(k, tuple) and any(k[:n] in prefixes for n in sizes)]
+            for k in dead:
+                del self._series[k]
+        return len(dead)
+
+    def prune(self, keep: Callable[[Hashable], bool]) -> int:
+        """Drop series whose key fails keep(key); returns how many were dropped."""
+        with self._lock:
+            dead = [k for k in self._series if not keep(k)]
+            for k in dead:
+                del self._series[k]
+        return len(dead)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def __len__(self) -> int:
+        return len(self._series)
@@ -0,0 +1,584 @@
+# record.py
+import bisect
+import base64
+import collections
+import enum
+import importlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# log: MAGIC + kayıtlar; her kayıt = _HEAD + payload
+# idx: IDX_MAGIC + sabit genişlikte _ENTRY'ler (kayıt başına bir tane)
+MAGIC = b"ENGREC1\n"
+IDX_MAGIC = b"ENGIDX1\n"
+_HEAD = struct.Struct("<BBIdI")     # kind, flags, key, ts, len(payload)
+_ENTRY = struct.Struct("<BIdQ")     # kind, key, ts, offset
+
+# bridge.clean.use_engine() adları; ProcessManager satırları "processes"
+SOURCES = ("cpu", "memory", "disk", "network", "sensors", "system")
+
+DATA, KEY, TYPE = 0, 1, 2           # kayıt türleri
+_ZLIB, _DELTA = 1, 2                # flags
+COMPRESS_MIN = 256                  # daha küçük payload'lar sıkıştırılmaz
+KEYFRAME_EVERY = 60                 # satır listelerinde bu kadar kayıtta bir tam kayıt
+_SCALARS = (str, int, float, bool)
+
+
+# ---- değer kodlama ----
+class _Codec:
+    """
+    JSON with tagged containers so replay returns the same shapes:
+    namedtuples (by type id), tuples, non-str-keyed dicts, enums, bytes, and
+    lists of same-keyed dicts (process rows) stored as one key list + value rows.
+    """
+
+    def __init__(self):
+        self.type_ids: Dict[type, int] = {}     # kayıt: namedtuple sınıfı -> id
+        self.types: Dict[int, type] = {}        # replay: id -> sınıf
+
+    # kayıt tarafı: yeni tipler on_type(id, tanım) ile bildirilir
+    def encode(self, v: Any, on_type: Callable[[int, list], None]) -> Any:
+        if v is None or v.__class__ in _SCALARS:
+            return v
+        if isinstance(v, enum.Enum):
+            return {"#e": [type(v).__module__, type(v).__qualname__, v.value]}
+        if isinstance(v, tuple):
+            fields = getattr(v, "_fields", None)
+            if fields is not None:
+                cls = type(v)
+                tid = self.type_ids.get(cls)
+                if tid is None:
+                    tid = self.type_ids[cls] = len(self.type_ids) + 1
+                    on_type(tid, [cls.__module__, cls.__name__, list(fields)])
+                return {"#n": tid, "v": [self.encode(x, on_type) for x in v]}
+            return {"#t": [self.encode(x, on_type) for x in v]}
+        if isinstance(v, list):
+            if len(v) > 1 and v[0].__class__ is dict:
+                keys = list(v[0])
+                if all(r.__class__ is dict and r.keys() == v[0].keys() for r in v):
+                    enc = self.encode
+                    return {"#r": keys, "v": [[x if x is None or x.__class__ in _SCALARS else enc(x, on_type)
+                                               for x in map(r.__getitem__, keys)] for r in v]}
+            return [self.encode(x, on_type) for x in v]
+        if isinstance(v, dict):
+            if all(k.__class__ is str and not k.startswith("#") for k in v):
+                return {k: self.encode(x, on_type) for k, x in v.items()}
+            return {"#d": [[self.encode(k, on_type), self.encode(x, on_type)] for k, x in v.items()]}
+        if isinstance(v, (bytes, bytearray)):
+            return {"#b": base64.b64encode(v).decode("ascii")}
+        if isinstance(v, (int, float, str)):
+            return v  # alt sınıflar (ör. numpy olmayan sayısal türler)
+        raise TypeError(f"cannot record {type(v).__name__}")
+
+    # replay tarafı
+    def define(self, tid: int, spec: list) -> None:
+        module, name, fields = spec
+        cls = None
+        try:
+            cls = getattr(importlib.import_module(module), name)
+            if tuple(getattr(cls, "_fields", ())) != tuple(fields):
+                cls = None
+        except Exception:
+            cls = None
+        self.types[tid] = cls or collections.namedtuple(name, fields)
+
+    def decode(self, v: Any) -> Any:
+        if v.__class__ is list:
+            return [self.decode(x) for x in v]
+        if v.__class__ is not dict:
+            return v
+        if "#n" in v:
+            return self.types[v["#n"]](*[self.decode(x) for x in v["v"]])
+        if "#r" in v:
+            keys = v["#r"]
+            dec = self.decode
+            return [dict(zip(keys, [x if x.__class__ in _SCALARS or x is None else dec(x) for x in row]))
+                    for row in v["v"]]
+        if "#t" in v:
+            return tuple(self.decode(x) for x in v["#t"])
+        if "#d" in v:
+            return {self._key(self.decode(k)): self.decode(x) for k, x in v["#d"]}
+        if "#e" in v:
+            module, qualname, value = v["#e"]
+            try:
+                cls = importlib.import_module(module)
+                for part in qualname.split("."):
+                    cls = getattr(cls, part)
+                return cls(value)
+            except Exception:
+                return value
+        if "#b" in v:
+            return base64.b64decode(v["#b"])
+        return {k: self.decode(x) for k, x in v.items()}
+
+    @staticmethod
+    def _key(k: Any) -> Any:
+        return tuple(k) if k.__class__ is list else k
+
+
+_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+def _dumps(obj: Any) -> bytes:
+    return _encoder.encode(obj).encode("utf-8")
+
+
+def call_key(source: str, method: str, args: tuple, kwargs: dict) -> str:
+    """Stable identity of one engine call: source.method + arguments."""
+    return json.dumps([source, method, list(args), sorted(kwargs.items())],
+                      separators=(",", ":"), default=repr)
+
+
+# ---- yazma ----
+class Recorder:
+    """
+    Append-only binary log of engine call results plus a fixed-width index
+    (<path>.idx) for seeking. Each record is a 18-byte header and a JSON
+    payload, zlib-compressed when larger than COMPRESS_MIN. Call keys and
+    namedtuple types are written once and referred to by id afterwards.
+    Thread-safe; records are flushed (not fsynced) one by one.
+    """
+
+    def __init__(self, path: str, level: int = 6, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.level = level
+        self.clock = clock
+        self._codec = _Codec()
+        self._keys: Dict[str, int] = {}
+        self._last: Dict[int, Tuple[list, Dict[str, int], int]] = {}  # key -> (sütunlar, satır -> sıra, keyframe'den beri)
+        self._lock = threading.Lock()
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if new:
+            self._log = open(path, "wb")
+            self._log.write(MAGIC)
+            self._idx = open(path + ".idx", "wb")
+            self._idx.write(IDX_MAGIC)
+        else:
+            # mevcut günlüğe ekle: tabloları geri yükle, yarım kaydı kes, indeksi yeniden yaz
+            with RecordingLog(path) as log:
+                self._keys = {k: i for i, k in log.keys.items()}
+                self._codec.type_ids = {cls: tid for tid, cls in log.codec.types.items()}
+                entries, end = log.entries, log.valid_end
+            self._log = open(path, "r+b")
+            self._log.truncate(end)
+            self._log.seek(end)
+            self._idx = open(path + ".idx", "wb")
+            self._idx.write(IDX_MAGIC)
+            for e in entries:
+                self._idx.write(_ENTRY.pack(*e))
+        self.records = 0
+        self.bytes = 0
+        self.errors = 0
+
+    def _write(self, kind: int, key: int, ts: float, payload: bytes, flags: int = 0) -> None:
+        if len(payload) >= COMPRESS_MIN:
+            payload, flags = zlib.compress(payload, self.level), flags | _ZLIB
+        offset = self._log.tell()
+        self._log.write(_HEAD.pack(kind, flags, key, ts, len(payload)))
+        self._log.write(payload)
+        self._idx.write(_ENTRY.pack(kind, key, ts, offset))
+        self.bytes += _HEAD.size + len(payload)
+
+    def record(self, source: str, method: str, args: tuple, kwargs: dict, value: Any,
+               ts: Optional[float] = None) -> bool:
+        """Append one call result; returns False (and counts an error) if it cannot be encoded."""
+        ts = self.clock() if ts is None else ts
+        with self._lock:
+            if self._log.closed:
+                return False
+            types: List[Tuple[int, list]] = []
+            try:
+                enc = self._codec.encode(value, lambda tid, spec: types.append((tid, spec)))
+                rows = enc["v"] if enc.__class__ is dict and "#r" in enc else None
+                body = None if rows is not None else _dumps(enc)
+            except (TypeError, ValueError):
+                self.errors += 1
+                return False
+            for tid, spec in types:
+                self._write(TYPE, tid, ts, _dumps(spec))
+            ck = call_key(source, method, args, kwargs)
+            kid = self._keys.get(ck)
+            if kid is None:
+                kid = self._keys[ck] = len(self._keys) + 1
+                self._write(KEY, kid, ts, ck.encode("utf-8"))
+            flags = 0
+            if rows is None:
+                self._last.pop(kid, None)
+            else:
+                body, flags = self._rows_body(kid, enc["#r"], rows)
+            self._write(DATA, kid, ts, body, flags)
+            self._log.flush()
+            self._idx.flush()
+            self.records += 1
+        return True
+
+    def _rows_body(self, kid: int, keys: list, rows: List[list]) -> Tuple[bytes, int]:
+        """
+        Row lists (process tables) are stored against the previous record of
+        the same call: an unchanged row becomes its index there. A full
+        keyframe is written every KEYFRAME_EVERY records.
+        """
+        last = self._last.get(kid)
+        # repr, JSON'a uygun değerler için eşitlik anahtarı olarak yeterli ve json'dan hızlı
+        reprs = [repr(row) for row in rows]
+        index = {k: i for i, k in enumerate(reprs)}
+        if last is not None and last[0] == keys and last[2] < KEYFRAME_EVERY:
+            prev = last[1]
+            self._last[kid] = (keys, index, last[2] + 1)
+            return _dumps({"#r": keys, "v": [prev.get(k, row) for k, row in zip(reprs, rows)]}), _DELTA
+        self._last[kid] = (keys, index, 1)
+        return _dumps({"#r": keys, "v": rows}), 0
+
+    def wrap(self, obj: Any, source: str) -> "RecordingProxy":
+        return RecordingProxy(obj, self, source)
+
+    def wrap_all(self, objs: Dict[str, Any]) -> Dict[str, "RecordingProxy"]:
+        """{source: obj} -> {source: proxy}; e.g. bridge.clean.engine_objects()."""
+        return {src: RecordingProxy(obj, self, src) for src, obj in objs.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._log.closed:
+                self._log.close()
+                self._idx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RecordingProxy:
+    """
+    Stands in for an engine object (CPU, Memory, Disk, Network, Sensors,
+    System): every public method call is forwarded and its result recorded
+    under `source`. Recording failures never reach the caller.
+    """
+
+    def __init__(self, obj: Any, recorder: Recorder, source: str):
+        self._obj = obj
+        self._recorder = recorder
+        self._source = source
+        self._methods: Dict[str, Callable] = {}
+
+    def __getattr__(self, name: str):
+        fn = self._methods.get(name)
+        if fn is not None:
+            return fn
+        attr = getattr(self._obj, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            value = attr(*args, **kwargs)
+            try:
+                self._recorder.record(self._source, name, args, kwargs, value)
+            except Exception:
+                self._recorder.errors += 1
+            return value
+
+        self._methods[name] = call
+        return call
+
+
+class RecordingReader:
+    """ProcessManager reader wrapper: records read()/read_one() rows under `source`."""
+
+    def __init__(self, reader: Any, recorder: Recorder, source: str = "processes"):
+        self._proxy = RecordingProxy(reader, recorder, source)
+
+    def read(self, attrs, pids=None, *args, **kwargs):
+        attrs = list(attrs)
+        if pids is None and not args and not kwargs:
+            return self._proxy.read(attrs)
+        return self._proxy.read(attrs, None if pids is None else list(pids), *args, **kwargs)
+
+    def read_one(self, pid: int, attrs):
+        return self._proxy.read_one(pid, list(attrs))
+
+    def __getattr__(self, name: str):
+        return getattr(self._proxy, name)
+
+
+# ---- okuma ----
+class RecordingLog:
+    """
+    Read side of a Recorder log. The index (or a scan of the log when the
+    index is missing or short, e.g. after a crash) gives per-key (ts, offset)
+    lists, so at(key, ts) is a bisect plus one record read. A torn last
+    record is ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.codec = _Codec()
+        self.keys: Dict[int, str] = {}             # id -> call_key
+        self._by_key: Dict[str, Tuple[List[float], List[int]]] = {}
+        self.times: List[float] = []               # tüm DATA kayıtlarının ts'leri (sıralı)
+        self._last: Dict[str, Tuple[int, Any]] = {}  # key -> son çözülen (sıra, JSON değeri)
+        self._lock = threading.RLock()
+        self._f = open(path, "rb")
+        if self._f.read(len(MAGIC)) != MAGIC:
+            self._f.close()
+            raise ValueError(f"{path}: not an engine recording")
+        self._size = os.fstat(self._f.fileno()).st_size
+        self.entries = self._entries()
+        self._load(self.entries)
+
+    def _entries(self) -> List[Tuple[int, int, float, int]]:
+        entries: List[Tuple[int, int, float, int]] = []
+        end = len(MAGIC)
+        try:
+            with open(self.path + ".idx", "rb") as f:
+                data = f.read()
+            if data[:len(IDX_MAGIC)] == IDX_MAGIC:
+                n = (len(data) - len(IDX_MAGIC)) // _ENTRY.size
+                entries = list(_ENTRY.iter_unpack(data[len(IDX_MAGIC):len(IDX_MAGIC) + n * _ENTRY.size]))
+        except OSError:
+            pass
+        # indeks kaydın gerisinde olabilir: geri kalanı günlükten tara
+        while entries:
+            kind, key, ts, offset = entries[-1]
+            self._f.seek(offset)
+            head = self._f.read(_HEAD.size)
+            if len(head) == _HEAD.size and offset + _HEAD.size + _HEAD.unpack(head)[4] <= self._size:
+                end = offset + _HEAD.size + _HEAD.unpack(head)[4]
+                break
+            entries.pop()
+        entries.extend(self._scan(end))
+        if entries:
+            self._f.seek(entries[-1][3])
+            end = entries[-1][3] + _HEAD.size + _HEAD.unpack(self._f.read(_HEAD.size))[4]
+        self.valid_end = end  # bundan sonrası yarım kalmış kayıt
+        return entries
+
+    def _scan(self, offset: int):
+        f = self._f
+        while offset + _HEAD.size <= self._size:
+            f.seek(offset)
+            kind, _, key, ts, n = _HEAD.unpack(f.read(_HEAD.size))
+            if offset + _HEAD.size + n > self._size:
+                break
+            yield kind, key, ts, offset
+            offset += _HEAD.size + n
+
+    def _load(self, entries) -> None:
+        by_id: Dict[int, Tuple[List[float], List[int]]] = {}
+        for kind, key, ts, offset in entries:
+            if kind == DATA:
+                tl, ol = by_id.setdefault(key, ([], []))
+                tl.append(ts)
+                ol.append(offset)
+                self.times.append(ts)
+            elif kind == KEY:
+                self.keys[key] = self._payload(offset)[1].decode("utf-8")
+            elif kind == TYPE:
+                self.codec.define(key, json.loads(self._payload(offset)[1]))
+        self.times.sort()
+        self._by_key = {self.keys[k]: v for k, v in by_id.items() if k in self.keys}
+
+    def _payload(self, offset: int) -> Tuple[int, bytes]:
+        with self._lock:
+            self._f.seek(offset)
+            _, flags, _, _, n = _HEAD.unpack(self._f.read(_HEAD.size))
+            data = self._f.read(n)
+        return flags, (zlib.decompress(data) if flags & _ZLIB else data)
+
+    def _encoded(self, key: str, i: int) -> Any:
+        """JSON value of the i-th record of key, with row deltas resolved."""
+        hit = self._last.get(key)
+        if hit is not None and hit[0] == i:
+            return hit[1]
+        flags, data = self._payload(self._by_key[key][1][i])
+        enc = json.loads(data)
+        if flags & _DELTA:
+            if hit is not None and hit[0] == i - 1:
+                base = hit[1]["v"]
+            else:
+                # keyframe'e kadar geri git, ileri doğru çöz
+                j = i - 1
+                while self._payload(self._by_key[key][1][j])[0] & _DELTA:
+                    j -= 1
+                for k in range(j, i):
+                    self._encoded(key, k)
+                base = self._last[key][1]["v"]
+            enc["v"] = [base[x] if x.__class__ is int else x for x in enc["v"]]
+        self._last[key] = (i, enc)
+        return enc
+
+    # ---- sorgu ----
+    @property
+    def start(self) -> Optional[float]:
+        return self.times[0] if self.times else None
+
+    @property
+    def end(self) -> Optional[float]:
+        return self.times[-1] if self.times else None
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def calls(self) -> List[Tuple[str, str, list, list]]:
+        """(source, method, args, kwargs) of every recorded call key."""
+        return [tuple(json.loads(k)) for k in self._by_key]
+
+    def series(self, key: str) -> List[float]:
+        return list(self._by_key.get(key, ((), ()))[0])
+
+    def at(self, key: str, ts: float) -> Any:
+        """Value recorded for key at or before ts (the first one if ts precedes it)."""
+        try:
+            tl, ol = self._by_key[key]
+        except KeyError:
+            raise LookupError(f"no recording for {key}") from None
+        i = max(bisect.bisect_right(tl, ts) - 1, 0)
+        with self._lock:
+            enc = self._encoded(key, i)
+        return self.codec.decode(enc)
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Player:
+    """
+    Replay clock over a RecordingLog. position() is recorded time:
+    speed=1 follows wall time, 10 plays ten times faster, 0 stays paused so
+    only seek()/step() move it (deterministic runs). Calls through
+    proxy(source) return what was recorded at the current position.
+    """
+
+    def __init__(self, log: RecordingLog, speed: float = 1.0, start: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, loop: bool = False):
+        self.log = log
+        self.clock = clock
+        self.loop = loop
+        self._lock = threading.Lock()
+        self._speed = speed
+        self._origin = log.start if start is None else start
+        self._t0 = clock()
+
+    @classmethod
+    def open(cls, path: str, **kwargs) -> "Player":
+        return cls(RecordingLog(path), **kwargs)
+
+    def position(self) -> Optional[float]:
+        if self._origin is None:
+            return None
+        with self._lock:
+            pos = self._origin + (self.clock() - self._t0) * self._speed
+        end, start = self.log.end, self.log.start
+        if pos > end:
+            if self.loop and end > start:
+                return start + (pos - start) % (end - start)
+            return end
+        return pos
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    def set_speed(self, speed: float) -> None:
+        with self._lock:
+            now = self.clock()
+            self._origin += (now - self._t0) * self._speed
+            self._t0, self._speed = now, speed
+
+    def pause(self) -> None:
+        self.set_speed(0.0)
+
+    def seek(self, ts: float) -> None:
+        with self._lock:
+            self._origin, self._t0 = ts, self.clock()
+
+    def step(self, n: int = 1, gap: float = 0.1) -> Optional[float]:
+        """
+        Move to the end of the n-th next burst of records (one collection
+        tick: records less than `gap` seconds apart); returns the new position.
+        """
+        times = self.log.times
+        pos = self.position()
+        if pos is None:
+            return None
+        i = bisect.bisect_right(times, pos)
+        for _ in range(n):
+            if i >= len(times):
+                break
+            while i + 1 < len(times) and times[i + 1] - times[i] < gap:
+                i += 1
+            pos = times[i]
+            i += 1
+        self.seek(pos)
+        return pos
+
+    @property
+    def at_end(self) -> bool:
+        pos = self.position()
+        return pos is None or (not self.loop and pos >= self.log.end)
+
+    def value(self, source: str, method: str, args: tuple = (), kwargs: Optional[dict] = None) -> Any:
+        pos = self.position()
+        if pos is None:
+            raise LookupError(f"{self.log.path}: empty recording")
+        return self.log.at(call_key(source, method, args, kwargs or {}), pos)
+
+    def proxy(self, source: str) -> "ReplayProxy":
+        return ReplayProxy(self, source)
+
+    def reader(self, source: str = "processes") -> "ReplayReader":
+        return ReplayReader(self, source)
+
+    def engine(self, sources=None) -> Dict[str, "ReplayProxy"]:
+        """{source: ReplayProxy} for every recorded engine source (or the given ones)."""
+        if sources is None:
+            sources = sorted({c[0] for c in self.log.calls()} & set(SOURCES))
+        return {src: ReplayProxy(self, src) for src in sources}
+
+
+class ReplayProxy:
+    """Stands in for an engine object; method calls return recorded results."""
+
+    def __init__(self, player: Player, source: str):
+        self._player = player
+        self._source = source
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            return self._player.value(self._source, name, args, kwargs)
+
+        call.__name__ = name
+        return call
+
+
+class ReplayReader:
+    """ProcessManager reader that serves recorded rows (see RecordingReader)."""
+
+    def __init__(self, player: Player, source: str = "processes"):
+        self._proxy = ReplayProxy(player, source)
+
+    def read(self, attrs, pids=None, *args, **kwargs):
+        attrs = list(attrs)
+        if pids is None and not args and not kwargs:
+            return self._proxy.read(attrs)
+        return self._proxy.read(attrs, None if pids is None else list(pids), *args, **kwargs)
+
+    def read_one(self, pid: int, attrs):
+        try:
+            return self._proxy.read_one(pid, list(attrs))
+        except LookupError:
+            return None  # kayıtta yok: ProcessManager önceki değeri korur
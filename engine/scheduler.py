@@ -0,0 +1,177 @@
+# scheduler.py
+import threading
+import time
+from typing import List, Dict, Any, Callable, NamedTuple, Optional
+
+from .instrument import instruments
+
+
+class Sample(NamedTuple):
+    ts: float                 # time.time() at collection
+    mono: float               # time.monotonic() at collection
+    value: Any
+    duration: float           # seconds spent in the collector
+    error: Optional[BaseException] = None
+
+
+class _Collector:
+    __slots__ = ("name", "fn", "interval", "next_due", "latest", "lock")
+
+    def __init__(self, name: str, fn: Callable[[], Any], interval: float):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.next_due = 0.0
+        self.latest: Optional[Sample] = None
+        self.lock = threading.Lock()
+
+
+class Sampler:
+    """
+    One thread that runs every registered collector at its own interval.
+    Collectors due within `coalesce` seconds of each other run in the same
+    wake-up. get()/sample() serve the most recent result; without the thread
+    running, a result younger than the collector's interval is reused and
+    concurrent callers share a single poll.
+    """
+
+    def __init__(self, coalesce: float = 0.05):
+        self.coalesce = coalesce
+        self._collectors: Dict[str, _Collector] = {}
+        self._listeners: List[Callable[[str, Sample], None]] = []
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    # ---- kayıt ----
+    def add(self, name: str, fn: Callable[[], Any], interval: float) -> None:
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        self._collectors[name] = _Collector(name, fn, interval)
+        self._wake.set()
+
+    def set_interval(self, name: str, interval: float) -> None:
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        c = self._collectors[name]
+        c.interval = interval
+        c.next_due = min(c.next_due, time.monotonic() + interval)
+        self._wake.set()
+
+    def names(self) -> List[str]:
+        return list(self._collectors)
+
+    def add_listener(self, fn: Callable[[str, Sample], None]) -> None:
+        """fn(name, sample) is called after every collection."""
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[str, Sample], None]) -> None:
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    # ---- toplama ----
+    def _collect(self, c: _Collector) -> Sample:
+        t0 = time.monotonic()
+        try:
+            value, err = c.fn(), None
+        except Exception as e:
+            value, err = None, e
+        s = Sample(time.time(), t0, value, time.monotonic() - t0, err)
+        c.latest = s
+        for fn in list(self._listeners):
+            try:
+                # dinleyici hatası toplamayı durdurmasın; monitor_stats'ta sayılır
+                with instruments.timer("sampler.listener"):
+                    fn(c.name, s)
+            except Exception:
+                pass
+        return s
+
+    def run_pending(self, now: Optional[float] = None) -> List[str]:
+        """Run every collector due at now (+coalesce); returns their names."""
+        now = time.monotonic() if now is None else now
+        ran = []
+        for c in list(self._collectors.values()):
+            if c.next_due > now + self.coalesce:
+                continue
+            with c.lock:
+                self._collect(c)
+            # kayma olmasın; geride kalındıysa bir sonraki aralığa atla
+            c.next_due = c.next_due + c.interval if c.next_due + c.interval > now else now + c.interval
+            ran.append(c.name)
+        return ran
+
+    def _loop(self) -> None:
+        while self._running:
+            self.run_pending()
+            self._wake.clear()
+            if not self._collectors:
+                self._wake.wait()
+                continue
+            wait = min(c.next_due for c in self._collectors.values()) - time.monotonic()
+            if wait > 0:
+                self._wake.wait(wait)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def reset(self) -> None:
+        """Forget cached results so every collector runs again on next use."""
+        for c in self._collectors.values():
+            with c.lock:
+                c.latest = None
+                c.next_due = 0.0
+        self._wake.set()
+
+    # ---- okuma ----
+    def latest(self, name: str) -> Optional[Sample]:
+        return self._collectors[name].latest
+
+    def sample(self, name: str) -> Sample:
+        c = self._collectors[name]
+        s = c.latest
+        if s is not None and (self._running or time.monotonic() - s.mono < c.interval):
+            return s
+        with c.lock:
+            # beklerken başka bir çağıran toplamış olabilir
+            s = c.latest
+            if s is None or time.monotonic() - s.mono >= c.interval:
+                s = self._collect(c)
+        return s
+
+    def get(self, name: str) -> Any:
+        """Latest value of a collector; re-raises the collector's error."""
+        s = self.sample(name)
+        if s.error is not None:
+            raise s.error
+        return s.value
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        out = {}
+        for name, c in self._collectors.items():
+            s = c.latest
+            out[name] = {
+                "interval": c.interval,
+                "age": (now - s.mono) if s else None,
+                "duration": s.duration if s else None,
+                "error": repr(s.error) if s and s.error else None,
+            }
+        return out
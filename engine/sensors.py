@@ -1,6 +1,8 @@
 import psutil
 from typing import Dict, Any, Optional
+from .instrument import instruments
 
+@instruments.instrument_class("sensors")
 class Sensors:
     def get_temperatures(self) -> Optional[Dict[str, Any]]:
         try:
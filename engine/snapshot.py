@@ -0,0 +1,69 @@
+# snapshot.py
+from typing import Dict, Any, Iterator, Optional, Sequence, Tuple
+
+from .columnar import ColumnarSnapshot
+from .proctable import ProcessDelta
+from .proctree import ProcessTree
+
+
+class ProcessSnapshot:
+    """
+    Immutable, versioned result of one ProcessManager refresh.
+    Readers can keep a reference without locking or copying; rows must be
+    treated as read-only since unchanged rows are shared with later snapshots.
+    """
+
+    __slots__ = ("_version", "_ts", "_rows", "_delta", "_attrs", "_columns", "_tree")
+
+    def __init__(self, version: int, ts: Optional[float], rows: Sequence[Dict[str, Any]],
+                 delta: Optional[ProcessDelta] = None, attrs: Sequence[str] = ()):
+        self._version = version
+        self._ts = ts
+        self._rows: Tuple[Dict[str, Any], ...] = tuple(rows)
+        self._delta = delta if delta is not None else ProcessDelta()
+        self._attrs = tuple(attrs)
+        self._columns: Optional[ColumnarSnapshot] = None
+        self._tree: Optional[ProcessTree] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def ts(self) -> Optional[float]:
+        """time.time() at which the snapshot was taken (None before the first one)."""
+        return self._ts
+
+    @property
+    def rows(self) -> Tuple[Dict[str, Any], ...]:
+        return self._rows
+
+    @property
+    def delta(self) -> ProcessDelta:
+        return self._delta
+
+    @property
+    def columns(self) -> ColumnarSnapshot:
+        """Columnar view, built on first use and shared by every reader."""
+        cols = self._columns
+        if cols is None:
+            # aynı anda iki okuyucu kurarsa biri kazanır; sonuç aynı
+            cols = self._columns = ColumnarSnapshot.from_rows(self._rows, self._attrs or None)
+        return cols
+
+    @property
+    def tree(self) -> ProcessTree:
+        """Parent/children index with subtree rollups, built on first use."""
+        tree = self._tree
+        if tree is None:
+            tree = self._tree = ProcessTree(self._rows)
+        return tree
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._rows)
+
+    def __repr__(self) -> str:
+        return f"ProcessSnapshot(version={self._version}, ts={self._ts}, rows={len(self._rows)})"
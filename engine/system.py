@@ -1,7 +1,9 @@
 import psutil
 import datetime
 from typing import List
+from .instrument import instruments
 
+@instruments.instrument_class("system")
 class System:
     def get_boot_time(self) -> str:
         bt = psutil.boot_time()
@@ -0,0 +1,82 @@
+# usercache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Callable
+
+try:
+    import pwd
+    import grp
+except ImportError:  # Windows
+    pwd = None
+    grp = None
+
+
+class NameCache:
+    """
+    Bounded LRU cache for uid/gid -> name with TTL eviction.
+    Unknown ids are cached too (as str(id), like psutil does), so a slow NSS
+    backend (sssd, LDAP) is queried at most once per id per ttl.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # (kind, id) -> (name, expires)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, kind: str, ident: int, resolve: Callable[[int], str]) -> str:
+        key = (kind, ident)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        # NSS çağrısı kilit dışında; yavaş bir sorgu diğer okuyucuları bekletmesin
+        try:
+            name = resolve(ident)
+        except (KeyError, OverflowError):
+            name = str(ident)
+        with self._lock:
+            self._entries[key] = (name, now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return name
+
+    def user(self, uid: int) -> str:
+        if pwd is None:
+            return str(uid)
+        return self._lookup("u", uid, lambda i: pwd.getpwuid(i).pw_name)
+
+    def group(self, gid: int) -> str:
+        if grp is None:
+            return str(gid)
+        return self._lookup("g", gid, lambda i: grp.getgrgid(i).gr_name)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# engine genelinde paylaşılan varsayılan önbellek
+name_cache = NameCache()
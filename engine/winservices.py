@@ -1,5 +1,8 @@
 import psutil
 
+from .instrument import instruments
+
+@instruments.instrument_class("winservices")
 class WinServices:
     def list_services(self):
         return list(psutil.win_service_iter())
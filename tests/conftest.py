@@ -0,0 +1,10 @@
+# conftest.py
+import pytest
+
+from benchmarks.fixtures import make_fake_proc
+
+
+@pytest.fixture
+def fake_proc(tmp_path):
+    """A synthetic /proc tree with 200 pids for ProcfsReader(root=...)."""
+    return make_fake_proc(200, root=str(tmp_path))
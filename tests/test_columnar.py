@@ -0,0 +1,43 @@
+# test_columnar.py
+import random
+
+import pytest
+
+from engine.columnar import ColumnarSnapshot
+
+
+def _rows(n=300, seed=1):
+    rnd = random.Random(seed)
+    rows = []
+    for pid in rnd.sample(range(1, 10 * n), n):
+        rows.append({
+            "pid": pid,
+            "cpu_percent": rnd.choice((None, 0.0, 0.0, 1.5, rnd.random() * 100)),
+            "num_threads": rnd.randint(1, 8),
+            "name": rnd.choice((None, "a", "b", "c", "sshd", "python")),
+            "username": rnd.choice(("root", "alice", None)),
+        })
+    return rows
+
+
+@pytest.mark.parametrize("by", ["cpu_percent", "num_threads", "name", "missing_field"])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_top_matches_full_order(by, reverse):
+    for k in (0, 1, 5, 30, 299, 300, 500):
+        snap = ColumnarSnapshot.from_rows(_rows())
+        full = snap.order(by, reverse=reverse)
+        assert snap.top(by, k, reverse=reverse) == full[:k], k
+        # ikinci çağrı önbellekten gelir
+        assert snap.top(by, k, reverse=reverse) == full[:k], k
+
+
+@pytest.mark.parametrize("by", ["cpu_percent", "name"])
+def test_query_limit_matches_sorted_rows(by):
+    rows = _rows()
+    snap = ColumnarSnapshot.from_rows(rows)
+    for user in (None, "alice"):
+        subset = [r for r in rows if user is None or r["username"] == user]
+        # eksik değerler reverse'te başa gelir, eşitlikte pid sırası
+        want = sorted(subset, key=lambda r: (r[by] is None, r[by] if r[by] is not None else 0, r["pid"]), reverse=True)
+        got = snap.query(sort_by=by, limit=10, user=user, fields=["pid", by])
+        assert got == [{"pid": r["pid"], by: r[by]} for r in want[:10]]
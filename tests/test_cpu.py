@@ -0,0 +1,17 @@
+# test_cpu.py
+import time
+
+from engine import CPU
+
+
+def _burn(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_first_get_percent_is_primed():
+    cpu = CPU()
+    _burn(0.2)
+    assert cpu.get_percent() > 0.0
+    assert len(cpu.get_percent(percpu=True)) >= 1
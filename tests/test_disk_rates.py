@@ -0,0 +1,17 @@
+# test_disk_rates.py
+import time
+
+import pytest
+
+from bridge import clean
+
+
+def test_disk_rates_use_fresh_counters():
+    first = clean.disk_io(True, rates=True, raw=True)
+    if not first:
+        pytest.skip("no disks")
+    time.sleep(0.2)
+    second = clean.disk_io(True, rates=True, raw=True)
+    # sampler aralığı (5 s) dolmadan ikinci çağrı hız üretir
+    assert any(v["read_bps"] is not None for v in second.values())
+    assert all(v["util_percent"] is None or 0.0 <= v["util_percent"] <= 100.0 for v in second.values())
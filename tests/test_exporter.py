@@ -0,0 +1,120 @@
+# test_exporter.py
+import gzip
+import urllib.error
+import urllib.request
+
+import pytest
+
+from bridge import exporter
+from bridge.exporter import OPENMETRICS_TYPE, TEXT_TYPE, Exporter, _Family, _accepts_gzip, _labels, render
+
+
+def test_render_counter_naming_and_eof():
+    f = _Family("x_reads", "counter", "Reads.")
+    f.add(3, _labels(disk="sda"), "_total")
+    om = render([f], openmetrics=True).decode()
+    assert om.splitlines() == ["# HELP x_reads Reads.", "# TYPE x_reads counter",
+                               'x_reads_total{disk="sda"} 3', "# EOF"]
+    text = render([f], openmetrics=False).decode()
+    assert "# TYPE x_reads_total counter" in text and "# EOF" not in text
+
+
+def test_label_escaping_and_missing_values():
+    f = _Family("g", "gauge", "G.")
+    f.add(1.5, _labels(name='a"b\\c\nd'))
+    f.add("-")                                   # sayısal olmayan değer atlanır
+    f.add(float("inf"))
+    lines = render([f]).decode().splitlines()
+    assert lines[2] == 'g{name="a\\"b\\\\c\\nd"} 1.5'
+    assert lines[3] == "g +Inf"
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("", False),
+    ("gzip", True),
+    ("deflate, gzip;q=0.5", True),
+    ("gzip;q=0", False),
+    ("gzip;q=0.0, *", False),
+    ("*;q=0, gzip", True),
+    ("*", True),
+    ("gzip;q=abc", True),
+    ("gzip; level=1; q=0", False),
+])
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(header) is expected
+
+
+@pytest.fixture
+def served():
+    exp = Exporter(top_n=0)
+    exp.start(port=0)
+    yield exp
+    exp.stop()
+
+
+def _get(url, **headers):
+    with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=30) as r:
+        return r.headers, r.read()
+
+
+def test_http_negotiation(served):
+    h, body = _get(served.url, Accept="application/openmetrics-text; version=1.0.0")
+    assert h["Content-Type"] == OPENMETRICS_TYPE
+    assert body.rstrip().endswith(b"# EOF")
+
+    h, body = _get(served.url, **{"Accept-Encoding": "gzip"})
+    assert h["Content-Type"] == TEXT_TYPE and h["Content-Encoding"] == "gzip"
+    assert b"# EOF" not in gzip.decompress(body)
+
+    h, body = _get(served.url, **{"Accept-Encoding": "gzip;q=abc"})
+    assert h["Content-Encoding"] == "gzip"
+    assert served.scrapes == 3
+
+
+def test_histogram_inf_bucket_matches_count(served):
+    _, body = _get(served.url)
+    inf, count = {}, {}
+    for line in body.decode().splitlines():
+        if line.startswith("psutil_bridge_call_duration_seconds_bucket") and 'le="+Inf"' in line:
+            inf[line.split('call="')[1].split('"')[0]] = line.rsplit(" ", 1)[1]
+        elif line.startswith("psutil_bridge_call_duration_seconds_count"):
+            count[line.split('call="')[1].split('"')[0]] = line.rsplit(" ", 1)[1]
+    assert inf and inf == count
+
+
+def test_payload_error_returns_500(served, monkeypatch):
+    def boom(*a):
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr(exporter.Exporter, "payload", boom)
+    with pytest.raises(urllib.error.HTTPError) as e:
+        _get(served.url)
+    assert e.value.code == 500 and b"RuntimeError: broken" in e.value.read()
+
+
+def test_duplicate_sensor_labels_get_unique_series():
+    from collections import namedtuple
+
+    from bridge import clean
+    from engine.scheduler import Sampler
+
+    sfan = namedtuple("sfan", ["label", "current"])
+    shwtemp = namedtuple("shwtemp", ["label", "current", "high", "critical"])
+    sampler = Sampler()
+    for name in clean.sampler.names():
+        sampler.add(name, lambda: None, interval=60)
+    sampler.add("fans", lambda: {"nct": [sfan("cpu", 1000), sfan("cpu", 1200), sfan("", 900)]}, interval=60)
+    sampler.add("temperatures", lambda: {"k10": [shwtemp("Tctl", 40.0, None, None)] * 2}, interval=60)
+    exp = Exporter(sampler=sampler, top_n=0, self_metrics=False)
+    try:
+        lines = exp.payload().decode().splitlines()
+    finally:
+        exp.stop()
+    fans = [l for l in lines if l.startswith("psutil_bridge_fan_speed_rpm{")]
+    assert fans == ['psutil_bridge_fan_speed_rpm{chip="nct",sensor="cpu"} 1000',
+                    'psutil_bridge_fan_speed_rpm{chip="nct",sensor="cpu_1"} 1200',
+                    'psutil_bridge_fan_speed_rpm{chip="nct",sensor="2"} 900']
+    temps = [l.split(" ")[0] for l in lines if l.startswith("psutil_bridge_temperature_celsius{")]
+    assert len(temps) == len(set(temps)) == 2
+    series = [l.rsplit(" ", 1)[0] for l in lines if not l.startswith("#")]
+    assert len(series) == len(set(series))
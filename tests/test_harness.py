@@ -0,0 +1,55 @@
+# test_harness.py
+import io
+import math
+
+from benchmarks import harness
+from benchmarks.harness import Case, Runner
+
+
+def test_percentile_interpolates():
+    assert harness.percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert harness.percentile([5.0], 99) == 5.0
+    assert math.isnan(harness.percentile([], 50))
+
+
+def test_compare_flags_time_and_memory_regressions():
+    base = {"a": {"p50": 1e-3, "alloc_peak": 1000},
+            "b": {"p50": 1e-3, "alloc_peak": 1000},
+            "c": {"p50": 1e-3, "alloc_peak": 1000},
+            "d": {"p50": 1e-6, "alloc_peak": 1000}}
+    now = {"a": {"p50": 2e-3, "alloc_peak": 1000},
+           "b": {"p50": 0.5e-3, "alloc_peak": 1000},
+           "c": {"p50": 1e-3, "alloc_peak": 1 << 20},
+           "d": {"p50": 3e-6, "alloc_peak": 1000},   # floor altında
+           "new": {"p50": 1.0, "alloc_peak": 0}}
+    status = {r["name"]: r["status"] for r in harness.compare(now, base)}
+    assert status == {"a": "slower", "b": "faster", "c": "more memory", "d": "ok"}
+
+
+def test_runner_reports_failures_without_raising():
+    out = io.StringIO()
+    calls = []
+    runner = Runner(repeat=3, max_time=None, match=["ok", "boom"], out=out)
+
+    def boom():
+        raise RuntimeError("x")
+
+    runner.run([Case("g/ok", lambda: calls.append(1), number=2), Case("g/boom", boom), Case("g/skipped", boom)])
+    assert runner.results["g/ok"]["n"] == 3
+    assert len(calls) == 1 + 3 * 2 + 1     # warmup + ölçümler + tracemalloc
+    assert runner.errors == {"g/boom": "RuntimeError: x"}
+    assert "g/skipped" not in out.getvalue()
+
+
+def test_clean_suite_leaves_history_alone():
+    from bridge import clean
+    from benchmarks.suites import clean_suite
+
+    before = clean.history
+    names = before.names()
+    cases = clean_suite(cold=False)
+    next(cases)
+    assert clean.history is not before
+    cases.close()
+    assert clean.history is before and clean._recorder.history is before
+    assert before.names() == names
@@ -0,0 +1,50 @@
+# test_inodes.py
+import os
+
+from engine.inodes import SocketIndex
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _add_socket(root, pid, fd, inode):
+    d = os.path.join(root, str(pid), "fd")
+    os.makedirs(d, exist_ok=True)
+    os.symlink(f"socket:[{inode}]", os.path.join(d, str(fd)))
+
+
+def test_resolve_finds_new_sockets_of_known_pids(tmp_path):
+    root = str(tmp_path)
+    _add_socket(root, 1, 3, 111)
+    clock = _Clock()
+    idx = SocketIndex(root=root, clock=clock)
+    idx.sync_pids([1])
+    assert idx.resolve([111]) == {111: (1, 3)}
+    _add_socket(root, 1, 4, 222)
+    clock.now += 5
+    assert idx.resolve([222]) == {222: (1, 4)}
+
+
+def test_unowned_inodes_are_not_rescanned_until_interval(tmp_path):
+    root = str(tmp_path)
+    for pid in (1, 2, 3):
+        _add_socket(root, pid, 3, 100 + pid)
+    clock = _Clock()
+    idx = SocketIndex(root=root, rescan_interval=2.0, clock=clock)
+    idx.sync_pids([1, 2, 3])
+    clock.now += 5
+    scans = idx.scans
+    assert idx.resolve([101, 999]) == {101: (1, 3)}
+    assert idx.scans > scans
+    scans = idx.scans
+    for _ in range(3):
+        assert idx.resolve([999, 102]) == {102: (2, 3)}
+    assert idx.scans == scans
+    clock.now += 5
+    idx.resolve([999])
+    assert idx.scans > scans
@@ -0,0 +1,57 @@
+# test_instrument.py
+import pytest
+
+from engine.instrument import BUCKETS, Histogram, Instruments
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_histogram_buckets_and_quantiles():
+    h = Histogram()
+    for v in (1e-3, 1e-3, 2e-3, 40.0):
+        h.add(v)
+    b = h.buckets()
+    assert len(b) == len(BUCKETS) + 1 and b[-1] == (float("inf"), 4)
+    assert h.quantile(0.5) <= 2.5e-3
+    assert h.quantile(1.0) == 40.0
+
+
+def test_detail_keeps_one_stat_and_tags_stuck():
+    clock = FakeClock()
+    ins = Instruments(clock=clock)
+    for mount in ("/", "/boot", "/home"):
+        with ins.timer("disk.disk_usage", detail=mount):
+            clock.now += 0.001
+    assert list(ins.stats()) == ["disk.disk_usage"]
+    assert ins.stats()["disk.disk_usage"]["calls"] == 3
+
+    cm = ins.timer("disk.disk_usage", detail="/mnt/nfs")
+    cm.__enter__()
+    clock.now += 10.0
+    assert ins.stuck(5.0) == {"disk.disk_usage:/mnt/nfs": pytest.approx(10.0)}
+    st = ins.stats()["disk.disk_usage"]
+    assert st["in_flight"] == 1 and st["oldest_in_flight_s"] == pytest.approx(10.0)
+    cm.__exit__(None, None, None)
+    assert ins.stuck(5.0) == {}
+    assert list(ins.stats()) == ["disk.disk_usage"]
+
+
+def test_errors_counted_by_type():
+    ins = Instruments()
+
+    @ins.instrumented("x.fail")
+    def fail():
+        raise KeyError("k")
+
+    with pytest.raises(KeyError):
+        fail()
+    st = ins.stats("x.")["x.fail"]
+    assert st["errors"] == {"KeyError": 1} and st["in_flight"] == 0
+    ins.reset()
+    assert ins.stats("x.")["x.fail"]["calls"] == 0
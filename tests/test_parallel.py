@@ -0,0 +1,38 @@
+# test_parallel.py
+import threading
+
+from engine import ProcessManager, ProcfsReader, ShardedReader
+
+ATTRS = ["pid", "name", "ppid", "num_threads", "create_time"]
+
+
+def _shard_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("proc-shard")]
+
+
+def test_sharded_read_matches_single_reader(fake_proc):
+    single = ProcfsReader(root=fake_proc).read(ATTRS)
+    sharded = ShardedReader(lambda: ProcfsReader(root=fake_proc), 3)
+    try:
+        assert sharded.read(ATTRS) == single
+        assert sharded.read_one(7, ATTRS) == ProcfsReader(root=fake_proc).read_one(7, ATTRS)
+    finally:
+        sharded.close()
+
+
+def test_close_stops_pool_and_read_restarts_it(fake_proc):
+    sharded = ShardedReader(lambda: ProcfsReader(root=fake_proc), 2)
+    sharded.read(ATTRS)
+    sharded.close()
+    assert not _shard_threads()
+    assert len(sharded.read(ATTRS)) == 200
+    sharded.close()
+
+
+def test_process_manager_stop_releases_shard_threads(fake_proc):
+    reader = ShardedReader(lambda: ProcfsReader(ad_value="-", root=fake_proc), 2)
+    pm = ProcessManager(interval=0.05, reader=reader)
+    for _ in range(2):
+        assert pm.start(timeout=5, warmup=0)
+        pm.stop()
+        assert not _shard_threads()
@@ -0,0 +1,18 @@
+# test_parser.py
+import pytest
+
+from bridge.parser import SimpleParse
+
+
+@pytest.mark.parametrize("value", [[1], {"a": 1}, "x", float("nan"), 1e20, 0, 1700000000.5])
+def test_format_ctime_many_matches_single(value):
+    p = SimpleParse()
+    assert p.format_ctime_many([value, value]) == [p.format_ctime(value)] * 2
+
+
+def test_format_ctime_many_none_and_memo():
+    p = SimpleParse()
+    assert p.format_ctime_many([None, 0, 0], none="?") == ["?", p.format_ctime(0), p.format_ctime(0)]
+    q = SimpleParse()
+    q.format_ctime_many([[1], [2]])
+    assert len(q._ctime_memo()) == 0
@@ -0,0 +1,21 @@
+# test_process_details.py
+import os
+
+import pytest
+
+from bridge import clean
+
+
+def test_unknown_field_is_a_value_error():
+    with pytest.raises(ValueError, match="bogus"):
+        clean.process_details(os.getpid(), fields=["bogus"])
+    with pytest.raises(ValueError, match="bogus"):
+        clean.process_details_many([os.getpid()], fields=["memory", "bogus"])
+
+
+def test_details_many_selected_fields():
+    me = os.getpid()
+    out = clean.process_details_many([me, 2 ** 22 + 1], fields=["memory", "threads"], budget=5.0)
+    assert set(out[me]) >= {"pid", "memory", "threads"}
+    assert "partial" not in out[me]
+    assert "error" in out[2 ** 22 + 1]
@@ -0,0 +1,90 @@
+# test_processes.py
+import os
+import subprocess
+import sys
+
+import pytest
+
+from engine.instrument import instruments
+from engine.processes import PsutilReader, ProcessManager
+
+
+def _short_lived(n):
+    for _ in range(n):
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+
+def test_read_one_does_not_cache_processes():
+    reader = PsutilReader(ad_value="-")
+    row = reader.read_one(os.getpid(), ["pid", "name", "cmdline"])
+    assert row["pid"] == os.getpid()
+    assert reader._procs == {}
+    assert reader.read_one(2 ** 22 + 1, ["pid"]) is None
+
+
+def test_process_iter_prunes_dead_pids():
+    reader = PsutilReader(ad_value="-")
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    reader.read(["pid"], [os.getpid(), child.pid])
+    child.wait()
+    rows = reader.read(["pid"])
+    assert child.pid not in reader._procs
+    assert set(reader._procs) <= {r["pid"] for r in rows}
+
+
+def test_refresh_policy_cache_tracks_live_table():
+    pm = ProcessManager(ad_value="-")
+    pm._take_snapshot()
+    for _ in range(3):
+        _short_lived(5)
+        pm._take_snapshot()
+    assert len(pm.reader._procs) <= len(pm.snapshot())
+
+
+class FlakyReader:
+    """Fails on the calls listed in `fail` (0-based), returns one row otherwise."""
+
+    def __init__(self, fail):
+        self.fail = set(fail)
+        self.calls = 0
+
+    def read(self, attrs, pids=None):
+        n = self.calls
+        self.calls += 1
+        if n in self.fail:
+            raise RuntimeError(f"read {n}")
+        return [{"pid": 1, "name": "init", "create_time": 1.0}]
+
+    def read_one(self, pid, attrs):
+        return None
+
+
+def test_first_read_error_is_raised_and_restartable():
+    pm = ProcessManager(interval=0.01, attrs=["pid", "name", "create_time"], reader=FlakyReader({0}))
+    with pytest.raises(RuntimeError, match="read 0"):
+        pm.start(warmup=0)
+    assert not pm._running and pm.wait_for_newer(0, None) is None
+    assert pm.start(timeout=5, warmup=0) is True
+    pm.stop()
+
+
+def test_later_tick_errors_keep_the_loop_alive():
+    pm = ProcessManager(interval=0.01, attrs=["pid", "name", "create_time"], reader=FlakyReader({1, 2}))
+    assert pm.start(timeout=5, warmup=0)
+    try:
+        assert pm.wait_for_newer(1, 5) is not None
+        assert pm._thread.is_alive() and pm.last_error is None
+    finally:
+        pm.stop()
+
+
+def test_listener_errors_are_counted():
+    before = instruments.stats("processes.listener").get("processes.listener", {}).get("error_count", 0)
+    pm = ProcessManager(attrs=["pid", "name", "create_time"], reader=FlakyReader(()))
+    seen = []
+    pm.add_listener(lambda snap: 1 / 0)
+    pm.add_listener(seen.append)
+    pm._take_snapshot()
+    assert len(seen) == 1
+    st = instruments.stats("processes.listener")["processes.listener"]
+    assert st["error_count"] == before + 1 and st["errors"]["ZeroDivisionError"] >= 1
@@ -0,0 +1,61 @@
+# test_procfs.py
+import os
+
+import pytest
+
+from engine.procfs import ProcfsReader, pmem
+
+ATTRS = sorted(ProcfsReader.SUPPORTED_ATTRS)
+
+
+def _stat_fields(root, pid):
+    with open(os.path.join(root, str(pid), "stat")) as f:
+        data = f.read()
+    return data[data.rfind(")") + 2:].split()
+
+
+def test_rows_match_fixture_files(fake_proc):
+    reader = ProcfsReader(root=fake_proc)
+    rows = reader.read(ATTRS)
+    assert [r["pid"] for r in rows] == list(range(1, 201))
+    assert all(set(r) == set(ATTRS) for r in rows)
+
+    r = rows[41]
+    f = _stat_fields(fake_proc, 42)
+    page = os.sysconf("SC_PAGE_SIZE")
+    with open(os.path.join(fake_proc, "42", "statm")) as fh:
+        statm = [int(x) * page for x in fh.read().split()]
+    assert r["name"] == "worker-42"
+    assert r["ppid"] == int(f[1]) and r["nice"] == int(f[16]) and r["num_threads"] == int(f[17])
+    assert r["create_time"] == pytest.approx(1700000000 + int(f[19]) / os.sysconf("SC_CLK_TCK"))
+    assert r["memory_info"] == pmem(statm[1], statm[0], *statm[2:])
+    assert r["memory_percent"] == pytest.approx(statm[1] / (32768000 * 1024) * 100)
+    assert r["uids"].real == r["gids"].real
+    assert r["cmdline"] == ["/usr/bin/worker-42", "--id", "42"]
+    assert r["cpu_percent"] == 0.0      # ilk okuma: karşılaştırılacak önceki değer yok
+
+
+def test_dead_pid_and_partial_read(fake_proc):
+    reader = ProcfsReader(root=fake_proc)
+    assert reader.read_one(9999, ["pid", "name"]) is None
+    rows = reader.read(["pid", "name"], pids=[3, 9999, 5])
+    assert rows == [{"pid": 3, "name": "worker-3"}, {"pid": 5, "name": "worker-5"}]
+
+
+def test_cpu_state_pruned_for_vanished_pids(fake_proc):
+    reader = ProcfsReader(root=fake_proc)
+    reader.read(["pid", "cpu_percent"])
+    assert len(reader._last_cpu) == 200
+    for name in os.listdir(os.path.join(fake_proc, "200")):
+        os.unlink(os.path.join(fake_proc, "200", name))
+    os.rmdir(os.path.join(fake_proc, "200"))
+    reader.read(["pid", "cpu_percent"])
+    assert 200 not in reader._last_cpu and len(reader._last_cpu) == 199
+
+
+def test_long_cmdline_beyond_buffer(fake_proc):
+    args = ["x" * 100] * 50
+    with open(os.path.join(fake_proc, "7", "cmdline"), "wb") as fh:
+        fh.write(b"\x00".join(a.encode() for a in args) + b"\x00")
+    reader = ProcfsReader(root=fake_proc, bufsize=256)
+    assert reader.read_one(7, ["cmdline"])["cmdline"] == args
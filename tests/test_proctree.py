@@ -0,0 +1,50 @@
+# test_proctree.py
+import pytest
+
+from engine.procfs import pmem
+from engine.proctree import ProcessTree
+
+
+def _rows(*pairs, **extra):
+    return [dict(pid=p, ppid=pp, cpu_percent=1.0, num_threads=2, **extra) for p, pp in pairs]
+
+
+def test_rollups_and_structure():
+    t = ProcessTree(_rows((1, 0), (2, 1), (3, 1), (4, 2)))
+    assert t.roots() == (1,)
+    assert t.children(1) == (2, 3)
+    assert t.ancestors(4) == [2, 1]
+    assert list(t.descendants(1)) == [2, 4, 3]
+    assert t.subtree(1) == {"cpu_percent": 4.0, "num_threads": 8, "count": 4}
+    assert t.depth(4) == 2
+    assert [p for p, _ in t.top("count", parent=1)] == [2, 3]
+
+
+def test_cycle_detaches_a_member_not_a_descendant():
+    t = ProcessTree([{"pid": 100, "ppid": 200}, {"pid": 200, "ppid": 100}, {"pid": 50, "ppid": 100}])
+    assert t.roots() == (100,)
+    assert t.parent(50) == 100
+    assert t.subtree(100)["count"] == 3
+    assert t.subtree(200)["count"] == 1
+
+
+def test_two_cycles_and_self_parent():
+    t = ProcessTree([
+        {"pid": 1, "ppid": 2}, {"pid": 2, "ppid": 1},
+        {"pid": 10, "ppid": 11}, {"pid": 11, "ppid": 12}, {"pid": 12, "ppid": 10}, {"pid": 5, "ppid": 12},
+        {"pid": 7, "ppid": 7},
+    ])
+    assert t.roots() == (1, 7, 10)
+    assert t.subtree(10)["count"] == 4
+    assert sum(t.subtree(r)["count"] for r in t.roots()) == len(t)
+
+
+def test_rss_rollup_only_with_memory_rows():
+    t = ProcessTree(_rows((1, 0), (2, 1)))
+    assert "rss" not in t.fields
+    with pytest.raises(ValueError):
+        t.total(1, "rss")
+    mem = pmem(4096, 0, 0, 0, 0, 0, 0)
+    t = ProcessTree(_rows((1, 0), (2, 1), memory_info=mem))
+    assert t.total(1, "rss") == 8192
+    assert ProcessTree(_rows((1, 0), (2, 1), rss=10)).subtree(1)["rss"] == 20
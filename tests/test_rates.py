@@ -0,0 +1,67 @@
+# test_rates.py
+import pytest
+
+from engine.proctable import ProcessDelta
+from engine.rates import RateTracker
+
+
+def test_rate_and_repeated_sample():
+    rt = RateTracker()
+    assert rt.update("a", 100, ts=0.0) is None
+    assert rt.update("a", 300, ts=2.0) == 100.0
+    # aynı örnek tekrar okunursa önceki hız döner, durum bozulmaz
+    assert rt.update("a", 300, ts=2.0) == 100.0
+    assert rt.update("a", 400, ts=3.0) == 100.0
+
+
+def test_32bit_wrap_and_reset():
+    rt = RateTracker()
+    top = (1 << 32) - 100
+    rt.update("nic", top, ts=0.0)
+    assert rt.update("nic", 100, ts=1.0) == 200.0
+    assert rt.wraps == 1
+    # ortadan düşüş taşma değil sıfırlama: hız None, yeni taban
+    rt.update("disk", 5000, ts=0.0)
+    assert rt.update("disk", 10, ts=1.0) is None
+    assert rt.resets == 1
+    assert rt.update("disk", 20, ts=2.0) == 10.0
+
+
+def test_halflife_smoothing():
+    rt = RateTracker(halflife=1.0)
+    rt.update("x", 0, ts=0.0)
+    assert rt.update("x", 100, ts=1.0) == 100.0
+    assert rt.update("x", 100, ts=2.0) == pytest.approx(50.0)
+    with pytest.raises(ValueError):
+        RateTracker(halflife=0)
+
+
+def test_bounded_series():
+    rt = RateTracker(max_series=2)
+    for k in "abc":
+        rt.update(k, 1, ts=0.0)
+    assert len(rt) == 2 and rt.rate("a") is None
+
+
+def test_forget_prefixes_drops_exited_processes():
+    rt = RateTracker()
+    for pid in (1, 2):
+        for f in ("read_bytes", "write_bytes"):
+            rt.update(("proc", pid, 10.0, f), 0, ts=0.0)
+    rt.update(("net", "eth0", "bytes_recv"), 0, ts=0.0)
+    assert rt.forget_prefixes([("proc", 1, 10.0)]) == 2
+    assert len(rt) == 3
+    assert rt.forget_prefixes([]) == 0
+
+
+def test_follow_processes_prunes_on_delta():
+    from bridge import clean
+
+    class _Snap:
+        delta = ProcessDelta(removed={(4242, 1.5)})
+
+    key = ("proc", 4242, 1.5, "read_bytes")
+    clean.rate_tracker.update(key, 0, ts=0.0)
+    clean._prune_process_rates(_Snap())
+    assert clean.rate_tracker.rate(key) is None
+    assert key not in clean.rate_tracker._series
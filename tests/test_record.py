@@ -0,0 +1,104 @@
+# test_record.py
+import os
+import random
+
+import psutil
+import pytest
+
+from engine import record
+from engine.record import Player, Recorder, RecordingLog, ReplayReader, call_key
+
+KEY = call_key("processes", "read", (["pid", "name", "cpu_percent"],), {})
+
+
+def _rows(tick, rnd):
+    # birkaç satır her tikte değişir, çoğu aynı kalır
+    return [{"pid": pid, "name": f"p{pid}", "cpu_percent": float(rnd.randint(0, 3) if pid % 4 == tick % 4 else 0)}
+            for pid in range(1, 30) if (pid + tick) % 11]
+
+
+def _record_ticks(path, n, seed=0):
+    rnd = random.Random(seed)
+    values = []
+    with Recorder(path) as rec:
+        for tick in range(n):
+            rows = _rows(tick, rnd)
+            values.append(rows)
+            rec.record("processes", "read", (["pid", "name", "cpu_percent"],), {}, rows, ts=float(tick))
+    return values
+
+
+def test_round_trip_shapes(tmp_path):
+    path = str(tmp_path / "a.rec")
+    vm = psutil.virtual_memory()
+    value = {"vm": vm, "t": (1, "x"), "d": {1: "a", (2, 3): b"\x00\xff"}, "none": None}
+    with Recorder(path) as rec:
+        assert rec.record("memory", "get_virtual", (), {}, vm, ts=1.0)
+        assert rec.record("system", "mixed", (), {}, value, ts=1.0)
+        assert not rec.record("system", "bad", (), {}, object(), ts=1.0)
+        assert rec.errors == 1
+    with RecordingLog(path) as log:
+        got = log.at(call_key("memory", "get_virtual", (), {}), 5.0)
+        assert got == vm and type(got) is type(vm)
+        assert log.at(call_key("system", "mixed", (), {}), 1.0) == value
+        with pytest.raises(LookupError):
+            log.at(call_key("system", "missing", (), {}), 1.0)
+
+
+def test_keyframes_and_deltas_random_access(tmp_path, monkeypatch):
+    monkeypatch.setattr(record, "KEYFRAME_EVERY", 4)
+    path = str(tmp_path / "rows.rec")
+    values = _record_ticks(path, 15)
+    with RecordingLog(path) as log:
+        order = list(range(15))
+        random.Random(1).shuffle(order)
+        for i in order + list(range(15)):
+            assert log.at(KEY, float(i)) == values[i]
+        assert log.series(KEY) == [float(i) for i in range(15)]
+
+
+def test_torn_tail_is_ignored_and_truncated_on_reopen(tmp_path):
+    path = str(tmp_path / "torn.rec")
+    values = _record_ticks(path, 5)
+    good = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(record._HEAD.pack(record.DATA, 0, 1, 9.0, 1000) + b"partial")
+    with RecordingLog(path) as log:
+        assert len(log) == 5 and log.valid_end == good
+        assert log.at(KEY, 4.0) == values[4]
+
+    rnd = random.Random(7)
+    extra = _rows(5, rnd)
+    with Recorder(path) as rec:
+        rec.record("processes", "read", (["pid", "name", "cpu_percent"],), {}, extra, ts=5.0)
+    with RecordingLog(path) as log:
+        assert len(log) == 6
+        assert log.at(KEY, 5.0) == extra
+        assert log.at(KEY, 2.0) == values[2]
+
+
+def test_missing_index_falls_back_to_scan(tmp_path):
+    path = str(tmp_path / "noidx.rec")
+    values = _record_ticks(path, 4)
+    os.remove(path + ".idx")
+    with RecordingLog(path) as log:
+        assert len(log) == 4 and log.at(KEY, 3.0) == values[3]
+
+
+def test_player_seek_and_step(tmp_path):
+    path = str(tmp_path / "play.rec")
+    with Recorder(path) as rec:
+        for ts, pct in ((10.0, 1.0), (11.0, 2.0), (12.0, 3.0)):
+            rec.record("cpu", "get_percent", (), {}, pct, ts=ts)
+            rec.record("memory", "get_percent", (), {}, pct * 10, ts=ts + 0.01)
+    player = Player.open(path, speed=0)
+    cpu = player.engine()["cpu"]
+    assert player.position() == 10.0 and cpu.get_percent() == 1.0
+    assert player.step() == 10.01
+    assert player.step() == 11.01 and cpu.get_percent() == 2.0
+    player.seek(11.5)
+    assert cpu.get_percent() == 2.0 and player.proxy("memory").get_percent() == 20.0
+    player.seek(100.0)
+    assert player.at_end and cpu.get_percent() == 3.0
+    assert ReplayReader(player).read_one(1, ["pid"]) is None
+    player.log.close()
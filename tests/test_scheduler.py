@@ -0,0 +1,28 @@
+# test_scheduler.py
+from engine.instrument import instruments
+from engine.scheduler import Sampler
+
+
+def _errors():
+    return instruments.stats("sampler.listener").get("sampler.listener", {}).get("error_count", 0)
+
+
+def test_listener_errors_are_counted_not_raised():
+    sampler = Sampler()
+    sampler.add("answer", lambda: 42, interval=60)
+    seen = []
+    sampler.add_listener(lambda name, s: {}[name])
+    sampler.add_listener(lambda name, s: seen.append((name, s.value)))
+    before = _errors()
+    sampler.run_pending()
+    assert seen == [("answer", 42)]
+    assert _errors() == before + 1
+    assert instruments.stats("sampler.listener")["sampler.listener"]["errors"]["KeyError"] >= 1
+
+
+def test_collector_error_is_kept_on_the_sample():
+    sampler = Sampler()
+    sampler.add("bad", lambda: 1 / 0, interval=60)
+    sampler.run_pending()
+    s = sampler.latest("bad")
+    assert s.value is None and isinstance(s.error, ZeroDivisionError)
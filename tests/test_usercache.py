@@ -0,0 +1,39 @@
+# test_usercache.py
+from engine.usercache import NameCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_expiry_and_unknown_ids():
+    clock = _Clock()
+    cache = NameCache(ttl=10.0, clock=clock)
+    calls = []
+
+    def resolve(i):
+        calls.append(i)
+        if i == 99:
+            raise KeyError(i)
+        return f"user{i}"
+
+    assert cache._lookup("u", 1, resolve) == "user1"
+    assert cache._lookup("u", 1, resolve) == "user1"
+    assert cache._lookup("u", 99, resolve) == "99"
+    assert cache._lookup("u", 99, resolve) == "99"
+    assert calls == [1, 99]
+    clock.now = 11.0
+    cache._lookup("u", 1, resolve)
+    assert calls == [1, 99, 1]
+
+
+def test_lru_bound():
+    cache = NameCache(maxsize=2)
+    for i in range(5):
+        cache._lookup("u", i, str)
+    st = cache.stats()
+    assert st["size"] == 2 and st["evictions"] == 3